@@ -1,6 +1,8 @@
 from Lexico.Lexico import Lexico
 from Semantico.Semantico import ejecutar_analisis_semantico
 from Sintactico.Sintactico import Sintactico
+from Sintactico.CacheSintactico import CacheSintactico
+from Sintactico.TablaSintactico import TablaSimbolos
 from tkinter import scrolledtext
 import tkinter as tk
 
@@ -11,6 +13,7 @@ class AigisCUI:
         self.root.geometry("1200x700")
         
         self.lexico = Lexico()
+        self.cache = CacheSintactico()
         self.codigo_original = ""  # Guardará el código antes de optimizar
         self.ast_optimizado = None
         self.optimizado = False  # Estado del botón optimizar/revertir
@@ -101,13 +104,11 @@ class AigisCUI:
 
         try:
            
-            tokens = self.lexico.tokenize(code)
-            parser = Sintactico(tokens)
-            ast = parser.analisis_sintactico()
+            ast, errores_sintacticos, tabla = self.analizar_sintaxis(code)
 
-            if parser.errores:
-                self.error_display.insert(tk.END, f"{len(parser.errores)} errores sintácticos:\n", 'error')
-                for err in parser.errores[:10]:
+            if errores_sintacticos:
+                self.error_display.insert(tk.END, f"{len(errores_sintacticos)} errores sintácticos:\n", 'error')
+                for err in errores_sintacticos[:10]:
                     self.error_display.insert(tk.END, f"-{err}\n", 'error')
             else:
                 self.error_display.insert(tk.END, "Análisis sintáctico exitoso\n\n", 'success')
@@ -115,7 +116,7 @@ class AigisCUI:
             
             errores_semanticos, ast_optimizado, tabla_semantica = ejecutar_analisis_semantico(
                 ast, 
-                parser.tabla,
+                tabla,
                 optimizar=True
             )
 
@@ -135,13 +136,30 @@ class AigisCUI:
             self.error_display.tag_config('error', foreground='red')
 
       
-            self.mostrar_tabla_semantica(tabla_semantica, parser.tabla)
+            self.mostrar_tabla_semantica(tabla_semantica, tabla)
 
         except Exception as e:
             self.error_display.insert(tk.END, f"\nERROR CRÍTICO: {str(e)}\n", 'error')
             import traceback
             self.error_display.insert(tk.END, traceback.format_exc(), 'error')
 
+    def analizar_sintaxis(self, code):
+        """Léxico + sintáctico, reutilizando el resultado en caché si el código no cambió"""
+        cacheado = self.cache.obtener(code)
+        if cacheado:
+            _, ast, errores, simbolos = cacheado
+            tabla = TablaSimbolos()
+            for simbolo in simbolos:
+                tabla.agregar(simbolo)
+            return ast, errores, tabla
+
+        tokens = self.lexico.tokenize(code)
+        parser = Sintactico(tokens)
+        ast = parser.analisis_sintactico()
+        # Se guarda antes del semántico, que puede modificar el AST al optimizar
+        self.cache.guardar(code, tokens, ast, parser.errores, parser.tabla.listar())
+        return ast, parser.errores, parser.tabla
+
     def mostrar_tabla_semantica(self, tabla_semantica, tabla_sintactico):
         """Muestra la tabla de símbolos semántica"""
         self.symbol_display.insert(tk.END, "TABLA DE SÍMBOLOS\n", 'header')
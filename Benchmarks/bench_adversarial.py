@@ -0,0 +1,56 @@
+"""Benchmark del analizador léxico con entradas adversarias.
+
+Para cada caso mide el tiempo con tamaños n, 2n y 4n; si el escaneo es lineal
+el cociente t(4n)/t(n) debe quedar cerca de 4.
+
+Uso: python -m Benchmarks.bench_adversarial [--lineas N]
+"""
+import argparse
+import io
+import time
+
+from Lexico.Lexico import Lexico, MOTORES
+
+LINEA = "int a = 1; // sigue\n"
+
+# Generadores de código adversario: reciben n y retornan el texto
+CASOS = {
+    "comentario sin cerrar": lambda n: "///" + LINEA * n,
+    "cadena sin cerrar": lambda n: '"' + LINEA * n,
+    "cadena con escapes": lambda n: '"' + 'a\\" ' * n,
+    "aperturas /// en cada linea": lambda n: "///x\n" * n,
+    "comillas y barras": lambda n: '"\\' * n,
+    "numeros pegados": lambda n: "1" * n + "a",
+}
+
+
+def medir(funcion, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lineas", type=int, default=20000, help="tamaño base n de cada caso")
+    args = parser.parse_args()
+
+    lexicos = {motor: Lexico(motor) for motor in MOTORES}
+    tamanos = (args.lineas, args.lineas * 2, args.lineas * 4)
+    print(f"{'caso':<28} {'modo':<10} " + " ".join(f"{'n=' + str(n):>12}" for n in tamanos) + "  t(4n)/t(n)")
+
+    for nombre, generar in CASOS.items():
+        codigos = [generar(n) for n in tamanos]
+        modos = [(motor, lambda code, lexico=lexico: lexico.tokenize(code)) for motor, lexico in lexicos.items()]
+        modos.append(("flujo", lambda code: sum(1 for _ in lexicos["regex"].tokenize_stream(io.StringIO(code), 4096))))
+        for modo, tokenizar in modos:
+            tiempos = [medir(lambda code=code: tokenizar(code)) for code in codigos]
+            columnas = " ".join(f"{t * 1000:>10.1f}ms" for t in tiempos)
+            print(f"{nombre:<28} {modo:<10} {columnas}  {tiempos[2] / max(tiempos[0], 1e-9):>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
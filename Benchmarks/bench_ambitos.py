@@ -0,0 +1,78 @@
+"""Benchmark de ámbitos: resolución de identificadores en código muy anidado.
+
+Uso: python -m Benchmarks.bench_ambitos [--profundidades N ...] [--busquedas N]
+
+Para cada profundidad se analiza un programa de while anidados que leen una
+variable global (`programa_ambitos`) y se mide el análisis completo. Luego,
+sobre la tabla resultante, se resuelve la variable desde el ámbito más
+interno con el árbol de ámbitos (`TablaSemantica.resolver`, que sube por los
+padres) y con el método anterior, que armaba con `".".join` la ruta de cada
+prefijo de la pila de ámbitos, dos veces por uso.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Objetos import Bitacora
+from Semantico.Semantico import AnalizadorSemantico
+from Sintactico.SintacticoIterativo import SintacticoIterativo
+from Benchmarks.programas import programa_ambitos
+
+
+def buscar_por_rutas(tabla, identificador, pila_ambitos):
+    """Búsqueda anterior: verificar la declaración y luego buscar, armando la ruta de cada prefijo"""
+    declarado = False
+    for i in range(len(pila_ambitos) - 1, -1, -1):
+        if tabla.buscar(identificador, ".".join(pila_ambitos[:i + 1])):
+            declarado = True
+            break
+    if not declarado:
+        return None
+    for i in range(len(pila_ambitos), 0, -1):
+        simbolo = tabla.buscar(identificador, ".".join(pila_ambitos[:i]))
+        if simbolo:
+            return simbolo
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profundidades", type=int, nargs="+", default=[50, 100, 150])
+    parser.add_argument("--busquedas", type=int, default=2000)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    Bitacora.configurar()
+    try:
+        for profundidad in args.profundidades:
+            with contextlib.redirect_stdout(io.StringIO()):
+                sintactico = SintacticoIterativo(lexico.tokenize(programa_ambitos(profundidad)))
+                ast = sintactico.analisis_sintactico()
+            analizador = AnalizadorSemantico(ast, sintactico.tabla)
+            inicio = time.perf_counter()
+            analizador.analizar()
+            t_analisis = time.perf_counter() - inicio
+
+            tabla = analizador.tabla_semantica
+            interno = max(tabla.lista_ambitos, key=lambda ambito: ambito.nombre.count("."))
+            pila = interno.nombre.split(".")
+
+            inicio = time.perf_counter()
+            for _ in range(args.busquedas):
+                tabla.resolver("x", interno)
+            t_arbol = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            for _ in range(args.busquedas):
+                buscar_por_rutas(tabla, "x", pila)
+            t_rutas = time.perf_counter() - inicio
+
+            print(f"{profundidad:>4} niveles  análisis {t_analisis * 1000:7.1f} ms  resolver desde el más interno: "
+                  f"árbol {t_arbol * 1e6 / args.busquedas:7.1f} µs, rutas {t_rutas * 1e6 / args.busquedas:7.1f} µs")
+    finally:
+        Bitacora.configurar(Bitacora.SalidaTexto())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark de anidamiento profundo: parser recursivo vs. parser iterativo.
+
+Uso: python -m Benchmarks.bench_anidamiento [--profundidades N ...] [--repeticiones N]
+
+El parser recursivo se corre con el límite de recursión por defecto, así que
+falla con RecursionError a partir de unos cientos de niveles; el iterativo usa
+una pila explícita y no tiene ese límite.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Sintactico.Sintactico import Sintactico
+from Sintactico.SintacticoIterativo import SintacticoIterativo
+from Benchmarks.programas import programa_anidado, programa_parentesis
+
+PARSERS = {"recursivo": Sintactico, "iterativo": SintacticoIterativo}
+
+
+def medir(tokens, clase, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser = clase(tokens)
+            inicio = time.perf_counter()
+            try:
+                parser.analisis_sintactico()
+            except RecursionError:
+                return None
+            mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profundidades", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    for nombre, generador in (("bloques", programa_anidado), ("paréntesis", programa_parentesis)):
+        print(f"--- {nombre} anidados ---")
+        for profundidad in args.profundidades:
+            tokens = lexico.tokenize(generador(profundidad))
+            columnas = []
+            for clase_nombre, clase in PARSERS.items():
+                segundos = medir(tokens, clase, args.repeticiones)
+                texto = "RecursionError" if segundos is None else f"{segundos * 1000:.1f} ms"
+                columnas.append(f"{clase_nombre}: {texto:>14}")
+            print(f"{profundidad:>7} niveles  " + "  ".join(columnas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark de la bitácora: análisis semántico con distintas salidas y niveles.
+
+Uso: python -m Benchmarks.bench_bitacora [--bloques N ...]
+
+Se mide `AnalizadorSemantico.analizar` sobre el mismo AST con la bitácora en
+silencio, en el nivel por defecto (INFO), en DEPURACION a texto (lo que antes
+se imprimía siempre) y en DEPURACION a eventos JSON. El texto y los eventos van
+a os.devnull. También se mide el costo de un llamado a una bitácora apagada,
+directo y preguntando antes con `habilitada`.
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from Lexico.Lexico import Lexico
+from Objetos import Bitacora
+from Semantico.Semantico import AnalizadorSemantico
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    with open(os.devnull, "w", encoding="utf-8") as nulo:
+        configuraciones = {
+            "silencio": (),
+            "info": (Bitacora.SalidaTexto(Bitacora.INFO, nulo),),
+            "depuracion texto": (Bitacora.SalidaTexto(Bitacora.DEPURACION, nulo),),
+            "depuracion eventos": (Bitacora.SalidaEventos(nulo),),
+        }
+        try:
+            for bloques in args.bloques:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sintactico = Sintactico(lexico.tokenize(programa_sintetico(bloques)))
+                    ast = sintactico.analisis_sintactico()
+                columnas = []
+                for nombre, salidas in configuraciones.items():
+                    Bitacora.configurar(*salidas)
+                    inicio = time.perf_counter()
+                    AnalizadorSemantico(ast, sintactico.tabla).analizar()
+                    columnas.append(f"{nombre}: {(time.perf_counter() - inicio) * 1000:8.1f} ms")
+                print(f"{bloques:>5} bloques  " + "  ".join(columnas))
+
+            Bitacora.configurar()
+            bitacora = Bitacora.Bitacora("Benchmark")
+            llamados = 1_000_000
+            inicio = time.perf_counter()
+            for n in range(llamados):
+                bitacora.depuracion("evento", "Mensaje {n}", n=n)
+            t_llamado = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            for n in range(llamados):
+                if bitacora.habilitada(Bitacora.DEPURACION):
+                    bitacora.depuracion("evento", "Mensaje {n}", n=n)
+            t_guarda = time.perf_counter() - inicio
+            print(f"bitácora apagada: llamado {t_llamado * 1e9 / llamados:.0f} ns, "
+                  f"con `habilitada` antes {t_guarda * 1e9 / llamados:.0f} ns")
+        finally:
+            Bitacora.configurar(Bitacora.SalidaTexto())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark de compilación por lotes: muchas unidades pequeñas en un mismo proceso.
+
+Uso: python -m Benchmarks.bench_compilacion_lote [--unidades N] [--bloques N ...] [--almacen archivo|sqlite]
+
+Cada unidad es un programa de `--bloques` bloques que se tokeniza y parsea con
+su propia tabla de símbolos. Se mide el tiempo por unidad y el de crear una
+tabla sola, y al final cuántos archivos temporales se crearon y cuántos hooks
+de atexit quedaron registrados: las tablas que no bajan símbolos no crean
+archivo, y las que sí lo reutilizan de los almacenes libres.
+"""
+import argparse
+import atexit
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Sintactico import AlmacenSimbolos
+from Sintactico.Sintactico import Sintactico
+from Sintactico.TablaSintactico import TablaSimbolos
+from Benchmarks.programas import programa_sintetico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--unidades", type=int, default=2000)
+    parser.add_argument("--bloques", type=int, nargs="+", default=[1, 5])
+    parser.add_argument("--almacen", choices=list(AlmacenSimbolos.ALMACENES), default="archivo")
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    hooks_iniciales = atexit._ncallbacks()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        for _ in range(args.unidades):
+            TablaSimbolos(almacen=args.almacen)
+        t_tabla = time.perf_counter() - inicio
+    print(f"crear TablaSimbolos: {t_tabla * 1e6 / args.unidades:7.1f} µs")
+
+    for bloques in args.bloques:
+        codigo = programa_sintetico(bloques)
+        simbolos = archivos = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            for _ in range(args.unidades):
+                unidad = Sintactico(lexico.tokenize(codigo))
+                unidad.analisis_sintactico()
+                simbolos = len(unidad.tabla.listar())
+                archivos = max(archivos, len(AlmacenSimbolos._abiertos))
+            segundos = time.perf_counter() - inicio
+        print(f"{bloques:>4} bloques ({simbolos} símbolos)  {segundos * 1e6 / args.unidades:8.1f} µs/unidad  "
+              f"archivos temporales: {archivos}  hooks atexit nuevos: {atexit._ncallbacks() - hooks_iniciales}")
+
+
+if __name__ == "__main__":
+    main()
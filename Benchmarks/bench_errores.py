@@ -0,0 +1,51 @@
+"""Benchmark de recuperación de errores: tiempo y errores reportados con código mal formado.
+
+Uso: python -m Benchmarks.bench_errores [--lineas N ...] [--max-errores N] [--repeticiones N]
+
+Cada programa son líneas de instrucciones casi todas rotas. Sin límite el parser
+recorre todo el archivo (el tiempo por token debe mantenerse constante) y el
+modo pánico reporta a lo sumo un error por instrucción; con límite el análisis
+se detiene al llegar al máximo de errores. Se parsea sin tabla de símbolos para
+medir solo el parser (las búsquedas en el archivo auxiliar de la tabla dominarían).
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Sintactico.Sintactico import Sintactico, MAX_ERRORES
+from Benchmarks.programas import programa_basura
+
+
+def medir(tokens, max_errores, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser = Sintactico(tokens, con_tabla=False, max_errores=max_errores)
+            inicio = time.perf_counter()
+            parser.analisis_sintactico()
+            mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, len(parser.errores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lineas", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--max-errores", type=int, default=MAX_ERRORES)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    for lineas in args.lineas:
+        tokens = lexico.tokenize(programa_basura(lineas))
+        columnas = []
+        for nombre, limite in (("sin límite", len(tokens) + 1), (f"máximo {args.max_errores}", args.max_errores)):
+            segundos, errores = medir(tokens, limite, args.repeticiones)
+            columnas.append(f"{nombre}: {segundos * 1000:8.1f} ms "
+                            f"({segundos * 1e6 / len(tokens):.2f} µs/token, {errores} errores)")
+        print(f"{lineas:>6} líneas {len(tokens):>7} tokens  " + "  ".join(columnas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark de exportación del AST a JSON: to_dict + json.dumps contra exportar_json.
+
+Uso: python -m Benchmarks.bench_exportacion_ast [--bloques N ...] [--sangria N]
+
+Se escribe el mismo árbol a un archivo temporal con cada método y se mide el
+tiempo (sin trazar) y el pico de memoria (con tracemalloc en una segunda pasada).
+También se mide `repr` del árbol, que está acotado.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from Lexico.Lexico import Lexico
+from Objetos.ExportadorAST import exportar_json
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+
+def con_dumps(ast, archivo, sangria):
+    archivo.write(json.dumps(ast.to_dict(), indent=sangria))
+
+
+METODOS = {"json.dumps": con_dumps, "exportar_json": exportar_json}
+
+
+def medir(metodo, ast, ruta, sangria):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        inicio = time.perf_counter()
+        metodo(ast, archivo, sangria)
+        segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        metodo(ast, archivo, sangria)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return segundos, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--sangria", type=int, default=2)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    descriptor, ruta = tempfile.mkstemp(suffix=".json")
+    os.close(descriptor)
+    try:
+        for bloques in args.bloques:
+            with contextlib.redirect_stdout(io.StringIO()):
+                ast = Sintactico(lexico.tokenize(programa_sintetico(bloques)), con_tabla=False).analisis_sintactico()
+            columnas = []
+            for nombre, metodo in METODOS.items():
+                segundos, pico = medir(metodo, ast, ruta, args.sangria)
+                columnas.append(f"{nombre}: {segundos * 1000:8.1f} ms, pico {pico / 2**20:7.2f} MiB")
+            inicio = time.perf_counter()
+            repr(ast)
+            columnas.append(f"repr: {(time.perf_counter() - inicio) * 1000:.2f} ms")
+            print(f"{bloques:>5} bloques ({os.path.getsize(ruta) / 2**20:6.1f} MiB)  " + "  ".join(columnas))
+    finally:
+        os.unlink(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark del parser de expresiones: ascenso de precedencias vs. descenso por niveles.
+
+Uso: python -m Benchmarks.bench_expresiones [--lineas N] [--operandos N] [--repeticiones N]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Sintactico.Sintactico import Sintactico, MOTORES_EXPRESIONES
+from Benchmarks.programas import programa_expresiones
+
+
+def medir(tokens, motor, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        with contextlib.redirect_stdout(io.StringIO()):
+            parser = Sintactico(tokens, motor_expresiones=motor)
+            inicio = time.perf_counter()
+            parser.analisis_sintactico()
+            mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lineas", type=int, default=5000)
+    parser.add_argument("--operandos", type=int, default=12)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    tokens = Lexico().tokenize(programa_expresiones(args.lineas, args.operandos))
+    print(f"{len(tokens)} tokens, {args.lineas} expresiones de {args.operandos} operandos")
+    tiempos = {motor: medir(tokens, motor, args.repeticiones) for motor in MOTORES_EXPRESIONES}
+    base = tiempos["descendente"]
+    for motor, segundos in tiempos.items():
+        print(f"{motor:>12}: {segundos * 1000:>9.1f} ms  x{base / segundos:.2f}")
+
+
+if __name__ == "__main__":
+    main()
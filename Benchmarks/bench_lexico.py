@@ -0,0 +1,43 @@
+"""Benchmark de rendimiento del analizador léxico (tokens por segundo).
+
+Uso: python -m Benchmarks.bench_lexico [--bloques N] [--repeticiones N] [archivo]
+"""
+import argparse
+import time
+
+from Lexico.Lexico import Lexico, MOTORES
+from Benchmarks.programas import programa_sintetico
+
+
+def medir(lexico, code, repeticiones):
+    """Retorna (tokens, mejor tiempo en segundos) de `repeticiones` corridas"""
+    mejor = float("inf")
+    tokens = 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        tokens = len(lexico.tokenize(code))
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return tokens, mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("archivo", nargs="?", help="código fuente a tokenizar (por defecto uno sintético)")
+    parser.add_argument("--bloques", type=int, default=2000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.archivo:
+        with open(args.archivo, encoding="utf-8") as archivo:
+            code = archivo.read()
+    else:
+        code = programa_sintetico(args.bloques)
+
+    print(f"Código: {len(code)} caracteres")
+    for motor in MOTORES:
+        tokens, segundos = medir(Lexico(motor), code, args.repeticiones)
+        print(f"{motor:>10}: {tokens} tokens en {segundos * 1000:.1f} ms -> {tokens / segundos:,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark de memoria del AST: Nodo con __dict__, Nodo con __slots__ y ArenaAST.
+
+Uso: python -m Benchmarks.bench_memoria_ast [--bloques N ...]
+
+Se parsea el programa sintético una vez y el mismo árbol se copia a cada
+representación midiendo con tracemalloc los bytes que quedan reservados. Los
+valores (cadenas) son los del parser en los tres casos, así que se compara solo
+la estructura del árbol.
+"""
+import argparse
+import contextlib
+import io
+import tracemalloc
+
+from Lexico.Lexico import Lexico
+from Objetos.ArenaAST import ArenaAST
+from Objetos.Nodo import Nodo
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+
+class NodoConDict:
+    """Nodo como era antes de __slots__: atributos en un __dict__ por instancia"""
+
+    def __init__(self, tipo, valor=None, hijos=None):
+        self.tipo = tipo
+        self.valor = valor
+        self.hijos = hijos or []
+
+
+def copiar(raiz, fabrica):
+    """Copia el árbol con `fabrica(tipo, valor)` sin recursión"""
+    copia = fabrica(raiz.tipo, raiz.valor)
+    pila = [(raiz, copia)]
+    while pila:
+        original, nuevo = pila.pop()
+        for hijo in original.hijos:
+            if hijo is None:
+                nuevo.hijos.append(None)
+                continue
+            copia_hijo = fabrica(hijo.tipo, hijo.valor)
+            nuevo.hijos.append(copia_hijo)
+            pila.append((hijo, copia_hijo))
+    return copia
+
+
+def contar(raiz):
+    total, pila = 0, [raiz]
+    while pila:
+        nodo = pila.pop()
+        total += 1
+        pila.extend(h for h in nodo.hijos if h is not None)
+    return total
+
+
+def medir(construir):
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = construir()
+    bytes_usados = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    del resultado
+    return bytes_usados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    representaciones = {
+        "__dict__": lambda ast: copiar(ast, NodoConDict),
+        "__slots__": lambda ast: copiar(ast, Nodo),
+        "arena": lambda ast: ArenaAST.desde_nodo(ast),
+    }
+    lexico = Lexico()
+    for bloques in args.bloques:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ast = Sintactico(lexico.tokenize(programa_sintetico(bloques)), con_tabla=False).analisis_sintactico()
+        nodos = contar(ast)
+        columnas = []
+        for nombre, construir in representaciones.items():
+            bytes_usados = medir(lambda: construir(ast))
+            columnas.append(f"{nombre}: {bytes_usados / 2**20:7.2f} MiB ({bytes_usados / nodos:5.1f} B/nodo)")
+        print(f"{bloques:>5} bloques {nodos:>8} nodos  " + "  ".join(columnas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark del léxico en paralelo: aceleración según la cantidad de procesos.
+
+Uso: python -m Benchmarks.bench_paralelo [--bloques N] [--motor regex|despacho] [--procesos 1,2,4,...]
+"""
+import argparse
+import os
+import time
+
+from Lexico.Lexico import Lexico, MOTORES
+from Benchmarks.programas import programa_sintetico
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, default=20000)
+    parser.add_argument("--motor", choices=MOTORES, default="regex")
+    parser.add_argument("--procesos", help="lista separada por comas (por defecto potencias de 2 hasta los núcleos disponibles)")
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    if args.procesos:
+        cantidades = [int(p) for p in args.procesos.split(",")]
+    else:
+        cantidades = sorted({2 ** k for k in range(nucleos.bit_length()) if 2 ** k <= nucleos} | {nucleos})
+
+    lexico = Lexico(args.motor)
+    code = programa_sintetico(args.bloques)
+    serie, t_serie = cronometrar(lambda: lexico.tokenize(code))
+    firma = [(t.tipo, t.inicio, t.linea, t.columna) for t in serie]
+    print(f"Código: {len(code)} caracteres, {len(serie)} tokens, {nucleos} núcleos")
+    print(f"{'serie':>10}: {t_serie * 1000:>9.1f} ms")
+
+    for procesos in cantidades:
+        tokens, segundos = cronometrar(lambda: lexico.tokenize_paralelo(code, procesos, min_paralelo=0))
+        igual = [(t.tipo, t.inicio, t.linea, t.columna) for t in tokens] == firma
+        print(f"{procesos:>7} p.: {segundos * 1000:>9.1f} ms  x{t_serie / segundos:.2f}{'' if igual else '  (DIFERENTE)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark de análisis semántico en ASTs profundos: analizador recursivo vs. iterativo.
+
+Uso: python -m Benchmarks.bench_semantico_profundo [--profundidades N ...] [--repeticiones N]
+
+Se analizan una suma de N operandos (que el parser anida hacia la
+izquierda), N paréntesis anidados y N bloques if/while anidados. Los ASTs se
+arman con `SintacticoIterativo`. El analizador recursivo corre con el límite de
+recursión por defecto, así que falla con RecursionError a partir de unos
+cientos de niveles; el iterativo usa una pila explícita. Cuando los dos
+terminan se comprueba que dan los mismos errores y advertencias.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Objetos import Bitacora
+from Semantico.Semantico import AnalizadorSemantico
+from Semantico.SemanticoIterativo import AnalizadorSemanticoIterativo
+from Sintactico.SintacticoIterativo import SintacticoIterativo
+from Benchmarks.programas import programa_anidado, programa_parentesis
+
+ANALIZADORES = {"recursivo": AnalizadorSemantico, "iterativo": AnalizadorSemanticoIterativo}
+PROGRAMAS = {
+    "expresión": lambda n: "int x = 0;\nint y = " + " + ".join(["x"] * n) + ";\n",
+    "paréntesis": lambda n: "int x = 0;\n" + programa_parentesis(n),
+    "bloques": programa_anidado,
+}
+
+
+def medir(ast, tabla, clase, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        analizador = clase(ast, tabla)
+        inicio = time.perf_counter()
+        try:
+            analizador.analizar()
+        except RecursionError:
+            return None, None
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, (analizador.errores.obtener_errores(), analizador.errores.obtener_advertencias())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profundidades", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    Bitacora.configurar()
+    try:
+        for nombre, generador in PROGRAMAS.items():
+            print(f"--- {nombre} ---")
+            for profundidad in args.profundidades:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sintactico = SintacticoIterativo(lexico.tokenize(generador(profundidad)))
+                    ast = sintactico.analisis_sintactico()
+                columnas = []
+                diagnosticos = []
+                for clase_nombre, clase in ANALIZADORES.items():
+                    segundos, resultado = medir(ast, sintactico.tabla, clase, args.repeticiones)
+                    texto = "RecursionError" if segundos is None else f"{segundos * 1000:.1f} ms"
+                    columnas.append(f"{clase_nombre}: {texto:>14}")
+                    if resultado is not None:
+                        diagnosticos.append(resultado)
+                if len(diagnosticos) == 2:
+                    assert diagnosticos[0] == diagnosticos[1], "los analizadores dieron diagnósticos distintos"
+                print(f"{profundidad:>7} niveles  " + "  ".join(columnas)
+                      + f"  errores: {len(diagnosticos[-1][0])}")
+    finally:
+        Bitacora.configurar(Bitacora.SalidaTexto())
+
+
+if __name__ == "__main__":
+    main()
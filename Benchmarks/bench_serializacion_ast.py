@@ -0,0 +1,61 @@
+"""Benchmark de serialización del AST: JSON (to_dict), pickle y SerializadorAST.
+
+Uso: python -m Benchmarks.bench_serializacion_ast [--bloques N ...] [--repeticiones N]
+
+Para cada formato se mide el tamaño y los tiempos de guardar y cargar el árbol
+completo (cargar el JSON solo arma diccionarios, no `Nodo`); para el binario
+también se mide cargar una sola función con `ASTSerializado.buscar` sin
+reconstruir el resto.
+"""
+import argparse
+import contextlib
+import io
+import json
+import pickle
+import time
+
+from Lexico.Lexico import Lexico
+from Objetos.SerializadorAST import serializar, deserializar, ASTSerializado
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+FORMATOS = {
+    "json": (lambda ast: json.dumps(ast.to_dict()).encode(), json.loads),
+    "pickle": (lambda ast: pickle.dumps(ast, pickle.HIGHEST_PROTOCOL), pickle.loads),
+    "binario": (serializar, deserializar),
+}
+
+
+def medir(funcion, argumento, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(argumento)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    for bloques in args.bloques:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ast = Sintactico(lexico.tokenize(programa_sintetico(bloques)), con_tabla=False).analisis_sintactico()
+        print(f"--- {bloques} bloques ---")
+        for nombre, (guardar, cargar) in FORMATOS.items():
+            t_guardar, datos = medir(guardar, ast, args.repeticiones)
+            t_cargar, _ = medir(cargar, datos, args.repeticiones)
+            print(f"{nombre:>8}: {len(datos) / 1024:9.1f} KiB  guardar {t_guardar * 1000:8.1f} ms  "
+                  f"cargar {t_cargar * 1000:8.1f} ms")
+        datos = serializar(ast)
+        funcion = f"suma{bloques // 2}"
+        t_una, _ = medir(lambda d: ASTSerializado(d).buscar("FuncionDeclarada", funcion), datos, args.repeticiones)
+        print(f"{'binario':>8}: cargar solo {funcion}: {t_una * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark del parser en paralelo: aceleración según la cantidad de procesos.
+
+Uso: python -m Benchmarks.bench_sintactico_paralelo [--bloques N] [--procesos 1,2,4,...]
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from Lexico.Lexico import Lexico
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+
+def parsear(tokens, procesos):
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser = Sintactico(tokens)
+        inicio = time.perf_counter()
+        if procesos:
+            parser.analisis_paralelo(procesos, min_paralelo=0)
+        else:
+            parser.analisis_sintactico()
+        segundos = time.perf_counter() - inicio
+        firma = (parser.ast.to_dict(), parser.errores, [s.get("identificador") for s in parser.tabla.listar()])
+    return firma, segundos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, default=100)
+    parser.add_argument("--procesos", help="lista separada por comas (por defecto potencias de 2 hasta los núcleos disponibles)")
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    if args.procesos:
+        cantidades = [int(p) for p in args.procesos.split(",")]
+    else:
+        cantidades = sorted({2 ** k for k in range(nucleos.bit_length()) if 2 ** k <= nucleos} | {nucleos, 2})
+
+    tokens = Lexico().tokenize(programa_sintetico(args.bloques))
+    firma, t_serie = parsear(tokens, None)
+    print(f"{len(tokens)} tokens, {args.bloques * 2} funciones/bucles de nivel superior, {nucleos} núcleos")
+    print(f"{'serie':>10}: {t_serie * 1000:>9.1f} ms")
+
+    for procesos in cantidades:
+        resultado, segundos = parsear(tokens, procesos)
+        igual = resultado == firma
+        print(f"{procesos:>7} p.: {segundos * 1000:>9.1f} ms  x{t_serie / segundos:.2f}{'' if igual else '  (DIFERENTE)'}")
+
+
+if __name__ == "__main__":
+    main()
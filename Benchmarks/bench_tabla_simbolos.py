@@ -0,0 +1,95 @@
+"""Benchmark de la tabla de símbolos con archivo auxiliar: agregar y buscar muchos símbolos.
+
+Uso: python -m Benchmarks.bench_tabla_simbolos [--simbolos N ...] [--limite BYTES] [--busquedas N]
+                                                [--calientes N] [--consultas N] [--almacen archivo|sqlite ...]
+
+Con el límite de memoria por defecto (4096 bytes, unos pocos símbolos) casi
+todos terminan en el archivo; con un límite grande (p. ej. `--limite 1000000000`)
+quedan todos en memoria. En los dos casos el tiempo por símbolo al agregar y el
+de cada búsqueda deben mantenerse constantes al crecer la tabla. Las búsquedas
+se reparten entre `--calientes` símbolos (todos si no se indica): si caben en
+memoria, después de la primera búsqueda de cada uno el resto son aciertos.
+Se mide cada almacén pedido; "consultar" es una consulta por línea que devuelve
+un símbolo, y "recorrer" compara el tiempo y el pico de memoria (tracemalloc)
+de recorrer toda la tabla con `iterar` y con `listar`.
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+import tracemalloc
+
+from Sintactico.AlmacenSimbolos import ALMACENES
+from Sintactico.TablaSintactico import TablaSimbolos
+
+
+def simbolo(n):
+    return {
+        "identificador": f"variable_{n}",
+        "categoria": "variable",
+        "tipo_dato": "int",
+        "ambito": "global",
+        "direccion_memoria": None,
+        "linea": n + 1,
+        "valor": str(n),
+        "estado": "declarado",
+        "estructura": None,
+        "referencias": 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--simbolos", type=int, nargs="+", default=[10000, 30000, 100000])
+    parser.add_argument("--limite", type=int, default=4096)
+    parser.add_argument("--calientes", type=int)
+    parser.add_argument("--consultas", type=int, default=50)
+    parser.add_argument("--busquedas", type=int, default=1000)
+    parser.add_argument("--almacen", nargs="+", choices=list(ALMACENES), default=list(ALMACENES))
+    args = parser.parse_args()
+
+    for almacen, cantidad in ((a, c) for a in args.almacen for c in args.simbolos):
+        aleatorio = random.Random(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            tabla = TablaSimbolos(args.limite, almacen)
+            inicio = time.perf_counter()
+            for n in range(cantidad):
+                tabla.agregar(simbolo(n))
+            t_agregar = time.perf_counter() - inicio
+
+            calientes = aleatorio.sample(range(cantidad), min(args.calientes or cantidad, cantidad))
+            nombres = [f"variable_{aleatorio.choice(calientes)}" for _ in range(args.busquedas)]
+            inicio = time.perf_counter()
+            for nombre in nombres:
+                tabla.buscar(nombre)
+            t_buscar = time.perf_counter() - inicio
+
+            lineas = [aleatorio.randrange(1, cantidad + 1) for _ in range(args.consultas)]
+            inicio = time.perf_counter()
+            for linea in lineas:
+                tabla.consultar(linea=linea)
+            t_consultar = time.perf_counter() - inicio
+            recorridos = []
+            for recorrer in (tabla.iterar, tabla.listar):
+                inicio = time.perf_counter()
+                for _ in recorrer():
+                    pass
+                segundos = time.perf_counter() - inicio
+                tracemalloc.start()
+                for _ in recorrer():
+                    pass
+                recorridos.append(f"{recorrer.__name__} {segundos * 1000:.0f} ms / "
+                                  f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f} MiB")
+                tracemalloc.stop()
+            en_archivo = tabla.simbolos_en_archivo
+            tasa = tabla.obtener_estadisticas()["tasa_aciertos"]
+            tabla.cerrar()
+        print(f"{almacen:>7} {cantidad:>7} símbolos ({en_archivo} en archivo)  agregar: {t_agregar:7.2f} s "
+              f"({t_agregar * 1e6 / cantidad:6.1f} µs/símbolo)  buscar: {t_buscar * 1e6 / args.busquedas:7.1f} µs  "
+              f"({tasa:5.1f}% aciertos)  consultar: {t_consultar * 1e6 / args.consultas:9.1f} µs  "
+              f"recorrer: {', '.join(recorridos)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark del Visitante: costo de despacho por nodo contra recorridos con cierres y cadenas if/elif.
+
+Uso: python -m Benchmarks.bench_visitante [--bloques N ...] [--profundidad N]
+
+Sobre el AST de un programa sintético se mide, en ns por nodo:
+- recorrer: una función recursiva que llama a un cierre por nodo (como hacían
+  las pasadas del optimizador) contra `Visitante.recorrer` con un método
+  `entrar_Operacion`;
+- despachar: una cadena if/elif de comparaciones de tipo (como la que tenía
+  el analizador semántico) contra `Visitante.despachar`.
+Al final se recorre una cadena de `--profundidad` nodos anidados, que con la
+versión recursiva pasa el límite de recursión.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Lexico.Lexico import Lexico
+from Objetos.Nodo import Nodo
+from Objetos.Visitante import Visitante
+from Sintactico.Sintactico import Sintactico
+from Benchmarks.programas import programa_sintetico
+
+
+def recorrer_recursivo(nodo, fn):
+    nueva = fn(nodo)
+    if nueva is not None:
+        nodo = nueva
+    if hasattr(nodo, 'hijos') and nodo.hijos:
+        nodo.hijos = [recorrer_recursivo(h, fn) for h in nodo.hijos]
+    return nodo
+
+
+def contar_operaciones_cierre(ast):
+    cuenta = [0]
+
+    def fn(n):
+        if getattr(n, "tipo", None) == "Operacion":
+            cuenta[0] += 1
+        return None
+    recorrer_recursivo(ast, fn)
+    return cuenta[0]
+
+
+class ContarOperaciones(Visitante):
+    def __init__(self):
+        self.cuenta = 0
+
+    def entrar_Operacion(self, nodo):
+        self.cuenta += 1
+
+
+def despachar_cadena(nodo):
+    tipo = nodo.tipo
+    if tipo == "Programa":
+        return 1
+    elif tipo == "DeclaracionVariable":
+        return 2
+    elif tipo == "FuncionDeclarada":
+        return 3
+    elif tipo == "Modelo":
+        return 4
+    elif tipo == "Asignacion":
+        return 5
+    elif tipo == "If":
+        return 6
+    elif tipo == "While":
+        return 7
+    elif tipo == "ForRango" or tipo == "ForIter":
+        return 8
+    elif tipo == "Return":
+        return 9
+    elif tipo == "LlamadaFuncion" or tipo == "LlamadaFuncionIO":
+        return 10
+    elif tipo == "Operacion":
+        return 11
+    elif tipo == "OperacionLogica":
+        return 12
+    elif tipo == "OperacionRelacional":
+        return 13
+    elif tipo == "Identificador":
+        return 14
+    elif tipo == "Numero":
+        return 15
+    elif tipo == "Cadena":
+        return 16
+    elif tipo == "Booleano":
+        return 17
+    return 0
+
+
+class DespachoTabla(Visitante):
+    def visitar_Programa(self, nodo): return 1
+    def visitar_DeclaracionVariable(self, nodo): return 2
+    def visitar_FuncionDeclarada(self, nodo): return 3
+    def visitar_Modelo(self, nodo): return 4
+    def visitar_Asignacion(self, nodo): return 5
+    def visitar_If(self, nodo): return 6
+    def visitar_While(self, nodo): return 7
+    def visitar_ForRango(self, nodo): return 8
+    visitar_ForIter = visitar_ForRango
+    def visitar_Return(self, nodo): return 9
+    def visitar_LlamadaFuncion(self, nodo): return 10
+    visitar_LlamadaFuncionIO = visitar_LlamadaFuncion
+    def visitar_Operacion(self, nodo): return 11
+    def visitar_OperacionLogica(self, nodo): return 12
+    def visitar_OperacionRelacional(self, nodo): return 13
+    def visitar_Identificador(self, nodo): return 14
+    def visitar_Numero(self, nodo): return 15
+    def visitar_Cadena(self, nodo): return 16
+    def visitar_Booleano(self, nodo): return 17
+    def visitar_nodo(self, nodo): return 0
+
+
+def nodos_de(ast):
+    nodos = []
+    pila = [ast]
+    while pila:
+        nodo = pila.pop()
+        if nodo is not None:
+            nodos.append(nodo)
+            pila.extend(nodo.hijos)
+    return nodos
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--profundidad", type=int, default=100000)
+    args = parser.parse_args()
+
+    lexico = Lexico()
+    for bloques in args.bloques:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ast = Sintactico(lexico.tokenize(programa_sintetico(bloques)), con_tabla=False).analisis_sintactico()
+        nodos = nodos_de(ast)
+        n = len(nodos)
+
+        t_cierre, c_cierre = medir(contar_operaciones_cierre, ast)
+        visitante = ContarOperaciones()
+        t_visitante, _ = medir(visitante.recorrer, ast)
+        assert c_cierre == visitante.cuenta
+
+        t_cadena, r_cadena = medir(lambda: [despachar_cadena(x) for x in nodos])
+        tabla = DespachoTabla()
+        t_tabla, r_tabla = medir(lambda: [tabla.despachar(x) for x in nodos])
+        assert r_cadena == r_tabla
+
+        print(f"{bloques:>5} bloques ({n} nodos)  recorrer: cierre {t_cierre * 1e9 / n:6.0f} ns/nodo, "
+              f"Visitante {t_visitante * 1e9 / n:6.0f} ns/nodo  despachar: if/elif {t_cadena * 1e9 / n:6.0f} ns/nodo, "
+              f"Visitante {t_tabla * 1e9 / n:6.0f} ns/nodo")
+
+    raiz = actual = Nodo("Operacion", "+")
+    for _ in range(args.profundidad):
+        hijo = Nodo("Operacion", "+")
+        actual.hijos = [hijo, Nodo("Numero", "1")]
+        actual = hijo
+    visitante = ContarOperaciones()
+    segundos, _ = medir(visitante.recorrer, raiz)
+    try:
+        contar_operaciones_cierre(raiz)
+        recursivo = "sin error"
+    except RecursionError:
+        recursivo = "RecursionError"
+    print(f"cadena de {args.profundidad} nodos anidados: Visitante {segundos * 1000:.0f} ms, recursivo: {recursivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Generador de programas AigisC sintéticos para los benchmarks"""
+
+import random
+
+PLANTILLA = '''/// Bloque {n} ///
+int a{n} = {n};
+float b{n} = a{n} * 2.5 + .5;
+string s{n} = "cadena {n} con \\"escapes\\"";
+bool f{n} = a{n} is not 0 and !(b{n} < 3);
+int suma{n}(int x, int y){{
+    int total = 0;
+    int i = 0;
+    for(i; i < x; i++){{
+        total += i * y % 7;   // acumulado
+    }}
+    if (total >= 100 || x == y) {{
+        return total - 1;
+    }} else {{
+        print("menor", total);
+    }}
+    return total;
+}}
+while (a{n} > 0) {{ a{n} -= 1; }}
+'''
+
+
+def programa_sintetico(bloques: int) -> str:
+    """Retorna un programa con `bloques` copias de la plantilla con nombres distintos"""
+    return "".join(PLANTILLA.format(n=n) for n in range(bloques))
+
+
+OPERADORES = ("+", "-", "*", "/", "%", "==", "!=", "<", ">", "<=", ">=", "&&", "||", "and", "or")
+
+
+def programa_expresiones(lineas: int, operandos: int = 12) -> str:
+    """Retorna `lineas` asignaciones, cada una con una expresión de `operandos` operandos"""
+    salida = []
+    for n in range(lineas):
+        partes = []
+        for k in range(operandos):
+            if k:
+                partes.append(OPERADORES[(n + k) % len(OPERADORES)])
+            partes.append(f"v{k}" if k % 3 else ("(a + 1)" if k % 2 else str(n + k)))
+        salida.append(f"x = {' '.join(partes)};\n")
+    return "".join(salida)
+
+
+def programa_anidado(profundidad: int) -> str:
+    """Retorna `profundidad` bloques if/while anidados con una asignación en el centro"""
+    aperturas = "".join("if (x < 1) {\n" if n % 2 else "while (x > 0) {\n" for n in range(profundidad))
+    return f"int x = 0;\n{aperturas}x = 1;\n{'}' * profundidad}\n"
+
+
+def programa_ambitos(profundidad: int) -> str:
+    """Retorna `profundidad` while anidados; cada uno lee la variable global y declara una local"""
+    aperturas = "".join(f"while (x > {n}) {{\nint v{n} = x;\n" for n in range(profundidad))
+    return f"int x = 0;\n{aperturas}x = 1;\n{'}' * profundidad}\n"
+
+
+def programa_parentesis(profundidad: int) -> str:
+    """Retorna una asignación con `profundidad` paréntesis anidados"""
+    return f"x = {'(' * profundidad}1{' + 1)' * profundidad};\n"
+
+
+FRAGMENTOS_ROTOS = ("int = ;", "x = (1 + ;", "if (x < ) { y = ; }", "while { x = 1; }", "print(\"a\" 2);",
+                    "float y = 2 *;", ") ) ]", "return return;", "for(i; i <; i++){ }", "model { int ; }",
+                    "x = 1;", "int z = 3;", "else", "y += * 2;", "function ( { }", "@ # $")
+
+
+def programa_basura(lineas: int, semilla: int = 0) -> str:
+    """Retorna `lineas` instrucciones casi todas mal formadas (con llaves balanceadas), elegidas al azar con `semilla`"""
+    aleatorio = random.Random(semilla)
+    return "".join(aleatorio.choice(FRAGMENTOS_ROTOS) + "\n" for _ in range(lineas))
@@ -0,0 +1,185 @@
+import re
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse, sre_constants
+
+ASCII = frozenset(map(chr, range(128)))
+
+# Clases de caracteres del regex evaluadas sobre ASCII
+_CATEGORIAS = {
+    "CATEGORY_DIGIT": r"\d", "CATEGORY_NOT_DIGIT": r"\D",
+    "CATEGORY_SPACE": r"\s", "CATEGORY_NOT_SPACE": r"\S",
+    "CATEGORY_WORD": r"\w", "CATEGORY_NOT_WORD": r"\W",
+}
+
+_es_palabra = re.compile(r"\w").match
+
+
+def _clase(elementos):
+    """Conjunto ASCII descrito por un [...] del regex"""
+    conjunto = set()
+    negado = False
+    for op, valor in elementos:
+        if op is sre_constants.NEGATE:
+            negado = True
+        elif op is sre_constants.LITERAL:
+            conjunto.add(chr(valor))
+        elif op is sre_constants.RANGE:
+            conjunto.update(map(chr, range(valor[0], min(valor[1], 127) + 1)))
+        elif op is sre_constants.CATEGORY and str(valor) in _CATEGORIAS:
+            patron = re.compile(_CATEGORIAS[str(valor)])
+            conjunto.update(c for c in ASCII if patron.match(c))
+        else:
+            return set(ASCII)
+    return set(ASCII - conjunto) if negado else conjunto
+
+
+def _primeros(items):
+    """Retorna (caracteres con los que puede empezar el patrón, si puede ser vacío).
+
+    Ante una construcción desconocida se asume cualquier carácter: sobrar
+    candidatos solo cuesta un intento de más, nunca cambia el resultado.
+    """
+    conjunto = set()
+    for op, valor in items:
+        if op is sre_constants.LITERAL:
+            primeros, anulable = {chr(valor)}, False
+        elif op is sre_constants.NOT_LITERAL:
+            primeros, anulable = set(ASCII - {chr(valor)}), False
+        elif op is sre_constants.ANY:
+            primeros, anulable = set(ASCII), False
+        elif op is sre_constants.IN:
+            primeros, anulable = _clase(valor), False
+        elif op is sre_constants.AT:
+            primeros, anulable = set(), True
+        elif op is sre_constants.SUBPATTERN:
+            primeros, anulable = _primeros(valor[-1])
+        elif op is sre_constants.BRANCH:
+            primeros, anulable = set(), False
+            for rama in valor[1]:
+                p, a = _primeros(rama)
+                primeros |= p
+                anulable = anulable or a
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            primeros, anulable = _primeros(valor[2])
+            anulable = anulable or valor[0] == 0
+        else:
+            primeros, anulable = set(ASCII), True
+        conjunto |= primeros
+        if not anulable:
+            return conjunto, False
+    return conjunto, True
+
+
+class Coincidencia:
+    """Resultado de un escaneo con la misma interfaz que usa `Lexico` de `re.Match`"""
+    __slots__ = ("string", "lastgroup", "_inicio", "_fin")
+
+    def __init__(self, string, lastgroup, inicio, fin):
+        self.string = string
+        self.lastgroup = lastgroup
+        self._inicio = inicio
+        self._fin = fin
+
+    def start(self):
+        return self._inicio
+
+    def end(self):
+        return self._fin
+
+    def group(self, _grupo=0):
+        return self.string[self._inicio:self._fin]
+
+
+class EscanerDespacho:
+    """Escáner por despacho sobre el primer carácter.
+
+    Se genera a partir de la tabla `token_regex` de `Lexico`: para cada carácter
+    ASCII se guarda, en el orden de la tabla, la lista de tipos cuyo patrón puede
+    empezar con él, así que en cada posición solo se prueban esos patrones (la
+    alternación completa los prueba todos). Las reservadas no se buscan con su
+    regex: se escanea el identificador y se clasifica con una búsqueda en un set.
+    Los caracteres no ASCII se delegan al regex completo.
+
+    Ofrece `finditer` con la misma semántica que el de la alternación, por lo que
+    `Lexico` puede usar cualquiera de los dos motores sin más cambios.
+    """
+
+    def __init__(self, token_regex, regex_completa):
+        self.regex_completa = regex_completa
+        self.identificador = None
+        self.reservadas = frozenset()
+
+        patrones = dict(token_regex)
+        if "Reservada" in patrones and "Identificador" in patrones:
+            self.identificador = re.compile(patrones["Identificador"])
+            alternativas = re.fullmatch(r"\\b\((.*)\)\\b", patrones["Reservada"])
+            self.reservadas = frozenset(alternativas.group(1).split("|")) if alternativas else frozenset()
+
+        acciones = []
+        for nombre, patron in token_regex:
+            items = sre_parse.parse(patron, re.DOTALL)
+            primeros, _ = _primeros(items)
+            # Un solo carácter literal: no hace falta regex para reconocerlo
+            literal = len(items) == 1 and items[0][0] is sre_constants.LITERAL
+            acciones.append((nombre, primeros, None if literal else re.compile(patron, re.DOTALL).match))
+
+        self.tabla = {}
+        for c in ASCII:
+            candidatos = [(nombre, match) for nombre, primeros, match in acciones if c in primeros]
+            nombres = [nombre for nombre, _ in candidatos]
+            # Reservada seguida de Identificador se resuelve con un solo escaneo de palabra
+            if self.reservadas and "Identificador" in nombres:
+                k = nombres.index("Identificador")
+                if k > 0 and nombres[k - 1] == "Reservada":
+                    candidatos[k - 1:k + 1] = [("Palabra", None)]
+                elif "Reservada" not in nombres:
+                    candidatos[k] = ("Palabra", None)
+            self.tabla[c] = tuple(candidatos)
+
+    def _palabra(self, code, pos):
+        """Escanea un identificador en `pos` y lo clasifica como Reservada o Identificador"""
+        fin = self.identificador.match(code, pos).end()
+        palabra = code[pos:fin]
+        if palabra not in self.reservadas or (pos and _es_palabra(code, pos - 1)):
+            return "Identificador", fin
+        if palabra == "is" and "is not" in self.reservadas and code.startswith(" not", fin) \
+                and not _es_palabra(code, fin + 4):
+            return "Reservada", fin + 4
+        if _es_palabra(code, fin):
+            return "Identificador", fin
+        return "Reservada", fin
+
+    def finditer(self, code, pos=0):
+        tabla = self.tabla
+        n = len(code)
+        while pos < n:
+            candidatos = tabla.get(code[pos])
+            if candidatos is None:
+                match = self.regex_completa.search(code, pos)
+                if match is None:
+                    return
+                pos = match.end()
+                yield match
+                continue
+
+            for nombre, match in candidatos:
+                if match is None:
+                    if nombre == "Palabra":
+                        nombre, fin = self._palabra(code, pos)
+                    else:
+                        fin = pos + 1
+                    break
+                m = match(code, pos)
+                if m:
+                    fin = m.end()
+                    break
+            else:
+                # Ningún patrón reconoce el carácter: la alternación lo salta
+                pos += 1
+                continue
+
+            yield Coincidencia(code, nombre, pos, fin)
+            pos = fin
@@ -1,17 +1,184 @@
+import codecs
+import os
 import re
-from typing import List
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List
 from Objetos.Token import Token
+from Objetos.TokenStream import TokenStream, codigo_tipo
+from Lexico.EscanerDespacho import EscanerDespacho
+
+# Caracteres que el regex puede mirar más allá del final de un token
+# (el caso más largo es la reservada "is not" seguida de \b)
+MARGEN_REINICIO = 8
+
+# Correcciones pendientes que se acumulan antes de aplicarlas de una vez
+MAX_PENDIENTES = 32
+
+# Tamaño de bloque por defecto al leer código en modo flujo
+TAM_BLOQUE = 1 << 16
+
+# Por debajo de este tamaño (en caracteres) no vale la pena repartir el léxico en procesos
+MIN_PARALELO = 1 << 20
+
+# Tramos donde un salto de línea no es un punto de corte seguro: comentarios ///
+# (cerrados o no), comentarios // y cadenas (cerradas o no)
+REGEX_PROTEGIDOS = re.compile(r'///.*?///|///.*|//[^\n]*|"[^"\\]*(?:\\.[^"\\]*)*"?', re.DOTALL)
+
+
+class ListaTokens(list):
+    """Lista de tokens producida por `Lexico`.
+
+    `pendientes` guarda las correcciones de posición, línea y columna que
+    `Lexico.retokenizar` todavía no aplicó a los tokens reutilizados. Mientras haya
+    correcciones la lista cambia a `_ListaTokensPendiente`, que las aplica en el
+    primer acceso y vuelve a comportarse como una lista normal.
+
+    `cambios` acumula el tramo de tokens reemplazado por las llamadas a
+    `retokenizar` como (desde, hasta en la lista anterior, cantidad nueva); el
+    parser lo usa en `Sintactico.reanalizar` y lo vuelve a None.
+    """
+    def __init__(self, tokens=()):
+        super().__init__(tokens)
+        self.pendientes = []
+        self.cambios = None
+
+    def materializar(self):
+        """Aplica las correcciones pendientes a los tokens en una sola pasada"""
+        if not self.pendientes:
+            return
+        n = len(self)
+        suma_delta = [0] * (n + 1)
+        suma_linea = [0] * (n + 1)
+        ajuste_columna = {}
+        for i, (desde, hasta, delta, delta_linea, linea_sincronia, delta_columna) in enumerate(self.pendientes):
+            suma_delta[desde] += delta
+            suma_delta[hasta] -= delta
+            suma_linea[desde] += delta_linea
+            suma_linea[hasta] -= delta_linea
+            # La columna solo cambia en los tokens de la línea de sincronía, que
+            # son los primeros del tramo
+            k = desde
+            while delta_columna and k < hasta:
+                linea = list.__getitem__(self, k).linea
+                for anterior in self.pendientes[:i]:
+                    if anterior[0] <= k < anterior[1]:
+                        linea += anterior[3]
+                if linea != linea_sincronia:
+                    break
+                ajuste_columna[k] = ajuste_columna.get(k, 0) + delta_columna
+                k += 1
+
+        delta = delta_linea = 0
+        for k in range(n):
+            delta += suma_delta[k]
+            delta_linea += suma_linea[k]
+            if delta or delta_linea:
+                token = list.__getitem__(self, k)
+                token.inicio += delta
+                token.fin += delta
+                token.linea += delta_linea
+        for k, delta_columna in ajuste_columna.items():
+            list.__getitem__(self, k).columna += delta_columna
+        self.pendientes = []
+        self.__class__ = ListaTokens
+
+    def _corregido(self, k):
+        """Retorna (inicio, fin, linea, columna) del token k con las correcciones aplicadas"""
+        token = list.__getitem__(self, k)
+        inicio, fin, linea, columna = token.inicio, token.fin, token.linea, token.columna
+        for desde, hasta, delta, delta_linea, linea_sincronia, delta_columna in self.pendientes:
+            if desde <= k < hasta:
+                if delta_columna and linea == linea_sincronia:
+                    columna += delta_columna
+                linea += delta_linea
+                inicio += delta
+                fin += delta
+        return inicio, fin, linea, columna
+
+
+class _ListaTokensPendiente(ListaTokens):
+    """ListaTokens con correcciones sin aplicar; cualquier acceso las aplica primero"""
+
+
+def _materializar_antes(nombre):
+    metodo_lista = getattr(list, nombre)
+
+    def metodo(self, *args):
+        self.materializar()
+        return metodo_lista(self, *args)
+    metodo.__name__ = nombre
+    return metodo
+
+
+for _nombre in ("__getitem__", "__setitem__", "__delitem__", "__iter__", "__reversed__",
+                "__contains__", "__eq__", "__ne__", "__add__", "__iadd__", "__mul__",
+                "__rmul__", "__imul__", "append", "extend", "insert", "pop", "remove",
+                "index", "count", "copy", "reverse", "sort"):
+    setattr(_ListaTokensPendiente, _nombre, _materializar_antes(_nombre))
+
+def componer_cambios(previos, nuevos):
+    """Une dos tramos cambiados consecutivos (desde, hasta, cantidad) en uno solo.
+
+    `previos` está en índices de la lista original y `nuevos` en los de la lista
+    que quedó después de aplicar `previos`.
+    """
+    if previos is None:
+        return nuevos
+    desde, hasta, cantidad = previos
+    desde2, hasta2, cantidad2 = nuevos
+    # Tramo que cubre ambos cambios en la lista intermedia; fuera de él nada cambió
+    inicio = min(desde, desde2)
+    fin = max(desde + cantidad, hasta2)
+    return inicio, fin - (desde + cantidad) + hasta, (fin - inicio) - (hasta2 - desde2) + cantidad2
+
+
+# Motores de escaneo disponibles
+MOTORES = ("regex", "despacho")
+
+# Analizador léxico de cada proceso de trabajo, por motor
+_LEXICOS_PROCESO = {}
+
+
+def _tokenizar_trozo(motor, trozo):
+    """Tokeniza un trozo de código en un proceso de trabajo.
+
+    Retorna (tokens, saltos, completo): los tokens como tuplas
+    (tipo, inicio, fin, linea, columna) relativas al trozo, la cantidad de saltos de
+    línea y si el trozo terminó justo en un salto de línea (si no, algún token
+    podría continuar en el trozo siguiente y el resultado no sirve).
+    """
+    lexico = _LEXICOS_PROCESO.get(motor)
+    if lexico is None:
+        lexico = _LEXICOS_PROCESO[motor] = Lexico(motor)
+    tokens = []
+    linea = 1
+    pos_inicio = 0
+    for match in lexico.escaner.finditer(trozo):
+        tipo = match.lastgroup
+        if tipo in ("Espacio", "ComentarioUnilinea", "ComentarioMultilinea"):
+            continue
+        if tipo == "SaltoLinea":
+            linea += 1
+            pos_inicio = match.end()
+            continue
+        inicio = match.start()
+        tokens.append((tipo, inicio, match.end(), linea, inicio - pos_inicio + 1))
+    return tokens, linea - 1, pos_inicio == len(trozo)
+
 
 class Lexico:
-    def __init__(self):
+    def __init__(self, motor: str = "regex"):
         #Regex de nuestras reglas
         self.token_regex = [
             ("ComentarioMultilinea", r"///.*?///"),
+            ("ComentarioNoTerminado", r"///.*"),
             ("ComentarioUnilinea", r"//[^\n]*"),
             ("Reservada", r"\b(if|else|for|while|return|const|readonly|global|local|shared|try|catch|throw|model|template|extends|override|import|from|in|is not|is|not|and|or|AND|OR|NOT|void|int|float|char|bool|string|mapInt|mapString|function|true|false|print|input|println|readLine|readInt|readFloat|write|writeLine)\b"),
             #("NumeroInvalido", r"[+-]?(?:\d+\.)+\d*\.?\d*|\.[+-]?\d+\.+\d*"), #esta regex falla
             ("Numero", r"[+-]?(?:\d+\.\d+|\d+\.|\.\d+|\d+)\b"),
-            ("Cadena", r'"([^"\\]|\\.)*"'),
+            ("Cadena", r'"[^"\\]*(?:\\.[^"\\]*)*"'),
+            ("CadenaNoTerminada", r'"[^"\\]*(?:\\.[^"\\]*)*'),
             ("AsignacionCompuesta", r"(\+=|-=|\*=|/=)"),
             ("Relacional", r"(==|!=|<=|>=|<|>)"),
             ("Incrementador", r"(\+\+|--|//|\*\*)"), 
@@ -38,13 +205,20 @@ class Lexico:
             "|".join(f"(?P<{name}>{pattern})" for name, pattern in self.token_regex),
             re.DOTALL
         )
+        self.codigos_tipo = {name: codigo_tipo(name) for name, _ in self.token_regex}
+
+        # "regex" usa la alternación completa; "despacho" el escáner por primer carácter
+        if motor not in MOTORES:
+            raise ValueError(f"Motor léxico desconocido: {motor}")
+        self.motor = motor
+        self.escaner = EscanerDespacho(self.token_regex, self.regex_completa) if motor == "despacho" else self.regex_completa
 
     def tokenize(self, code: str) -> List[Token]: 
-        tokens = []
+        tokens = ListaTokens()
         linea = 1
         pos_inicio = 0
 
-        for match in self.regex_completa.finditer(code):
+        for match in self.escaner.finditer(code):
             tipo = match.lastgroup
             valor = match.group(tipo)
 
@@ -57,7 +231,238 @@ class Lexico:
                 continue
 
             columna = match.start() - pos_inicio + 1
-            token = Token(tipo, valor, linea, columna)
+            token = Token(tipo, valor, linea, columna, match.start(), match.end())
             tokens.append(token)
 
-        return tokens
\ No newline at end of file
+        return tokens
+
+    def puntos_corte(self, code: str, partes: int) -> List[int]:
+        """Retorna hasta `partes - 1` posiciones para repartir el código.
+
+        Cada corte queda justo después de un salto de línea que no está dentro de
+        una cadena ni de un comentario, cerca de un múltiplo de len(code) / partes.
+        """
+        cortes = []
+        objetivo = max(1, len(code) // partes)
+        protegidos = REGEX_PROTEGIDOS.finditer(code)
+        tramo = next(protegidos, None)
+        pos = objetivo
+        while len(cortes) < partes - 1:
+            salto = code.find("\n", pos)
+            if salto < 0:
+                break
+            while tramo is not None and tramo.end() <= salto:
+                tramo = next(protegidos, None)
+            if tramo is not None and tramo.start() <= salto:
+                pos = tramo.end()
+                continue
+            cortes.append(salto + 1)
+            pos = max(salto + 1, (len(cortes) + 1) * objetivo)
+        return cortes
+
+    def tokenize_paralelo(self, code: str, procesos: int = None, min_paralelo: int = MIN_PARALELO) -> List[Token]:
+        """Tokeniza repartiendo el código en trozos entre varios procesos.
+
+        Produce exactamente lo mismo que `tokenize`. Los trozos se cortan en saltos de
+        línea seguros (`puntos_corte`); si un trozo no terminó limpio en su salto de
+        línea (el pre-escaneo se equivocó), se re-escanea en serie desde ahí hasta el
+        siguiente corte que sí coincida con un salto de línea real.
+        """
+        procesos = procesos or os.cpu_count() or 1
+        if procesos <= 1 or len(code) < min_paralelo:
+            return self.tokenize(code)
+
+        limites = [0] + self.puntos_corte(code, procesos * 2) + [len(code)]
+        trozos = [code[a:b] for a, b in zip(limites, limites[1:])]
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_tokenizar_trozo, [self.motor] * len(trozos), trozos))
+
+        tokens = ListaTokens()
+        linea = 1
+        i = 0
+        while i < len(trozos):
+            base = limites[i]
+            parciales, saltos, completo = resultados[i]
+            if completo or i == len(trozos) - 1:
+                for tipo, inicio, fin, linea_relativa, columna in parciales:
+                    tokens.append(Token(tipo, code[base + inicio:base + fin], linea + linea_relativa - 1,
+                                        columna, base + inicio, base + fin))
+                linea += saltos
+                i += 1
+                continue
+
+            # Re-escaneo en serie hasta un salto de línea que caiga en un límite
+            siguientes = {limite: k for k, limite in enumerate(limites[i + 1:-1], i + 1)}
+            pos_inicio = base
+            i = len(trozos)
+            for match in self.escaner.finditer(code, base):
+                tipo = match.lastgroup
+                if tipo in ("Espacio", "ComentarioUnilinea", "ComentarioMultilinea"):
+                    continue
+                if tipo == "SaltoLinea":
+                    linea += 1
+                    pos_inicio = match.end()
+                    if pos_inicio in siguientes:
+                        i = siguientes[pos_inicio]
+                        break
+                    continue
+                inicio = match.start()
+                tokens.append(Token(tipo, match.group(tipo), linea, inicio - pos_inicio + 1, inicio, match.end()))
+
+        return tokens
+
+    def tokenize_compacto(self, code: str) -> TokenStream:
+        """Tokeniza a un `TokenStream` (arreglos de enteros) en vez de una lista de Token"""
+        flujo = TokenStream(code)
+        agregar = flujo.agregar
+        codigos = self.codigos_tipo
+        linea = 1
+        pos_inicio = 0
+
+        for match in self.escaner.finditer(code):
+            tipo = match.lastgroup
+
+            if tipo in ("Espacio", "ComentarioUnilinea", "ComentarioMultilinea"):
+                continue
+
+            if tipo == "SaltoLinea":
+                linea += 1
+                pos_inicio = match.end()
+                continue
+
+            inicio = match.start()
+            agregar(codigos[tipo], inicio, match.end(), linea, inicio - pos_inicio + 1)
+
+        return flujo
+
+    def tokenize_stream(self, fuente, tam_bloque: int = TAM_BLOQUE) -> Iterator[Token]:
+        """Tokeniza perezosamente un archivo (de texto, binario o mmap) por bloques.
+
+        Produce los mismos tokens que `tokenize` sin cargar el código completo en
+        memoria. Un token que toca el final del bloque se deja pendiente hasta leer
+        el siguiente; si un token sigue abierto (p. ej. un comentario sin cerrar) el
+        tamaño de la lectura se duplica, así el re-escaneo total sigue siendo lineal.
+        """
+        decodificador = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        base = 0          # posición absoluta de buffer[0]
+        pos = 0           # posición en buffer desde donde seguir escaneando
+        linea = 1
+        pos_inicio = 0    # posición absoluta del inicio de la línea actual
+        fin = False
+        lectura = tam_bloque
+
+        while not fin:
+            bloque = fuente.read(lectura)
+            fin = not bloque
+            if isinstance(bloque, (bytes, bytearray)):
+                bloque = decodificador.decode(bloque, final=fin)
+            # Se conserva un carácter previo para que \b vea el mismo contexto
+            corte = max(0, pos - 1)
+            buffer = buffer[corte:] + bloque
+            base += corte
+            pos -= corte
+            limite = len(buffer) if fin else len(buffer) - MARGEN_REINICIO
+            pos_previa = pos
+
+            for match in self.escaner.finditer(buffer, pos):
+                if not fin and match.end() > limite:
+                    break
+                tipo = match.lastgroup
+                valor = match.group(tipo)
+                pos = match.end()
+
+                if tipo in ("Espacio", "ComentarioUnilinea", "ComentarioMultilinea"):
+                    continue
+
+                if tipo == "SaltoLinea":
+                    linea += 1
+                    pos_inicio = base + match.end()
+                    continue
+
+                inicio = base + match.start()
+                yield Token(tipo, valor, linea, inicio - pos_inicio + 1, inicio, base + match.end())
+
+            lectura = tam_bloque if pos > pos_previa else lectura * 2
+
+    def retokenizar(self, code: str, tokens: List[Token], offset: int, eliminados: int, insertado: str) -> List[Token]:
+        """Re-tokeniza solo la zona afectada por una edición.
+
+        `code` es el texto ya editado y `tokens` la lista producida por `tokenize`
+        (o por una llamada anterior a este método) para el texto anterior. La edición
+        reemplazó `eliminados` caracteres a partir de `offset` por `insertado`.
+        Se re-escanea desde el último token seguro antes de la edición hasta que el
+        flujo nuevo vuelve a coincidir con el anterior. La lista se modifica en su
+        lugar y se retorna; la corrección de línea y columna de la cola reutilizada
+        queda pendiente hasta el siguiente acceso a los tokens.
+        """
+        if not isinstance(tokens, ListaTokens):
+            return self.tokenize(code)
+        if len(tokens.pendientes) >= MAX_PENDIENTES:
+            tokens.materializar()
+
+        fin_edicion = offset + len(insertado)
+        delta = len(insertado) - eliminados
+        indices = range(len(tokens))
+
+        # Punto de reinicio: último token cuyo escaneo no pudo depender de la zona editada
+        reinicio = max(0, bisect_left(indices, offset - MARGEN_REINICIO + 1, key=lambda k: tokens._corregido(k)[1]) - 1)
+        ancla = tokens._corregido(reinicio) if tokens else None
+        if ancla and ancla[1] + MARGEN_REINICIO <= offset:
+            pos, _, linea, columna_ancla = ancla
+            pos_inicio = pos - columna_ancla + 1
+        else:
+            reinicio = 0
+            pos = 0
+            linea = 1
+            pos_inicio = 0
+
+        nuevos = ListaTokens()
+        cola = len(tokens)
+        sincronia = None
+        for match in self.escaner.finditer(code, pos):
+            tipo = match.lastgroup
+            inicio = match.start()
+
+            if tipo in ("Espacio", "ComentarioUnilinea", "ComentarioMultilinea"):
+                continue
+
+            if tipo == "SaltoLinea":
+                linea += 1
+                pos_inicio = match.end()
+                continue
+
+            valor = match.group(tipo)
+            columna = inicio - pos_inicio + 1
+
+            # Resincronización: mismo token en la misma posición relativa tras la edición.
+            # Desde ahí el texto es idéntico, y ningún token depende de texto más allá
+            # de su fin (salvo el margen), así que la cola anterior sigue siendo válida.
+            if inicio > fin_edicion:
+                j = bisect_left(indices, inicio - delta, reinicio, key=lambda k: tokens._corregido(k)[0])
+                if j < len(tokens):
+                    viejo_inicio, _, viejo_linea, viejo_columna = tokens._corregido(j)
+                    if viejo_inicio == inicio - delta and list.__getitem__(tokens, j).tipo == tipo:
+                        cola = j
+                        sincronia = (delta, linea - viejo_linea, viejo_linea, columna - viejo_columna)
+                        break
+
+            nuevos.append(Token(tipo, valor, linea, columna, inicio, match.end()))
+
+        # Las correcciones previas se recortan a los tramos que sobreviven
+        corrimiento = reinicio + len(nuevos) - cola
+        pendientes = []
+        for desde, hasta, *correccion in tokens.pendientes:
+            if desde < reinicio:
+                pendientes.append((desde, min(hasta, reinicio), *correccion))
+            if hasta > cola:
+                pendientes.append((max(desde, cola) + corrimiento, hasta + corrimiento, *correccion))
+        total = len(tokens) + corrimiento
+        if sincronia and (sincronia[0] or sincronia[1] or sincronia[3]):
+            pendientes.append((cola + corrimiento, total, *sincronia))
+
+        list.__setitem__(tokens, slice(reinicio, cola), nuevos)
+        tokens.cambios = componer_cambios(tokens.cambios, (reinicio, cola, len(nuevos)))
+        tokens.pendientes = pendientes
+        tokens.__class__ = _ListaTokensPendiente if pendientes else ListaTokens
+        return tokens
@@ -0,0 +1,157 @@
+from array import array
+
+from Objetos.Nodo import Nodo, TIPOS_NODO, repr_acotado
+
+# Clase que marca un hijo None dentro de la arena
+NULO = 0xFFFF
+
+# Índice de "sin hijo" / "sin hermano"
+NINGUNO = -1
+
+_FIN = object()
+
+
+class ArenaAST:
+    """AST guardado en arreglos paralelos en vez de un objeto por nodo.
+
+    El nodo `i` tiene su clase (entero de `clase_nodo`) en `clases[i]`, el índice
+    de su valor en `valores[i]` (dentro de `tabla_valores`, donde los valores
+    iguales se guardan una sola vez), y se enlaza con `primer_hijo[i]` y
+    `siguiente[i]` (NINGUNO si no hay). Los nodos se numeran en preorden desde la
+    raíz (índice 0). Para recorrerlo con la interfaz de `Nodo` se usa `raiz`, que
+    retorna vistas de solo lectura; `a_nodo` reconstruye los `Nodo` modificables.
+    """
+
+    def __init__(self):
+        self.clases = array("H")
+        self.valores = array("I")
+        self.primer_hijo = array("i")
+        self.siguiente = array("i")
+        self.tabla_valores = []
+        self._indices_valores = {}
+
+    def __len__(self):
+        return len(self.clases)
+
+    def _indice_valor(self, valor):
+        # El tipo entra en la clave para no confundir 1, 1.0 y True
+        try:
+            clave = (type(valor), valor)
+            indice = self._indices_valores.get(clave)
+        except TypeError:
+            clave = indice = None
+        if indice is None:
+            indice = len(self.tabla_valores)
+            self.tabla_valores.append(valor)
+            if clave is not None:
+                self._indices_valores[clave] = indice
+        return indice
+
+    def agregar(self, clase, valor=None):
+        """Agrega un nodo sin enlazar y retorna su índice"""
+        self.clases.append(clase)
+        self.valores.append(self._indice_valor(valor))
+        self.primer_hijo.append(NINGUNO)
+        self.siguiente.append(NINGUNO)
+        return len(self.clases) - 1
+
+    @classmethod
+    def desde_nodo(cls, raiz):
+        """Copia a una arena el árbol de `Nodo` que cuelga de `raiz`"""
+        arena = cls()
+        if raiz is None:
+            return arena
+        arena.agregar(raiz.clase, raiz.valor)
+        pila = [[iter(raiz.hijos), 0, NINGUNO]]  # (hijos por visitar, padre, último hijo agregado)
+        while pila:
+            entrada = pila[-1]
+            hijo = next(entrada[0], _FIN)
+            if hijo is _FIN:
+                pila.pop()
+                continue
+            if hijo is None:
+                indice = arena.agregar(NULO)
+            else:
+                indice = arena.agregar(hijo.clase, hijo.valor)
+            if entrada[2] == NINGUNO:
+                arena.primer_hijo[entrada[1]] = indice
+            else:
+                arena.siguiente[entrada[2]] = indice
+            entrada[2] = indice
+            if hijo is not None and hijo.hijos:
+                pila.append([iter(hijo.hijos), indice, NINGUNO])
+        return arena
+
+    @property
+    def raiz(self):
+        return VistaNodo(self, 0) if self.clases else None
+
+    def a_nodo(self, indice=0):
+        """Reconstruye como `Nodo` el subárbol que empieza en `indice`"""
+        if not self.clases:
+            return None
+        raiz = self._nodo_suelto(indice)
+        pila = [(raiz, indice)]
+        while pila:
+            nodo, i = pila.pop()
+            hijo = self.primer_hijo[i]
+            while hijo != NINGUNO:
+                copia = self._nodo_suelto(hijo)
+                nodo.hijos.append(copia)
+                if copia is not None:
+                    pila.append((copia, hijo))
+                hijo = self.siguiente[hijo]
+        return raiz
+
+    def _nodo_suelto(self, indice):
+        clase = self.clases[indice]
+        if clase == NULO:
+            return None
+        return Nodo(TIPOS_NODO[clase], valor=self.tabla_valores[self.valores[indice]])
+
+
+class VistaNodo:
+    """Nodo de una `ArenaAST` con la interfaz de lectura de `Nodo`.
+
+    Cada acceso a `hijos` arma una lista nueva de vistas, así que modificarla no
+    cambia la arena; para transformar el árbol se usa `ArenaAST.a_nodo`.
+    """
+    __slots__ = ("arena", "indice")
+
+    def __init__(self, arena, indice):
+        self.arena = arena
+        self.indice = indice
+
+    @property
+    def clase(self):
+        return self.arena.clases[self.indice]
+
+    @property
+    def tipo(self):
+        return TIPOS_NODO[self.arena.clases[self.indice]]
+
+    @property
+    def valor(self):
+        return self.arena.tabla_valores[self.arena.valores[self.indice]]
+
+    @property
+    def hijos(self):
+        arena = self.arena
+        hijos = []
+        hijo = arena.primer_hijo[self.indice]
+        while hijo != NINGUNO:
+            hijos.append(VistaNodo(arena, hijo) if arena.clases[hijo] != NULO else None)
+            hijo = arena.siguiente[hijo]
+        return hijos
+
+    def __eq__(self, otro):
+        return isinstance(otro, VistaNodo) and otro.arena is self.arena and otro.indice == self.indice
+
+    def __hash__(self):
+        return hash((id(self.arena), self.indice))
+
+    def __repr__(self):
+        return repr_acotado(self)
+
+    def to_dict(self):
+        return self.arena.a_nodo(self.indice).to_dict()
@@ -0,0 +1,88 @@
+import json
+import sys
+import time
+
+# Niveles, de menor a mayor importancia
+DEPURACION = 10
+INFO = 20
+ADVERTENCIA = 30
+ERROR = 40
+SILENCIO = 100
+
+NOMBRES_NIVEL = {DEPURACION: "depuracion", INFO: "info", ADVERTENCIA: "advertencia", ERROR: "error"}
+
+
+class SalidaTexto:
+    """Escribe cada evento como `[componente] mensaje` (por defecto en la salida estándar del momento)"""
+
+    def __init__(self, nivel=INFO, archivo=None):
+        self.nivel = nivel
+        self.archivo = archivo
+
+    def escribir(self, nivel, componente, evento, mensaje, campos):
+        print(f"[{componente}] {mensaje.format(**campos)}", file=self.archivo or sys.stdout)
+
+
+class SalidaEventos:
+    """Escribe cada evento como una línea JSON con tiempo, nivel, componente, evento y sus campos"""
+
+    def __init__(self, archivo, nivel=DEPURACION):
+        self.nivel = nivel
+        self.archivo = archivo
+
+    def escribir(self, nivel, componente, evento, mensaje, campos):
+        registro = {"tiempo": time.time(), "nivel": NOMBRES_NIVEL[nivel], "componente": componente, "evento": evento}
+        registro.update(campos)
+        self.archivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+
+
+class Bitacora:
+    """Registro con niveles de un componente del compilador.
+
+    Cada evento tiene un nombre (p. ej. "ambito.entrar"), un mensaje con campos
+    `{nombre}` y los valores de esos campos. Si ninguna salida acepta el nivel,
+    el llamado solo compara dos enteros: el mensaje no se formatea. Cuando
+    calcular un campo cuesta, se pregunta antes con `habilitada(nivel)`.
+    """
+
+    # Nivel mínimo que acepta alguna salida; lo actualiza `configurar`
+    umbral = INFO
+    salidas = [SalidaTexto()]
+
+    def __init__(self, componente):
+        self.componente = componente
+
+    def habilitada(self, nivel):
+        return nivel >= Bitacora.umbral
+
+    def _emitir(self, nivel, evento, mensaje, campos):
+        for salida in Bitacora.salidas:
+            if nivel >= salida.nivel:
+                salida.escribir(nivel, self.componente, evento, mensaje, campos)
+
+    def depuracion(self, evento, mensaje, **campos):
+        if DEPURACION >= Bitacora.umbral:
+            self._emitir(DEPURACION, evento, mensaje, campos)
+
+    def info(self, evento, mensaje, **campos):
+        if INFO >= Bitacora.umbral:
+            self._emitir(INFO, evento, mensaje, campos)
+
+    def advertencia(self, evento, mensaje, **campos):
+        if ADVERTENCIA >= Bitacora.umbral:
+            self._emitir(ADVERTENCIA, evento, mensaje, campos)
+
+    def error(self, evento, mensaje, **campos):
+        if ERROR >= Bitacora.umbral:
+            self._emitir(ERROR, evento, mensaje, campos)
+
+
+def configurar(*salidas):
+    """Reemplaza las salidas de todas las bitácoras (sin salidas no se registra nada).
+
+    Por defecto hay una `SalidaTexto` de nivel INFO; p. ej.
+    `configurar(SalidaTexto(ADVERTENCIA), SalidaEventos(archivo))` deja en la
+    consola solo advertencias y errores y guarda todos los eventos en `archivo`.
+    """
+    Bitacora.salidas = list(salidas)
+    Bitacora.umbral = min((s.nivel for s in salidas), default=SILENCIO)
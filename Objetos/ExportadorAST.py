@@ -0,0 +1,61 @@
+import json
+from json.encoder import encode_basestring_ascii
+
+# Piezas de texto que se acumulan antes de escribirlas al archivo
+PIEZAS_POR_ESCRITURA = 4096
+
+
+def exportar_json(raiz, archivo, sangria=None):
+    """Escribe el AST de `raiz` como JSON en `archivo` (un objeto con `write`) sin armarlo en memoria.
+
+    El resultado es el mismo texto que `json.dumps(raiz.to_dict(), indent=sangria)`
+    (los hijos None se escriben como null), pero el árbol se recorre con una pila
+    explícita y el texto se escribe por partes, así que la memoria usada no depende
+    del tamaño del árbol sino de su anchura.
+    """
+    if sangria is None:
+        coma, saltos = ", ", None
+    else:
+        coma, saltos = ",", []
+
+    def salto(nivel):
+        # Texto de "nueva línea + sangría" por nivel, calculado una vez
+        if saltos is None:
+            return ""
+        while len(saltos) <= nivel:
+            saltos.append("\n" + " " * (sangria * len(saltos)))
+        return saltos[nivel]
+
+    piezas = []
+    pila = [(raiz, 0)]  # (nodo, nivel) o (texto ya armado, None)
+    while pila:
+        elemento, nivel = pila.pop()
+        if nivel is None:
+            piezas.append(elemento)
+        elif elemento is None:
+            piezas.append("null")
+        else:
+            interior = salto(nivel + 1)
+            valor = elemento.valor
+            if valor is None:
+                valor = "null"
+            elif isinstance(valor, str):
+                valor = encode_basestring_ascii(valor)
+            else:
+                valor = json.dumps(valor)
+            piezas.append(f'{{{interior}"tipo": {encode_basestring_ascii(elemento.tipo)}{coma}'
+                          f'{interior}"valor": {valor}{coma}{interior}"hijos": ')
+            hijos = elemento.hijos
+            if not hijos:
+                piezas.append(f"[]{salto(nivel)}}}")
+            else:
+                pila.append((f"{interior}]{salto(nivel)}}}", None))
+                separador = coma + salto(nivel + 2)
+                for hijo in reversed(hijos):
+                    pila.append((hijo, nivel + 2))
+                    pila.append((separador, None))
+                pila[-1] = ("[" + salto(nivel + 2), None)
+        if len(piezas) >= PIEZAS_POR_ESCRITURA:
+            archivo.write("".join(piezas))
+            piezas.clear()
+    archivo.write("".join(piezas))
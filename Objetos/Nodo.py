@@ -1,17 +1,86 @@
-import json
+import reprlib
+
+# Registro de clases de nodo: cada tipo (cadena) se interna una sola vez como entero
+TIPOS_NODO = []
+_CLASES_NODO = {}
+
+# Límites de repr(nodo): niveles de hijos y nodos mostrados en total
+REPR_PROFUNDIDAD = 3
+REPR_NODOS = 40
+
+_repr_valor = reprlib.Repr()
+_repr_valor.maxstring = 60
+
+
+def clase_nodo(tipo):
+    """Retorna el entero que identifica a `tipo`, registrándolo la primera vez"""
+    clase = _CLASES_NODO.get(tipo)
+    if clase is None:
+        clase = _CLASES_NODO[tipo] = len(TIPOS_NODO)
+        TIPOS_NODO.append(tipo)
+    return clase
+
 
 class Nodo:
+    # Sin __dict__ por nodo; el tipo se guarda como su clase entera
+    __slots__ = ("clase", "valor", "hijos")
+
     def __init__(self, tipo, valor=None, hijos=None):
-        self.tipo = tipo
+        self.clase = clase_nodo(tipo)
         self.valor = valor
         self.hijos = hijos or []
 
+    @property
+    def tipo(self):
+        return TIPOS_NODO[self.clase]
+
+    @tipo.setter
+    def tipo(self, tipo):
+        self.clase = clase_nodo(tipo)
+
+    def __reduce__(self):
+        # Por nombre de tipo: otro proceso puede haber numerado las clases distinto
+        return Nodo, (self.tipo, self.valor, self.hijos)
+
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=2)
+        return repr_acotado(self)
 
     def to_dict(self):
         return {
             "tipo": self.tipo,
             "valor": self.valor,
             "hijos": [h.to_dict() for h in self.hijos]
-        }
\ No newline at end of file
+        }
+
+
+def repr_acotado(nodo, profundidad=REPR_PROFUNDIDAD, nodos=REPR_NODOS):
+    """Representación corta de un árbol: como mucho `profundidad` niveles y `nodos` nodos.
+
+    Los hijos que no se muestran se resumen como `<N hijos>` o `...N más`, así
+    que imprimir un árbol enorme por error no lo recorre entero. Para el árbol
+    completo está `to_dict` o `ExportadorAST.exportar_json`.
+    """
+    restantes = [nodos]
+
+    def armar(nodo, nivel):
+        if nodo is None:
+            return "None"
+        restantes[0] -= 1
+        texto = f"Nodo({nodo.tipo!r}"
+        if nodo.valor is not None:
+            texto += f", valor={_repr_valor.repr(nodo.valor)}"
+        hijos = nodo.hijos
+        if hijos:
+            if nivel >= profundidad:
+                partes = [f"<{len(hijos)} hijos>"]
+            else:
+                partes = []
+                for i, hijo in enumerate(hijos):
+                    if restantes[0] <= 0:
+                        partes.append(f"...{len(hijos) - i} más")
+                        break
+                    partes.append(armar(hijo, nivel + 1))
+            texto += f", hijos=[{', '.join(partes)}]"
+        return texto + ")"
+
+    return armar(nodo, 0)
@@ -0,0 +1,208 @@
+import struct
+import sys
+from array import array
+
+from Objetos.Nodo import Nodo, TIPOS_NODO
+
+# Encabezado: formato, cantidad de tipos, de cadenas y de subárboles, y la raíz (clase y valor)
+MAGICO = b"AGB1"
+ENCABEZADO = struct.Struct("<4sIIIII")
+
+# Clase que marca un hijo None
+NULO = 0xFFFFFFFF
+
+# Campos por registro de nodo (clase, valor, cantidad de hijos) y por entrada del
+# índice (desplazamiento, cantidad de registros, clase, valor)
+CAMPOS_NODO = 3
+CAMPOS_INDICE = 4
+
+_SIN_LEER = object()
+
+
+def serializar(raiz):
+    """Retorna el árbol de `raiz` en formato binario compacto.
+
+    Los tipos y los valores (cadenas o None) van en tablas sin repetir; cada
+    nodo es un registro de tres enteros de 32 bits en preorden. Los hijos de la
+    raíz (instrucciones de nivel superior) se guardan uno tras otro y un índice
+    con su desplazamiento, tipo y valor permite cargar solo los que se necesiten
+    con `ASTSerializado`.
+    """
+    tipos = {}  # clase del proceso -> código en el archivo
+    cadenas = {}
+    registros = array("I")
+    indice = array("I")
+
+    def codigo_tipo(clase):
+        codigo = tipos.get(clase)
+        if codigo is None:
+            codigo = tipos[clase] = len(tipos)
+        return codigo
+
+    def codigo_valor(valor):
+        # 0 es None; las cadenas van desde 1
+        if valor is None:
+            return 0
+        if not isinstance(valor, str):
+            raise ValueError(f"Valor de nodo no serializable: {valor!r}")
+        codigo = cadenas.get(valor)
+        if codigo is None:
+            codigo = cadenas[valor] = len(cadenas) + 1
+        return codigo
+
+    if raiz is None:
+        clase_raiz, valor_raiz, hijos = NULO, 0, []
+    else:
+        clase_raiz, valor_raiz, hijos = codigo_tipo(raiz.clase), codigo_valor(raiz.valor), raiz.hijos
+
+    for hijo in hijos:
+        inicio = len(registros) // CAMPOS_NODO
+        pila = [hijo]
+        while pila:
+            nodo = pila.pop()
+            if nodo is None:
+                registros.extend((NULO, 0, 0))
+                continue
+            registros.extend((codigo_tipo(nodo.clase), codigo_valor(nodo.valor), len(nodo.hijos)))
+            pila.extend(reversed(nodo.hijos))
+        cantidad = len(registros) // CAMPOS_NODO - inicio
+        clase, valor = registros[inicio * CAMPOS_NODO], registros[inicio * CAMPOS_NODO + 1]
+        indice.extend((inicio, cantidad, clase, valor))
+
+    partes = [ENCABEZADO.pack(MAGICO, len(tipos), len(cadenas), len(indice) // CAMPOS_INDICE, clase_raiz, valor_raiz)]
+    partes.extend(_volcar_tabla(TIPOS_NODO[clase] for clase in tipos))
+    partes.extend(_volcar_tabla(cadenas))
+    partes.append(_a_bytes(indice))
+    partes.append(_a_bytes(registros))
+    return b"".join(partes)
+
+
+def deserializar(datos):
+    """Reconstruye el árbol completo de `Nodo` guardado con `serializar`"""
+    return ASTSerializado(datos).raiz()
+
+
+class ASTSerializado:
+    """Lector de un AST serializado que carga los subárboles de nivel superior bajo demanda.
+
+    Solo se leen el encabezado, los tipos y el índice; las cadenas se decodifican
+    al usarlas. `entradas()` lista (tipo, valor) de cada instrucción de nivel
+    superior (p. ej. ("FuncionDeclarada", "suma")) y `subarbol(i)` o `buscar`
+    reconstruyen únicamente esa instrucción.
+    """
+
+    def __init__(self, datos):
+        vista = memoryview(datos)
+        if len(vista) < ENCABEZADO.size:
+            raise ValueError("Datos de AST incompletos")
+        magico, n_tipos, n_cadenas, n_subarboles, self._clase_raiz, self._valor_raiz = ENCABEZADO.unpack_from(vista)
+        if magico != MAGICO:
+            raise ValueError("Los datos no son un AST serializado")
+        pos = ENCABEZADO.size
+        fines, blob, pos = _leer_tabla(vista, pos, n_tipos)
+        self.tipos = [str(blob[a:b], "utf-8") for a, b in zip([0] + list(fines), fines)]
+        self._fines_cadenas, self._blob_cadenas, pos = _leer_tabla(vista, pos, n_cadenas)
+        self._cadenas = [None] + [_SIN_LEER] * n_cadenas
+        fin = pos + 4 * CAMPOS_INDICE * n_subarboles
+        self._indice = _de_bytes(vista[pos:fin])
+        self._registros = vista[fin:]
+
+    def __len__(self):
+        return len(self._indice) // CAMPOS_INDICE
+
+    def _cadena(self, codigo):
+        cadena = self._cadenas[codigo]
+        if cadena is _SIN_LEER:
+            inicio = self._fines_cadenas[codigo - 2] if codigo > 1 else 0
+            cadena = self._cadenas[codigo] = str(self._blob_cadenas[inicio:self._fines_cadenas[codigo - 1]],
+                                                 "utf-8", "surrogatepass")
+        return cadena
+
+    def entrada(self, i):
+        """Retorna (tipo, valor) de la instrucción de nivel superior `i` sin cargarla"""
+        _, _, clase, valor = self._indice[i * CAMPOS_INDICE:(i + 1) * CAMPOS_INDICE]
+        return (self.tipos[clase] if clase != NULO else None), self._cadena(valor)
+
+    def entradas(self):
+        return [self.entrada(i) for i in range(len(self))]
+
+    def buscar(self, tipo, valor):
+        """Retorna el subárbol de nivel superior con ese tipo y valor, o None"""
+        for i in range(len(self)):
+            if self.entrada(i) == (tipo, valor):
+                return self.subarbol(i)
+        return None
+
+    def subarbol(self, i):
+        """Reconstruye la instrucción de nivel superior `i`"""
+        inicio, cantidad = self._indice[i * CAMPOS_INDICE:i * CAMPOS_INDICE + 2]
+        tamano = 4 * CAMPOS_NODO
+        registros = _de_bytes(self._registros[inicio * tamano:(inicio + cantidad) * tamano])
+        return self._cargar(registros)
+
+    def raiz(self):
+        """Reconstruye el árbol completo"""
+        if self._clase_raiz == NULO:
+            return None
+        raiz = Nodo(self.tipos[self._clase_raiz], valor=self._cadena(self._valor_raiz))
+        raiz.hijos.extend(self.subarbol(i) for i in range(len(self)))
+        return raiz
+
+    def _cargar(self, registros):
+        tipos = self.tipos
+        cadenas = self._cadenas
+        raiz = None
+        pendientes = []  # (nodo padre, hijos que le faltan)
+        campos = iter(registros)
+        for clase, valor, cantidad in zip(campos, campos, campos):
+            if clase == NULO:
+                nodo = None
+            else:
+                cadena = cadenas[valor]
+                if cadena is _SIN_LEER:
+                    cadena = self._cadena(valor)
+                nodo = Nodo(tipos[clase], cadena)
+            if pendientes:
+                padre = pendientes[-1]
+                padre[0].hijos.append(nodo)
+                padre[1] -= 1
+                if not padre[1]:
+                    pendientes.pop()
+            else:
+                raiz = nodo
+            if cantidad:
+                pendientes.append([nodo, cantidad])
+        return raiz
+
+
+def _volcar_tabla(textos):
+    """Tabla de textos: cantidad implícita, fines acumulados (uint32) y los bytes UTF-8 seguidos"""
+    fines = array("I")
+    blob = bytearray()
+    for texto in textos:
+        blob += texto.encode("utf-8", "surrogatepass")
+        fines.append(len(blob))
+    return _a_bytes(fines), struct.pack("<I", len(blob)), bytes(blob)
+
+
+def _leer_tabla(vista, pos, cantidad):
+    fin = pos + 4 * cantidad
+    fines = _de_bytes(vista[pos:fin])
+    (largo,) = struct.unpack_from("<I", vista, fin)
+    inicio_blob = fin + 4
+    return fines, vista[inicio_blob:inicio_blob + largo], inicio_blob + largo
+
+
+def _a_bytes(arreglo):
+    if sys.byteorder == "big":
+        arreglo = array("I", arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _de_bytes(datos):
+    arreglo = array("I")
+    arreglo.frombytes(datos)
+    if sys.byteorder == "big":
+        arreglo.byteswap()
+    return arreglo
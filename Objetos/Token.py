@@ -1,10 +1,24 @@
+import sys
+
+TIPOS_INVALIDOS = ("NumeroInvalido", "TokenNoReconocido", "ComentarioNoTerminado", "CadenaNoTerminada")
+
+
 class Token:
-    def __init__(self, tipo: str, valor: str, linea: int, columna: int):
-        self.tipo = tipo
+    __slots__ = ("tipo", "valor", "linea", "columna", "inicio", "fin")
+
+    def __init__(self, tipo: str, valor: str, linea: int, columna: int, inicio: int = None, fin: int = None):
+        # Los tipos se internan para que las comparaciones del parser sean por identidad
+        self.tipo = sys.intern(tipo)
         self.valor = valor
         self.linea = linea
         self.columna = columna
-        self.valido = tipo not in ("NumeroInvalido", "TokenNoReconocido")
+        # Posiciones absolutas (en caracteres) dentro del código fuente
+        self.inicio = inicio
+        self.fin = fin
+
+    @property
+    def valido(self):
+        return self.tipo not in TIPOS_INVALIDOS
 
     def print_token(self):
-        return f"N.Linea: {self.linea} Col: {self.columna} Token: {self.tipo} Valor: {self.valor} Descripcion: {'VALIDO' if self.valido else 'NO VALIDO'}"
\ No newline at end of file
+        return f"N.Linea: {self.linea} Col: {self.columna} Token: {self.tipo} Valor: {self.valor} Descripcion: {'VALIDO' if self.valido else 'NO VALIDO'}"
@@ -0,0 +1,83 @@
+import sys
+from array import array
+
+from Objetos.Token import Token
+
+# Registro global de tipos de token: nombre <-> código entero
+TIPOS_TOKEN = []
+CODIGOS_TOKEN = {}
+
+
+def codigo_tipo(tipo):
+    """Retorna el código entero de un tipo de token, registrándolo si es nuevo"""
+    codigo = CODIGOS_TOKEN.get(tipo)
+    if codigo is None:
+        codigo = len(TIPOS_TOKEN)
+        TIPOS_TOKEN.append(sys.intern(tipo))
+        CODIGOS_TOKEN[tipo] = codigo
+    return codigo
+
+
+class TokenStream:
+    """Flujo de tokens compacto (estructura de arreglos).
+
+    En lugar de un objeto `Token` por lexema guarda arreglos paralelos con el código
+    del tipo, las posiciones de inicio/fin, la línea y la columna. El valor se corta
+    del código fuente solo cuando se pide. Indexar el flujo retorna un `Token`
+    equivalente al de `Lexico.tokenize`, así que `Sintactico` lo consume sin cambios.
+    """
+    __slots__ = ("fuente", "tipos", "inicios", "fines", "lineas", "columnas", "_cache")
+
+    TAM_CACHE = 8
+
+    def __init__(self, fuente):
+        self.fuente = fuente
+        self.tipos = array("B")
+        self.inicios = array("I")
+        self.fines = array("I")
+        self.lineas = array("I")
+        self.columnas = array("I")
+        self._cache = {}
+
+    def agregar(self, codigo, inicio, fin, linea, columna):
+        self.tipos.append(codigo)
+        self.inicios.append(inicio)
+        self.fines.append(fin)
+        self.lineas.append(linea)
+        self.columnas.append(columna)
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        token = self._cache.get(indice)
+        if token is None:
+            if len(self._cache) >= self.TAM_CACHE:
+                self._cache.clear()
+            token = Token(TIPOS_TOKEN[self.tipos[indice]], self.valor_en(indice),
+                          self.lineas[indice], self.columnas[indice],
+                          self.inicios[indice], self.fines[indice])
+            self._cache[indice] = token
+        return token
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def codigo_en(self, indice):
+        """Código entero del tipo del token (sin crear el objeto Token)"""
+        return self.tipos[indice]
+
+    def tipo_en(self, indice):
+        return TIPOS_TOKEN[self.tipos[indice]]
+
+    def valor_en(self, indice):
+        return self.fuente[self.inicios[indice]:self.fines[indice]]
+
+    def tamano_bytes(self):
+        """Memoria aproximada ocupada por los arreglos"""
+        return sum(a.itemsize * len(a) for a in (self.tipos, self.inicios, self.fines, self.lineas, self.columnas))
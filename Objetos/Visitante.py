@@ -0,0 +1,97 @@
+from Objetos.Nodo import TIPOS_NODO
+
+# Lo que retorna un `entrar_*` para no visitar los hijos del nodo
+PODAR = object()
+
+
+class Visitante:
+    """Base de las pasadas sobre el AST, con el método de cada tipo de nodo buscado una sola vez.
+
+    `recorrer(raiz)` visita el árbol en preorden sin recursión. Por cada nodo
+    llama a `entrar_<Tipo>(nodo)` antes de sus hijos y a `salir_<Tipo>(nodo)`
+    después (o a `entrar_nodo`/`salir_nodo` si la subclase no define el de ese
+    tipo). `entrar_*` puede retornar un nodo, que reemplaza al visitado y cuyos
+    hijos se visitan, o PODAR para no bajar a los hijos; `salir_*` puede
+    retornar un nodo que reemplaza al visitado en su padre. Los hijos None se
+    saltan.
+
+    `despachar(nodo)` llama a `visitar_<Tipo>(nodo)` (o `visitar_nodo`) y
+    retorna su resultado, para analizadores que calculan un valor por nodo.
+
+    Los métodos se guardan por clase de visitante y clase entera de nodo
+    (`Nodo.clase`), así que despachar no compara cadenas ni usa getattr.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._metodos = {"entrar_": {}, "salir_": {}, "visitar_": {}}
+
+    _metodos = {"entrar_": {}, "salir_": {}, "visitar_": {}}
+
+    @classmethod
+    def _metodo(cls, prefijo, clase):
+        """Función `<prefijo><Tipo>` de la clase para la clase de nodo, o la genérica `<prefijo>nodo`"""
+        metodos = cls._metodos[prefijo]
+        funcion = metodos.get(clase)
+        if funcion is None:
+            funcion = getattr(cls, prefijo + TIPOS_NODO[clase], None) or getattr(cls, prefijo + "nodo")
+            metodos[clase] = funcion
+        return funcion
+
+    def entrar_nodo(self, nodo):
+        return None
+
+    def salir_nodo(self, nodo):
+        return None
+
+    def visitar_nodo(self, nodo):
+        return None
+
+    def despachar(self, nodo):
+        funcion = self._metodos["visitar_"].get(nodo.clase) or self._metodo("visitar_", nodo.clase)
+        return funcion(self, nodo)
+
+    def recorrer(self, raiz):
+        """Visita el árbol desde `raiz` y retorna la raíz (o lo que la reemplazó)"""
+        entradas = self._metodos["entrar_"]
+        salidas = self._metodos["salir_"]
+        pila = []  # [nodo, hijos, índice del hijo visitado, hijos resultantes, algún hijo cambió]
+        nodo = raiz
+        while True:
+            # Bajar: entrar al nodo y, si tiene hijos, pasar al primero
+            if nodo is not None:
+                funcion = entradas.get(nodo.clase) or self._metodo("entrar_", nodo.clase)
+                reemplazo = funcion(self, nodo)
+                if reemplazo is not PODAR:
+                    if reemplazo is not None:
+                        nodo = reemplazo
+                    hijos = nodo.hijos
+                    if hijos:
+                        pila.append([nodo, hijos, 0, [], False])
+                        nodo = hijos[0]
+                        continue
+
+            # Subir: salir del nodo, dárselo al padre y seguir con el siguiente hermano
+            while True:
+                if nodo is not None:
+                    funcion = salidas.get(nodo.clase) or self._metodo("salir_", nodo.clase)
+                    reemplazo = funcion(self, nodo)
+                    if reemplazo is not None:
+                        nodo = reemplazo
+                if not pila:
+                    return nodo
+                marco = pila[-1]
+                hijos = marco[1]
+                indice = marco[2]
+                marco[3].append(nodo)
+                if nodo is not hijos[indice]:
+                    marco[4] = True
+                indice += 1
+                if indice < len(hijos):
+                    marco[2] = indice
+                    nodo = hijos[indice]
+                    break
+                pila.pop()
+                if marco[4]:
+                    marco[0].hijos = marco[3]
+                nodo = marco[0]
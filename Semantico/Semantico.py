@@ -1,8 +1,12 @@
 from Semantico.Optimizador import OptimizadorCodigo
 from Semantico.ErrorSemantico import ErrorSemantico
 from Semantico.TablaSemantica import TablaSemantica
+from Objetos.Bitacora import Bitacora, INFO
+from Objetos.Visitante import Visitante
 
-class AnalizadorSemantico:
+bitacora = Bitacora("Semántico")
+
+class AnalizadorSemantico(Visitante):
     def __init__(self, ast, tabla_simbolos):
         """
         Inicializa el analizador semántico
@@ -17,8 +21,8 @@ class AnalizadorSemantico:
         # Tabla de símbolos extendida con información semántica
         self.tabla_semantica = TablaSemantica()
         
-        # Pila de ámbitos para control de scope
-        self.ambito_actual = ["global"]
+        # Ámbito actual en el árbol de ámbitos de la tabla
+        self.ambito_actual = self.tabla_semantica.global_
         self.contador_ambito = 0
         
         # Sistema de errores
@@ -35,13 +39,11 @@ class AnalizadorSemantico:
         # Control de flujo
         self.hay_return_en_camino = False
         
-        print("[Semántico] Analizador inicializado")
+        bitacora.depuracion("inicializado", "Analizador inicializado")
     
     def analizar(self):
         """Ejecuta el análisis semántico completo"""
-        print("\n" + "="*70)
-        print("INICIANDO ANÁLISIS SEMÁNTICO")
-        print("="*70)
+        bitacora.info("inicio", "Iniciando análisis semántico")
         
         # Fase 1: Construir tabla semántica desde la tabla sintáctica
         self._construir_tabla_semantica()
@@ -59,10 +61,10 @@ class AnalizadorSemantico:
     
     def _construir_tabla_semantica(self):
         """Construye la tabla semántica desde la tabla sintáctica"""
-        print("\n[Semántico] Construyendo tabla semántica...")
+        bitacora.depuracion("tabla.inicio", "Construyendo tabla semántica...")
         
-        simbolos = self.tabla_sintactico.listar()
-        for simbolo in simbolos:
+        # Se recorre la tabla sin copiarla: los símbolos en archivo se leen por lotes
+        for simbolo in self.tabla_sintactico.iterar():
             info_semantica = {
                 "identificador": simbolo.get("identificador"),
                 "tipo": simbolo.get("tipo_dato"),
@@ -84,62 +86,30 @@ class AnalizadorSemantico:
             
             self.tabla_semantica.agregar(info_semantica["identificador"], info_semantica)
         
-        print(f"[Semántico] Tabla semántica construida: {len(self.tabla_semantica.simbolos)} símbolos")
+        bitacora.info("tabla.construida", "Tabla semántica construida: {simbolos} símbolos",
+                      simbolos=len(self.tabla_semantica.simbolos))
     
     def _analizar_nodo(self, nodo):
-        """Analiza recursivamente un nodo del AST"""
+        """Analiza un nodo del AST con el método `visitar_<Tipo>` de su tipo y retorna su tipo de dato"""
         if not nodo:
             return None
-        
-        tipo_nodo = nodo.tipo
-        
-        # Declaraciones
-        if tipo_nodo == "Programa":
-            return self._analizar_programa(nodo)
-        elif tipo_nodo == "DeclaracionVariable":
-            return self._analizar_declaracion_variable(nodo)
-        elif tipo_nodo == "FuncionDeclarada":
-            return self._analizar_funcion(nodo)
-        elif tipo_nodo == "Modelo":
-            return self._analizar_modelo(nodo)
-        
-        # Instrucciones
-        elif tipo_nodo == "Asignacion":
-            return self._analizar_asignacion(nodo)
-        elif tipo_nodo == "If":
-            return self._analizar_if(nodo)
-        elif tipo_nodo == "While":
-            return self._analizar_while(nodo)
-        elif tipo_nodo == "ForRango" or tipo_nodo == "ForIter":
-            return self._analizar_for(nodo)
-        elif tipo_nodo == "Return":
-            return self._analizar_return(nodo)
-        elif tipo_nodo == "LlamadaFuncion" or tipo_nodo == "LlamadaFuncionIO":
-            return self._analizar_llamada_funcion(nodo)
-        
-        # Expresiones
-        elif tipo_nodo == "Operacion":
-            return self._analizar_operacion_aritmetica(nodo)
-        elif tipo_nodo == "OperacionLogica":
-            return self._analizar_operacion_logica(nodo)
-        elif tipo_nodo == "OperacionRelacional":
-            return self._analizar_operacion_relacional(nodo)
-        elif tipo_nodo == "Identificador":
-            return self._analizar_identificador(nodo)
-        elif tipo_nodo == "Numero":
-            return self._inferir_tipo_numero(nodo.valor)
-        elif tipo_nodo == "Cadena":
-            return "string"
-        elif tipo_nodo == "Booleano":
-            return "bool"
-        
-        # Recorrer hijos si no se maneja específicamente
-        if hasattr(nodo, 'hijos') and nodo.hijos:
-            for hijo in nodo.hijos:
-                self._analizar_nodo(hijo)
-        
+        return self.despachar(nodo)
+    
+    def visitar_nodo(self, nodo):
+        """Nodos sin análisis propio: se recorren sus hijos"""
+        for hijo in nodo.hijos:
+            self._analizar_nodo(hijo)
         return None
     
+    def visitar_Numero(self, nodo):
+        return self._inferir_tipo_numero(nodo.valor)
+    
+    def visitar_Cadena(self, nodo):
+        return "string"
+    
+    def visitar_Booleano(self, nodo):
+        return "bool"
+    
     
     def _verificar_tipos_compatibles(self, tipo1, tipo2, operacion="asignación"):
         """Verifica si dos tipos son compatibles para una operación"""
@@ -216,36 +186,28 @@ class AnalizadorSemantico:
     def _entrar_ambito(self, nombre_ambito):
         """Entra a un nuevo ámbito"""
         self.contador_ambito += 1
-        nuevo_ambito = f"{nombre_ambito}_{self.contador_ambito}"
-        self.ambito_actual.append(nuevo_ambito)
-        print(f"[Semántico] Entrando a ámbito: {'.'.join(self.ambito_actual)}")
+        self.ambito_actual = self.tabla_semantica.crear_hijo(self.ambito_actual, f"{nombre_ambito}_{self.contador_ambito}")
+        bitacora.depuracion("ambito.entrar", "Entrando a ámbito: {ambito}", ambito=self.ambito_actual.nombre,
+                            id=self.ambito_actual.id)
     
     def _salir_ambito(self):
         """Sale del ámbito actual"""
-        if len(self.ambito_actual) > 1:
-            ambito_salido = self.ambito_actual.pop()
-            print(f"[Semántico] Saliendo de ámbito: {ambito_salido}")
+        if self.ambito_actual.padre is not None:
+            bitacora.depuracion("ambito.salir", "Saliendo de ámbito: {ambito}", ambito=self.ambito_actual.nombre,
+                                id=self.ambito_actual.id)
+            self.ambito_actual = self.ambito_actual.padre
     
     def _obtener_ambito_completo(self):
-        """Retorna el ámbito actual completo"""
-        return ".".join(self.ambito_actual)
-    
-    def _verificar_declaracion_previa(self, identificador):
-        """Verifica si un identificador fue declarado antes de usarse"""
-        simbolo = self.tabla_semantica.buscar(identificador, self._obtener_ambito_completo())
-        if not simbolo:
-            # Buscar en ámbitos superiores
-            for i in range(len(self.ambito_actual) - 1, -1, -1):
-                ambito_parcial = ".".join(self.ambito_actual[:i+1])
-                simbolo = self.tabla_semantica.buscar(identificador, ambito_parcial)
-                if simbolo:
-                    return True
-            return False
-        return True
+        """Retorna la ruta del ámbito actual"""
+        return self.ambito_actual.nombre
     
-    def _verificar_declaracion_duplicada(self, identificador, ambito):
-        """Verifica si hay declaración duplicada en el mismo ámbito"""
-        return self.tabla_semantica.existe_en_ambito(identificador, ambito)
+    def _resolver(self, identificador):
+        """Símbolo visible con ese identificador desde el ámbito actual, o None si no fue declarado"""
+        return self.tabla_semantica.resolver(identificador, self.ambito_actual)
+    
+    def _verificar_declaracion_duplicada(self, identificador):
+        """Verifica si hay declaración duplicada en el ámbito actual"""
+        return identificador in self.ambito_actual.simbolos
     
     def _analizar_funcion(self, nodo):
         """Analiza declaración de función"""
@@ -383,7 +345,7 @@ class AnalizadorSemantico:
                     valor_inicial = hijo
         
         # Verificar declaración duplicada
-        if self._verificar_declaracion_duplicada(nombre_var, self._obtener_ambito_completo()):
+        if self._verificar_declaracion_duplicada(nombre_var):
             self.errores.agregar_error(
                 "declaración",
                 f"Variable '{nombre_var}' ya declarada en este ámbito",
@@ -422,8 +384,9 @@ class AnalizadorSemantico:
         identificador = partes[0]
         operador = partes[1]
         
-        # Verificar que la variable existe
-        if not self._verificar_declaracion_previa(identificador):
+        # Verificar que la variable existe y obtener su tipo
+        simbolo = self._resolver(identificador)
+        if simbolo is None:
             self.errores.agregar_error(
                 "declaración",
                 f"Variable '{identificador}' no declarada",
@@ -431,11 +394,6 @@ class AnalizadorSemantico:
             )
             return None
         
-        # Obtener tipo de la variable
-        simbolo = self.tabla_semantica.buscar_en_ambitos(identificador, self.ambito_actual)
-        if not simbolo:
-            return None
-        
         tipo_var = simbolo["tipo"]
         
         # Analizar expresión del lado derecho
@@ -631,7 +589,8 @@ class AnalizadorSemantico:
         """Analiza uso de identificador"""
         nombre = nodo.valor
         
-        if not self._verificar_declaracion_previa(nombre):
+        simbolo = self._resolver(nombre)
+        if simbolo is None:
             self.errores.agregar_error(
                 "declaración",
                 f"Variable '{nombre}' no declarada",
@@ -639,10 +598,6 @@ class AnalizadorSemantico:
             )
             return None
         
-        simbolo = self.tabla_semantica.buscar_en_ambitos(nombre, self.ambito_actual)
-        if not simbolo:
-            return None
-        
         # Verificar inicialización
         if not simbolo.get("inicializado", False):
             self.errores.agregar_error(
@@ -665,10 +620,29 @@ class AnalizadorSemantico:
         
         self._salir_ambito()
     
+    # Método de análisis de cada tipo de nodo (los que no están usan `visitar_nodo`)
+    # Declaraciones
+    visitar_Programa = _analizar_programa
+    visitar_DeclaracionVariable = _analizar_declaracion_variable
+    visitar_FuncionDeclarada = _analizar_funcion
+    visitar_Modelo = _analizar_modelo
+    # Instrucciones
+    visitar_Asignacion = _analizar_asignacion
+    visitar_If = _analizar_if
+    visitar_While = _analizar_while
+    visitar_ForRango = visitar_ForIter = _analizar_for
+    visitar_Return = _analizar_return
+    visitar_LlamadaFuncion = visitar_LlamadaFuncionIO = _analizar_llamada_funcion
+    # Expresiones
+    visitar_Operacion = _analizar_operacion_aritmetica
+    visitar_OperacionLogica = _analizar_operacion_logica
+    visitar_OperacionRelacional = _analizar_operacion_relacional
+    visitar_Identificador = _analizar_identificador
+    
 
     def _validaciones_finales(self):
       
-        print("\n[Semántico] Ejecutando validaciones finales...")
+        bitacora.depuracion("validaciones", "Ejecutando validaciones finales...")
         
         # Verificar variables declaradas pero no usadas
         for nombre, simbolo in self.tabla_semantica.simbolos.items():
@@ -680,28 +654,26 @@ class AnalizadorSemantico:
     
     def _generar_reporte(self):
         """Genera reporte de análisis semántico"""
-        print("\n" + "="*70)
-        print("REPORTE DE ANÁLISIS SEMÁNTICO")
-        print("="*70)
-        
+        if not bitacora.habilitada(INFO):
+            return
         errores = self.errores.obtener_errores()
         advertencias = self.errores.obtener_advertencias()
         
+        lineas = ["Reporte de análisis semántico"]
         if errores:
-            print(f"\nERRORES ENCONTRADOS: {len(errores)}")
-            for error in errores:  
-                print(f"   • {error}")
+            lineas.append(f"ERRORES ENCONTRADOS: {len(errores)}")
+            lineas.extend(f"   • {error}" for error in errores[:10])
             if len(errores) > 10:
-                print(f"   ... y {len(errores) - 10} errores más")
+                lineas.append(f"   ... y {len(errores) - 10} errores más")
         else:
-            print("\nNo se encontraron errores semánticos")
+            lineas.append("No se encontraron errores semánticos")
         
         if advertencias:
-            print(f"\nADVERTENCIAS: {len(advertencias)}")
-            for adv in advertencias[:5]:
-                print(f"   • {adv}")
+            lineas.append(f"ADVERTENCIAS: {len(advertencias)}")
+            lineas.extend(f"   • {adv}" for adv in advertencias[:5])
         
-        print("\n" + "="*70)
+        # El texto va como campo para que las llaves de los mensajes no se tomen como campos
+        bitacora.info("reporte", "{texto}", texto="\n".join(lineas), errores=errores, advertencias=advertencias)
     
     def _calcular_tamano_tipo(self, tipo):
         """Calcula el tamaño en bytes de un tipo"""
@@ -716,9 +688,13 @@ class AnalizadorSemantico:
         return tamanos.get(tipo, 4)
     
 
-def ejecutar_analisis_semantico(ast, tabla_simbolos, optimizar=False):
-   
-    analizador = AnalizadorSemantico(ast, tabla_simbolos)
+def ejecutar_analisis_semantico(ast, tabla_simbolos, optimizar=False, iterativo=False):
+    """Analiza el AST y opcionalmente lo optimiza; con `iterativo` usa el analizador sin recursión (ASTs muy profundos)"""
+    if iterativo:
+        from Semantico.SemanticoIterativo import AnalizadorSemanticoIterativo
+        analizador = AnalizadorSemanticoIterativo(ast, tabla_simbolos)
+    else:
+        analizador = AnalizadorSemantico(ast, tabla_simbolos)
     errores = analizador.analizar()
     
     ast_final = ast
@@ -730,9 +706,9 @@ def ejecutar_analisis_semantico(ast, tabla_simbolos, optimizar=False):
             if posible_ast:
                 ast_final = posible_ast
             else:
-                print("[Semántico] Optimización no produjo un AST válido. Se mantiene el AST original.")
+                bitacora.advertencia("optimizacion.vacia", "Optimización no produjo un AST válido. Se mantiene el AST original.")
         except Exception as e:
-            print(f"[Semántico] Error al optimizar el AST: {e}. Se mantiene el AST original.")
+            bitacora.error("optimizacion.error", "Error al optimizar el AST: {error}. Se mantiene el AST original.", error=str(e))
     
     return errores, ast_final, analizador.tabla_semantica
 
@@ -0,0 +1,377 @@
+from types import GeneratorType
+
+from Semantico.Semantico import AnalizadorSemantico
+
+
+class AnalizadorSemanticoIterativo(AnalizadorSemantico):
+    """Analizador semántico sin recursión de Python para ASTs muy profundos.
+
+    Los métodos de análisis que bajan a los hijos están reescritos como
+    generadores: en vez de llamar a `_analizar_nodo(hijo)` hacen
+    `tipo = yield hijo`, y `_analizar_nodo` corre el análisis con una pila
+    explícita de generadores y entrega a cada uno el tipo inferido del hijo que
+    pidió. Así una cadena de miles de operaciones (que el parser arma anidada
+    hacia la izquierda) solo está limitada por la memoria. Produce los mismos
+    errores, advertencias y tabla semántica que `AnalizadorSemantico`.
+    """
+
+    def _analizar_nodo(self, nodo):
+        """Analiza `nodo` y sus descendientes con una pila explícita y retorna su tipo de dato"""
+        pila = []
+        while True:
+            # Analizar el nodo pedido: los métodos generadores se apilan, el resto da su tipo directo
+            valor = self.despachar(nodo) if nodo else None
+            if type(valor) is GeneratorType:
+                pila.append(valor)
+                valor = None
+            elif not pila:
+                return valor
+            # Entregar el tipo al generador de arriba hasta que pida otro nodo
+            while True:
+                try:
+                    nodo = pila[-1].send(valor)
+                    break
+                except StopIteration as fin:
+                    pila.pop()
+                    valor = fin.value
+                    if not pila:
+                        return valor
+
+    def visitar_nodo(self, nodo):
+        for hijo in nodo.hijos:
+            yield hijo
+        return None
+
+    def _analizar_funcion(self, nodo):
+        nombre_func = nodo.valor
+        self.funcion_actual = nombre_func
+        self.hay_return_en_camino = False
+
+        tipo_retorno = None
+        parametros = []
+
+        if hasattr(nodo, 'hijos') and nodo.hijos:
+            for hijo in nodo.hijos:
+                if hijo.tipo == "TipoRetorno":
+                    tipo_retorno = hijo.valor
+                elif hijo.tipo == "Params":
+                    parametros = self._extraer_parametros(hijo)
+
+        self.funciones[nombre_func] = {
+            "tipo_retorno": tipo_retorno or "void",
+            "parametros": parametros,
+            "tiene_return": False
+        }
+
+        self._entrar_ambito(f"func_{nombre_func}")
+
+        for param in parametros:
+            self.tabla_semantica.agregar(param["nombre"], {
+                "identificador": param["nombre"],
+                "tipo": param["tipo"],
+                "categoria": "parámetro",
+                "ambito": self._obtener_ambito_completo(),
+                "inicializado": True
+            })
+
+        if hasattr(nodo, 'hijos'):
+            for hijo in nodo.hijos:
+                if hijo.tipo not in ["TipoRetorno", "Params"]:
+                    yield hijo
+
+        if tipo_retorno and tipo_retorno != "void" and not self.hay_return_en_camino:
+            self.errores.agregar_error(
+                "función",
+                f"La función '{nombre_func}' debe retornar un valor de tipo '{tipo_retorno}'",
+                nodo.valor if hasattr(nodo, 'valor') else None
+            )
+
+        self._salir_ambito()
+        self.funcion_actual = None
+        return tipo_retorno
+
+    def _validar_llamada_funcion(self, nombre, argumentos):
+        if nombre not in self.funciones:
+            if nombre in ["print", "println", "input", "readInt", "readFloat"]:
+                return "void" if nombre in ["print", "println"] else "string"
+
+            self.errores.agregar_error(
+                "función",
+                f"Función '{nombre}' no declarada",
+                nombre
+            )
+            return None
+
+        func_info = self.funciones[nombre]
+        params_esperados = func_info["parametros"]
+
+        if len(argumentos) != len(params_esperados):
+            self.errores.agregar_error(
+                "función",
+                f"La función '{nombre}' espera {len(params_esperados)} argumentos pero recibió {len(argumentos)}",
+                nombre
+            )
+            return func_info["tipo_retorno"]
+
+        for i, (arg, param) in enumerate(zip(argumentos, params_esperados)):
+            tipo_arg = yield arg
+            tipo_esperado = param["tipo"]
+
+            if not self._verificar_tipos_compatibles(tipo_arg, tipo_esperado):
+                self.errores.agregar_error(
+                    "tipo",
+                    f"Argumento {i+1} de '{nombre}': se esperaba '{tipo_esperado}' pero se recibió '{tipo_arg}'",
+                    nombre
+                )
+
+        return func_info["tipo_retorno"]
+
+    def _analizar_programa(self, nodo):
+        if hasattr(nodo, 'hijos'):
+            for hijo in nodo.hijos:
+                yield hijo
+
+    def _analizar_declaracion_variable(self, nodo):
+        nombre_var = nodo.valor
+        tipo_var = None
+        valor_inicial = None
+
+        if hasattr(nodo, 'hijos'):
+            for hijo in nodo.hijos:
+                if hijo.tipo == "Tipo":
+                    tipo_var = hijo.valor
+                elif hijo.tipo not in ["Modificadores"]:
+                    valor_inicial = hijo
+
+        if self._verificar_declaracion_duplicada(nombre_var):
+            self.errores.agregar_error(
+                "declaración",
+                f"Variable '{nombre_var}' ya declarada en este ámbito",
+                nombre_var
+            )
+
+        if valor_inicial:
+            tipo_valor = yield valor_inicial
+            if tipo_valor and not self._verificar_tipos_compatibles(tipo_var, tipo_valor):
+                self.errores.agregar_error(
+                    "tipo",
+                    f"No se puede asignar '{tipo_valor}' a variable de tipo '{tipo_var}'",
+                    nombre_var
+                )
+
+        self.tabla_semantica.agregar(nombre_var, {
+            "identificador": nombre_var,
+            "tipo": tipo_var,
+            "categoria": "variable",
+            "ambito": self._obtener_ambito_completo(),
+            "inicializado": valor_inicial is not None,
+            "referencias": 0
+        })
+
+        return tipo_var
+
+    def _analizar_asignacion(self, nodo):
+        partes = nodo.valor.split() if nodo.valor else []
+        if len(partes) < 2:
+            return None
+
+        identificador = partes[0]
+
+        simbolo = self._resolver(identificador)
+        if simbolo is None:
+            self.errores.agregar_error(
+                "declaración",
+                f"Variable '{identificador}' no declarada",
+                identificador
+            )
+            return None
+
+        tipo_var = simbolo["tipo"]
+
+        tipo_expresion = None
+        if hasattr(nodo, 'hijos') and nodo.hijos:
+            tipo_expresion = yield nodo.hijos[0]
+
+        if tipo_expresion and not self._verificar_tipos_compatibles(tipo_var, tipo_expresion):
+            self.errores.agregar_error(
+                "tipo",
+                f"No se puede asignar '{tipo_expresion}' a '{identificador}' de tipo '{tipo_var}'",
+                identificador
+            )
+
+        simbolo["inicializado"] = True
+        simbolo["referencias"] += 1
+
+        return tipo_var
+
+    def _analizar_if(self, nodo):
+        if hasattr(nodo, 'hijos') and len(nodo.hijos) >= 2:
+            tipo_condicion = yield nodo.hijos[0]
+            if tipo_condicion and tipo_condicion != "bool":
+                self.errores.agregar_error(
+                    "tipo",
+                    f"La condición del if debe ser booleana, se encontró '{tipo_condicion}'",
+                    "if"
+                )
+
+            for hijo in nodo.hijos[1:]:
+                yield hijo
+
+    def _analizar_while(self, nodo):
+        if hasattr(nodo, 'hijos') and len(nodo.hijos) >= 2:
+            tipo_condicion = yield nodo.hijos[0]
+            if tipo_condicion and tipo_condicion != "bool":
+                self.errores.agregar_error(
+                    "tipo",
+                    f"La condición del while debe ser booleana, se encontró '{tipo_condicion}'",
+                    "while"
+                )
+
+            self._entrar_ambito("while")
+            yield nodo.hijos[1]
+            self._salir_ambito()
+
+    def _analizar_for(self, nodo):
+        self._entrar_ambito("for")
+        if hasattr(nodo, 'hijos'):
+            for hijo in nodo.hijos:
+                yield hijo
+        self._salir_ambito()
+
+    def _analizar_return(self, nodo):
+        self.hay_return_en_camino = True
+
+        if not self.funcion_actual:
+            self.errores.agregar_error(
+                "función",
+                "Return fuera de una función",
+                "return"
+            )
+            return None
+
+        func_info = self.funciones.get(self.funcion_actual)
+        if not func_info:
+            return None
+
+        tipo_retorno_esperado = func_info["tipo_retorno"]
+
+        if hasattr(nodo, 'hijos') and nodo.hijos and nodo.hijos[0]:
+            tipo_retorno_real = yield nodo.hijos[0]
+        else:
+            tipo_retorno_real = "void"
+
+        if tipo_retorno_esperado == "void" and tipo_retorno_real != "void":
+            self.errores.agregar_error(
+                "tipo",
+                f"Función '{self.funcion_actual}' no debe retornar un valor",
+                self.funcion_actual
+            )
+        elif tipo_retorno_esperado != "void":
+            if not tipo_retorno_real or tipo_retorno_real == "void":
+                self.errores.agregar_error(
+                    "tipo",
+                    f"Función '{self.funcion_actual}' debe retornar un valor de tipo '{tipo_retorno_esperado}'",
+                    self.funcion_actual
+                )
+            elif not self._verificar_tipos_compatibles(tipo_retorno_esperado, tipo_retorno_real):
+                self.errores.agregar_error(
+                    "tipo",
+                    f"Tipo de retorno incompatible: se esperaba '{tipo_retorno_esperado}' pero se encontró '{tipo_retorno_real}'",
+                    self.funcion_actual
+                )
+
+        func_info["tiene_return"] = True
+        return tipo_retorno_real
+
+    def _analizar_llamada_funcion(self, nodo):
+        argumentos = nodo.hijos if hasattr(nodo, 'hijos') else []
+        return (yield from self._validar_llamada_funcion(nodo.valor, argumentos))
+
+    def _analizar_operacion_aritmetica(self, nodo):
+        if not hasattr(nodo, 'hijos') or len(nodo.hijos) < 2:
+            return None
+
+        tipo_izq = yield nodo.hijos[0]
+        tipo_der = yield nodo.hijos[1]
+        operador = nodo.valor
+
+        if not self._verificar_operacion_valida(operador, tipo_izq, tipo_der):
+            self.errores.agregar_error(
+                "tipo",
+                f"Operador '{operador}' no válido para tipos '{tipo_izq}' y '{tipo_der}'",
+                operador
+            )
+            return None
+
+        return self._inferir_tipo_resultado(operador, tipo_izq, tipo_der)
+
+    def _analizar_operacion_logica(self, nodo):
+        operador = nodo.valor
+
+        if not hasattr(nodo, 'hijos') or not nodo.hijos:
+            return None
+
+        if operador in ['!', 'not', 'NOT']:
+            tipo = yield nodo.hijos[0]
+            if not self._verificar_operacion_valida(operador, tipo):
+                self.errores.agregar_error(
+                    "tipo",
+                    f"Operador '{operador}' requiere operando booleano, se encontró '{tipo}'",
+                    operador
+                )
+            return "bool"
+
+        if len(nodo.hijos) < 2:
+            return None
+
+        tipo_izq = yield nodo.hijos[0]
+        tipo_der = yield nodo.hijos[1]
+
+        if not self._verificar_operacion_valida(operador, tipo_izq, tipo_der):
+            self.errores.agregar_error(
+                "tipo",
+                f"Operador '{operador}' requiere operandos booleanos, se encontró '{tipo_izq}' y '{tipo_der}'",
+                operador
+            )
+        return "bool"
+
+    def _analizar_operacion_relacional(self, nodo):
+        if not hasattr(nodo, 'hijos') or len(nodo.hijos) < 2:
+            return None
+
+        tipo_izq = yield nodo.hijos[0]
+        tipo_der = yield nodo.hijos[1]
+        operador = nodo.valor
+
+        if not self._verificar_operacion_valida(operador, tipo_izq, tipo_der):
+            self.errores.agregar_error(
+                "tipo",
+                f"Operador '{operador}' no válido para tipos '{tipo_izq}' y '{tipo_der}'",
+                operador
+            )
+
+        return "bool"
+
+    def _analizar_modelo(self, nodo):
+        self._entrar_ambito(f"model_{nodo.valor}")
+
+        if hasattr(nodo, 'hijos'):
+            for hijo in nodo.hijos:
+                yield hijo
+
+        self._salir_ambito()
+
+    # Los alias de la clase base apuntan a sus métodos recursivos: se repiten con los generadores
+    visitar_Programa = _analizar_programa
+    visitar_DeclaracionVariable = _analizar_declaracion_variable
+    visitar_FuncionDeclarada = _analizar_funcion
+    visitar_Modelo = _analizar_modelo
+    visitar_Asignacion = _analizar_asignacion
+    visitar_If = _analizar_if
+    visitar_While = _analizar_while
+    visitar_ForRango = visitar_ForIter = _analizar_for
+    visitar_Return = _analizar_return
+    visitar_LlamadaFuncion = visitar_LlamadaFuncionIO = _analizar_llamada_funcion
+    visitar_Operacion = _analizar_operacion_aritmetica
+    visitar_OperacionLogica = _analizar_operacion_logica
+    visitar_OperacionRelacional = _analizar_operacion_relacional
@@ -1,37 +1,90 @@
-from collections import defaultdict
+class Ambito:
+    """Nodo del árbol de ámbitos: id entero, ámbito padre y los símbolos declarados en él"""
+
+    __slots__ = ("id", "nombre", "padre", "simbolos")
+
+    def __init__(self, id, nombre, padre=None):
+        self.id = id
+        self.nombre = nombre  # Ruta completa, p. ej. "global.func_f_1.while_2"
+        self.padre = padre
+        self.simbolos = {}
+
+    def __repr__(self):
+        return f"Ambito({self.id}, {self.nombre!r})"
 
 
 class TablaSemantica:
-    """Tabla de símbolos extendida con información semántica"""
-    
+    """Tabla de símbolos extendida con información semántica.
+
+    Los ámbitos forman un árbol: cada uno tiene un id entero (su posición en
+    `lista_ambitos`), un puntero a su padre y su propio diccionario de
+    símbolos. `resolver` sube por los padres con una búsqueda en diccionario
+    por nivel, sin armar cadenas. Los ámbitos también se pueden pedir por su
+    ruta ("global.func_f_1"), que es lo que guarda `info['ambito']`.
+    """
+
     def __init__(self):
         self.simbolos = {}
-        self.ambitos = defaultdict(dict)
-    
+        self.ambitos = {}  # ruta -> Ambito
+        self.lista_ambitos = []  # id -> Ambito
+        self.global_ = self.ambito("global")
+
+    def _crear_ambito(self, nombre, padre):
+        ambito = Ambito(len(self.lista_ambitos), nombre, padre)
+        self.lista_ambitos.append(ambito)
+        self.ambitos[nombre] = ambito
+        return ambito
+
+    def ambito(self, nombre):
+        """Retorna el ámbito con esa ruta, creándolo (y a sus ancestros) si no existe"""
+        ambito = self.ambitos.get(nombre)
+        if ambito is None:
+            ruta_padre, _, _ = nombre.rpartition(".")
+            ambito = self._crear_ambito(nombre, self.ambito(ruta_padre) if ruta_padre else None)
+        return ambito
+
+    def crear_hijo(self, padre, nombre):
+        """Crea (o retorna, si ya existe) el ámbito `nombre` dentro de `padre`"""
+        ruta = f"{padre.nombre}.{nombre}"
+        return self.ambitos.get(ruta) or self._crear_ambito(ruta, padre)
+
     def agregar(self, identificador, info):
         """Agrega un símbolo con su información semántica completa"""
         clave = f"{info['ambito']}.{identificador}"
         self.simbolos[clave] = info
-        self.ambitos[info['ambito']][identificador] = info
-    
+        self.ambito(info['ambito']).simbolos[identificador] = info
+
     def buscar(self, identificador, ambito):
-        """Busca un símbolo en un ámbito específico"""
+        """Busca un símbolo en un ámbito específico (por su ruta)"""
         clave = f"{ambito}.{identificador}"
         return self.simbolos.get(clave)
-    
-    def buscar_en_ambitos(self, identificador, pila_ambitos):
-        """Busca un símbolo en la pila de ámbitos (del más interno al más externo)"""
-        for i in range(len(pila_ambitos), 0, -1):
-            ambito = ".".join(pila_ambitos[:i])
-            simbolo = self.buscar(identificador, ambito)
-            if simbolo:
+
+    def resolver(self, identificador, ambito):
+        """Busca un símbolo desde el ámbito `ambito` (objeto o id) subiendo por sus padres"""
+        if isinstance(ambito, int):
+            ambito = self.lista_ambitos[ambito]
+        while ambito is not None:
+            simbolo = ambito.simbolos.get(identificador)
+            if simbolo is not None:
                 return simbolo
+            ambito = ambito.padre
         return None
-    
+
+    def buscar_en_ambitos(self, identificador, pila_ambitos):
+        """Busca un símbolo en la pila de ámbitos (del más interno al más externo)"""
+        ruta = ".".join(pila_ambitos)
+        # Las rutas sin símbolos pueden no existir en el árbol: se usa el ancestro más cercano que sí
+        while ruta and ruta not in self.ambitos:
+            ruta = ruta.rpartition(".")[0]
+        return self.resolver(identificador, self.ambitos[ruta]) if ruta else None
+
     def existe_en_ambito(self, identificador, ambito):
-        """Verifica si un identificador existe en un ámbito específico"""
-        return identificador in self.ambitos[ambito]
-    
+        """Verifica si un identificador existe en un ámbito específico (objeto o ruta)"""
+        if isinstance(ambito, str):
+            ambito = self.ambitos.get(ambito)
+        return ambito is not None and identificador in ambito.simbolos
+
     def obtener_simbolos_ambito(self, ambito):
-        """Retorna todos los símbolos de un ámbito"""
-        return self.ambitos.get(ambito, {})
+        """Retorna todos los símbolos de un ámbito (por su ruta)"""
+        ambito = self.ambitos.get(ambito)
+        return ambito.simbolos if ambito is not None else {}
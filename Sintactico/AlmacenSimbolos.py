@@ -0,0 +1,321 @@
+import atexit
+import json
+import os
+import sqlite3
+import tempfile
+
+from Objetos.Nodo import Nodo
+
+# Clave con la que se guarda un Nodo dentro de un símbolo fuera de memoria
+MARCA_NODO = "\0Nodo"
+
+# Registros muertos (quitados) a partir de los cuales se reescribe el archivo
+MIN_COMPACTAR = 1024
+
+# Campos de un símbolo por los que se puede consultar el almacén
+CAMPOS_CONSULTA = ("identificador", "categoria", "ambito", "linea")
+
+# Almacenes vacíos de cada tipo que se guardan para reutilizarlos en otras tablas
+MAX_LIBRES = 4
+
+
+class AlmacenArchivo:
+    """Símbolos fuera de memoria en un archivo temporal de solo agregado.
+
+    Cada símbolo es una línea JSON y se identifica por el número que le da la
+    tabla. Se guarda en memoria la posición de cada registro vigente y un índice
+    clave -> números de los símbolos con esa clave, así que agregar escribe solo
+    los símbolos nuevos y obtener o buscar leen un solo registro. Los quitados
+    quedan como registros muertos hasta que superan a los vigentes y el archivo
+    se reescribe.
+    """
+
+    def __init__(self):
+        self.archivo = tempfile.NamedTemporaryFile(
+            mode='w+b',
+            delete=False,
+            suffix='.jsonl',
+            prefix='tabla_simbolos_'
+        )
+        self.ruta = self.archivo.name
+        self.limpiar()
+
+    def limpiar(self):
+        self.archivo.seek(0)
+        self.archivo.truncate()
+        self.archivo.flush()
+        self._desplazamientos = {}   # número -> posición del registro vigente
+        self._claves = {}            # número -> claves del símbolo
+        self._indice = {}            # clave -> {número: None}, en el orden en que llegaron
+        self.registros_muertos = 0
+
+    def __len__(self):
+        return len(self._desplazamientos)
+
+    def agregar(self, simbolos):
+        """Agrega los pares (número, símbolo) al final del archivo"""
+        lineas = [volcar_simbolo(s).encode("utf-8") + b"\n" for _, s in simbolos]
+        self.archivo.seek(0, os.SEEK_END)
+        posicion = self.archivo.tell()
+        for (numero, simbolo), linea in zip(simbolos, lineas):
+            self._desplazamientos[numero] = posicion
+            posicion += len(linea)
+            claves = claves_simbolo(simbolo)
+            self._claves[numero] = claves
+            for clave in claves:
+                self._indice.setdefault(clave, {})[numero] = None
+        self.archivo.write(b"".join(lineas))
+        self.archivo.flush()
+
+    def obtener(self, numero):
+        self.archivo.seek(self._desplazamientos[numero])
+        return cargar_simbolo(self.archivo.readline())
+
+    def leer_varios(self, numeros):
+        """Retorna {número: símbolo} leyendo los registros en el orden en que están en el archivo"""
+        leidos = {}
+        for numero in sorted(numeros, key=self._desplazamientos.__getitem__):
+            leidos[numero] = self.obtener(numero)
+        return leidos
+
+    def buscar(self, clave):
+        """Retorna (número, símbolo) del primer símbolo guardado con esa clave, o None"""
+        numeros = self._indice.get(clave)
+        if not numeros:
+            return None
+        numero = next(iter(numeros))
+        return numero, self.obtener(numero)
+
+    def leer(self):
+        """Itera los pares (número, símbolo) vigentes leyendo el archivo de una pasada"""
+        self.archivo.flush()
+        self.archivo.seek(0)
+        numeros = {d: n for n, d in self._desplazamientos.items()}
+        vigentes = []
+        posicion = 0
+        for linea in self.archivo:
+            numero = numeros.get(posicion)
+            if numero is not None:
+                vigentes.append((numero, linea))
+            posicion += len(linea)
+        return ((numero, cargar_simbolo(linea)) for numero, linea in vigentes)
+
+    def consultar(self, campos):
+        return ((n, s) for n, s in self.leer() if all(s.get(k) == v for k, v in campos.items()))
+
+    def quitar(self, numeros):
+        """Quita los símbolos con esos números (sus registros quedan muertos)"""
+        for numero in numeros:
+            del self._desplazamientos[numero]
+            for clave in self._claves.pop(numero):
+                del self._indice[clave][numero]
+                if not self._indice[clave]:
+                    del self._indice[clave]
+        self.registros_muertos += len(numeros)
+        if self.registros_muertos >= max(MIN_COMPACTAR, len(self._desplazamientos)):
+            self._compactar()
+
+    def _compactar(self):
+        """Reescribe el archivo solo con los símbolos vigentes"""
+        simbolos = list(self.leer())
+        self.limpiar()
+        self.agregar(simbolos)
+
+    def cerrar(self):
+        """Cierra y borra el archivo; retorna True si lo borró"""
+        self.archivo.close()
+        if os.path.exists(self.ruta):
+            os.unlink(self.ruta)
+            return True
+        return False
+
+
+class AlmacenSQLite:
+    """Símbolos fuera de memoria en una base SQLite temporal.
+
+    Cada símbolo es una fila con el número que le da la tabla, las columnas
+    indexadas identificador, categoria, ambito y linea, y el símbolo completo en
+    JSON. Las inserciones van en lotes dentro de una transacción, buscar y
+    consultar son consultas por índice y `leer` itera un cursor.
+    """
+
+    ESQUEMA = """
+        PRAGMA journal_mode = OFF;
+        PRAGMA synchronous = OFF;
+        CREATE TABLE simbolos (
+            numero INTEGER PRIMARY KEY,
+            identificador TEXT,
+            categoria TEXT,
+            ambito TEXT,
+            linea INTEGER,
+            datos TEXT NOT NULL
+        );
+        CREATE INDEX simbolos_identificador ON simbolos (identificador);
+        CREATE INDEX simbolos_identificador_ambito ON simbolos (identificador, ambito);
+        CREATE INDEX simbolos_categoria ON simbolos (categoria);
+        CREATE INDEX simbolos_ambito ON simbolos (ambito);
+        CREATE INDEX simbolos_linea ON simbolos (linea);
+    """
+    INSERTAR = "INSERT INTO simbolos VALUES (?, ?, ?, ?, ?, ?)"
+
+    def __init__(self):
+        descriptor, self.ruta = tempfile.mkstemp(suffix='.sqlite3', prefix='tabla_simbolos_')
+        os.close(descriptor)
+        self.conexion = sqlite3.connect(self.ruta)
+        self.conexion.executescript(self.ESQUEMA)
+        self.cantidad = 0
+        self.registros_muertos = 0
+
+    def limpiar(self):
+        with self.conexion:
+            self.conexion.execute("DELETE FROM simbolos")
+        self.cantidad = 0
+
+    def __len__(self):
+        return self.cantidad
+
+    def agregar(self, simbolos):
+        """Agrega los pares (número, símbolo) en una sola transacción"""
+        filas = [(n, s.get("identificador"), s.get("categoria"), s.get("ambito"), s.get("linea"),
+                  volcar_simbolo(s)) for n, s in simbolos]
+        with self.conexion:
+            self.conexion.executemany(self.INSERTAR, filas)
+        self.cantidad += len(filas)
+
+    def obtener(self, numero):
+        fila = self.conexion.execute("SELECT datos FROM simbolos WHERE numero = ?", (numero,)).fetchone()
+        return cargar_simbolo(fila[0])
+
+    def leer_varios(self, numeros):
+        """Retorna {número: símbolo} con una sola consulta"""
+        cursor = self.conexion.execute(
+            f"SELECT numero, datos FROM simbolos WHERE numero IN ({', '.join('?' * len(numeros))})",
+            tuple(numeros))
+        return {numero: cargar_simbolo(datos) for numero, datos in cursor}
+
+    def buscar(self, clave):
+        """Retorna (número, símbolo) del primer símbolo guardado con esa clave, o None"""
+        if isinstance(clave, tuple):
+            fila = self.conexion.execute(
+                "SELECT numero, datos FROM simbolos WHERE identificador IS ? AND ambito IS ? ORDER BY numero LIMIT 1",
+                clave).fetchone()
+        else:
+            fila = self.conexion.execute(
+                "SELECT numero, datos FROM simbolos WHERE identificador IS ? ORDER BY numero LIMIT 1",
+                (clave,)).fetchone()
+        return (fila[0], cargar_simbolo(fila[1])) if fila else None
+
+    def leer(self):
+        cursor = self.conexion.execute("SELECT numero, datos FROM simbolos")
+        return ((numero, cargar_simbolo(datos)) for numero, datos in cursor)
+
+    def consultar(self, campos):
+        condiciones = " AND ".join(f"{campo} IS ?" for campo in campos) or "1"
+        cursor = self.conexion.execute(f"SELECT numero, datos FROM simbolos WHERE {condiciones}",
+                                       tuple(campos.values()))
+        return ((numero, cargar_simbolo(datos)) for numero, datos in cursor)
+
+    def quitar(self, numeros):
+        with self.conexion:
+            self.conexion.executemany("DELETE FROM simbolos WHERE numero = ?", [(n,) for n in numeros])
+        self.cantidad -= len(numeros)
+
+    def cerrar(self):
+        """Cierra y borra la base; retorna True si la borró"""
+        self.conexion.close()
+        if os.path.exists(self.ruta):
+            os.unlink(self.ruta)
+            return True
+        return False
+
+
+ALMACENES = {"archivo": AlmacenArchivo, "sqlite": AlmacenSQLite}
+
+_libres = {clase: [] for clase in ALMACENES.values()}  # almacenes vacíos listos para otra tabla
+_abiertos = set()  # todos los almacenes creados y sin cerrar
+
+
+def tomar_almacen(tipo):
+    """Retorna un almacén vacío del tipo pedido, reutilizando uno libre si hay"""
+    libres = _libres[ALMACENES[tipo]]
+    if libres:
+        return libres.pop()
+    almacen = ALMACENES[tipo]()
+    _abiertos.add(almacen)
+    return almacen
+
+
+def devolver_almacen(almacen):
+    """Vacía el almacén y lo guarda para otra tabla; si ya hay MAX_LIBRES, lo cierra.
+
+    Retorna True si lo cerró y borró su archivo.
+    """
+    if almacen not in _abiertos:
+        return False
+    libres = _libres[type(almacen)]
+    if len(libres) < MAX_LIBRES:
+        almacen.limpiar()
+        libres.append(almacen)
+        return False
+    _abiertos.discard(almacen)
+    return almacen.cerrar()
+
+
+@atexit.register
+def cerrar_almacenes():
+    """Cierra y borra todos los almacenes abiertos (libres o en uso)"""
+    for almacen in list(_abiertos):
+        almacen.cerrar()
+    _abiertos.clear()
+    for libres in _libres.values():
+        libres.clear()
+
+
+def claves_simbolo(simbolo):
+    """Claves con las que se indexa un símbolo: su identificador y (identificador, ámbito)"""
+    ident = simbolo.get("identificador")
+    return ident, (ident, simbolo.get("ambito"))
+
+
+def volcar_simbolo(simbolo):
+    return json.dumps(simbolo, default=_a_json)
+
+
+def cargar_simbolo(texto):
+    return json.loads(texto, object_hook=_de_json)
+
+
+def _a_json(valor):
+    """Los Nodo de un símbolo (p. ej. la estructura de un modelo) se guardan como diccionarios marcados"""
+    if not isinstance(valor, Nodo):
+        raise TypeError(f"Valor no serializable en la tabla de símbolos: {valor!r}")
+    raiz = {"tipo": valor.tipo, "valor": valor.valor, "hijos": []}
+    pila = [(valor, raiz)]
+    while pila:
+        nodo, datos = pila.pop()
+        for hijo in nodo.hijos:
+            if hijo is None:
+                datos["hijos"].append(None)
+                continue
+            datos_hijo = {"tipo": hijo.tipo, "valor": hijo.valor, "hijos": []}
+            datos["hijos"].append(datos_hijo)
+            pila.append((hijo, datos_hijo))
+    return {MARCA_NODO: raiz}
+
+
+def _de_json(objeto):
+    datos = objeto.get(MARCA_NODO) if len(objeto) == 1 else None
+    if datos is None:
+        return objeto
+    raiz = Nodo(datos["tipo"], valor=datos["valor"])
+    pila = [(raiz, datos["hijos"])]
+    while pila:
+        nodo, hijos = pila.pop()
+        for hijo in hijos:
+            if hijo is None:
+                nodo.hijos.append(None)
+                continue
+            copia = Nodo(hijo["tipo"], valor=hijo["valor"])
+            nodo.hijos.append(copia)
+            pila.append((copia, hijo["hijos"]))
+    return raiz
@@ -0,0 +1,36 @@
+from collections import deque
+
+# El parser mira como máximo dos tokens por delante del actual
+VENTANA_LOOKAHEAD = 4
+
+
+class BufferTokens:
+    """Ventana acotada sobre un flujo perezoso de tokens.
+
+    Permite que `Sintactico` consuma un generador (p. ej. `Lexico.tokenize_stream`)
+    guardando solo los últimos `tamano` tokens leídos en lugar de la lista completa.
+    """
+
+    def __init__(self, flujo, tamano=VENTANA_LOOKAHEAD):
+        self.flujo = iter(flujo)
+        self.ventana = deque()
+        self.base = 0  # índice global de ventana[0]
+        self.tamano = tamano
+        self.agotado = False
+
+    def token_en(self, indice):
+        """Retorna el token en la posición global `indice` o None al final del flujo"""
+        if indice < self.base:
+            raise IndexError(f"El token {indice} ya salió de la ventana de lookahead")
+        while indice >= self.base + len(self.ventana):
+            if self.agotado:
+                return None
+            try:
+                self.ventana.append(next(self.flujo))
+            except StopIteration:
+                self.agotado = True
+                return None
+            if len(self.ventana) > self.tamano:
+                self.ventana.popleft()
+                self.base += 1
+        return self.ventana[indice - self.base]
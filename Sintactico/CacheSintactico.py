@@ -0,0 +1,149 @@
+import hashlib
+import marshal
+import os
+import tempfile
+import zlib
+from array import array
+
+from Lexico.Lexico import ListaTokens
+from Objetos.Nodo import Nodo
+from Objetos.SerializadorAST import serializar, deserializar
+from Objetos.Token import Token
+
+# Cambiar cuando el léxico o el parser produzcan resultados distintos para el mismo código
+VERSION_COMPILADOR = "2"
+
+# Encabezado de los archivos de caché (formato + versión del formato)
+MAGICO = b"AGC2"
+
+# Marca de un Nodo guardado dentro de un símbolo (p. ej. el valor de una función anónima)
+MARCA_NODO = "\0Nodo"
+
+# Tamaño máximo de la caché en disco antes de desalojar entradas
+LIMITE_CACHE_BYTES = 64 << 20
+
+
+class CacheSintactico:
+    """Caché en disco de tokens y AST direccionada por contenido.
+
+    La clave es el hash SHA-256 del código fuente junto con la versión del
+    compilador, así que un archivo sin cambios se recupera sin volver a tokenizar ni
+    parsear. Cada entrada es un archivo `<clave>.bin` con los tokens, el AST, los
+    errores sintácticos y los símbolos de la tabla (los tokens en arreglos
+    compactos y los AST en el formato binario de `SerializadorAST`), serializados
+    con marshal y comprimidos con zlib. Al pasar `limite_bytes` se
+    borran las entradas usadas hace más tiempo (según su fecha de modificación, que
+    se actualiza en cada acierto).
+    """
+
+    def __init__(self, directorio=None, limite_bytes=LIMITE_CACHE_BYTES):
+        self.directorio = directorio or os.path.join(tempfile.gettempdir(), "aigisc_cache")
+        self.limite_bytes = limite_bytes
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def clave(self, code):
+        return hashlib.sha256(f"{VERSION_COMPILADOR}\0{code}".encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".bin")
+
+    def obtener(self, code):
+        """Retorna (tokens, ast, errores, simbolos) si el código está en caché, o None"""
+        ruta = self._ruta(self.clave(code))
+        try:
+            with open(ruta, "rb") as f:
+                datos = f.read()
+            if not datos.startswith(MAGICO):
+                return None
+            tokens, ast, errores, simbolos = marshal.loads(zlib.decompress(datos[len(MAGICO):]))
+            os.utime(ruta)
+        except (OSError, ValueError, EOFError, TypeError, zlib.error):
+            return None
+        return _cargar_tokens(code, tokens), deserializar(ast), list(errores), [_cargar_valor(s) for s in simbolos]
+
+    def guardar(self, code, tokens, ast, errores, simbolos):
+        """Guarda el resultado del análisis; retorna False si no se pudo serializar"""
+        try:
+            carga = marshal.dumps((_volcar_tokens(tokens), serializar(ast), list(errores),
+                                   [_volcar_valor(s) for s in simbolos]))
+        except ValueError:
+            return False
+
+        ruta = self._ruta(self.clave(code))
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            with open(temporal, "wb") as f:
+                f.write(MAGICO + zlib.compress(carga, 6))
+            os.replace(temporal, ruta)
+        except OSError:
+            return False
+        self._desalojar()
+        return True
+
+    def _desalojar(self):
+        """Borra las entradas menos usadas hasta quedar dentro del límite"""
+        entradas = []
+        total = 0
+        with os.scandir(self.directorio) as it:
+            for entrada in it:
+                if entrada.name.endswith(".bin"):
+                    info = entrada.stat()
+                    entradas.append((info.st_mtime, info.st_size, entrada.path))
+                    total += info.st_size
+        entradas.sort()
+        for _, tamano, ruta in entradas:
+            if total <= self.limite_bytes:
+                break
+            try:
+                os.unlink(ruta)
+                total -= tamano
+            except OSError:
+                pass
+
+    def limpiar(self):
+        """Borra todas las entradas de la caché"""
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(".bin"):
+                os.unlink(os.path.join(self.directorio, nombre))
+
+
+def _volcar_tokens(tokens):
+    """Tokens como tabla de tipos + arreglos de enteros (el valor se corta del código al cargar)"""
+    tipos = {}
+    codigos, inicios, fines, lineas, columnas = (array("I") for _ in range(5))
+    for token in tokens:
+        codigos.append(tipos.setdefault(token.tipo, len(tipos)))
+        inicios.append(token.inicio)
+        fines.append(token.fin)
+        lineas.append(token.linea)
+        columnas.append(token.columna)
+    return (tuple(tipos), codigos.tobytes(), inicios.tobytes(), fines.tobytes(),
+            lineas.tobytes(), columnas.tobytes())
+
+
+def _cargar_tokens(code, datos):
+    tipos, *arreglos = datos
+    codigos, inicios, fines, lineas, columnas = (array("I", bytes(a)) for a in arreglos)
+    return ListaTokens(Token(tipos[c], code[i:f], l, col, i, f)
+                       for c, i, f, l, col in zip(codigos, inicios, fines, lineas, columnas))
+
+
+def _volcar_valor(valor):
+    """Copia un valor de símbolo reemplazando los Nodo por su AST serializado"""
+    if isinstance(valor, Nodo):
+        return (MARCA_NODO, serializar(valor))
+    if isinstance(valor, dict):
+        return {k: _volcar_valor(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(_volcar_valor(v) for v in valor)
+    return valor
+
+
+def _cargar_valor(valor):
+    if isinstance(valor, tuple) and len(valor) == 2 and valor[0] == MARCA_NODO:
+        return deserializar(valor[1])
+    if isinstance(valor, dict):
+        return {k: _cargar_valor(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(_cargar_valor(v) for v in valor)
+    return valor
@@ -1,20 +1,135 @@
+import os
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
 from Objetos.Nodo import Nodo
+from Objetos.Token import Token
+from Sintactico.BufferTokens import BufferTokens
 from Sintactico.TablaSintactico import TablaSimbolos
 
+# Operadores binarios: (tipo, valor) del token -> (precedencia, tipo de nodo).
+# Todos asocian a la izquierda; mayor precedencia liga más fuerte.
+OPERADORES_BINARIOS = {
+    **{("Logico", op): (1, "OperacionLogica") for op in ("&&", "||", "!")},
+    **{("Reservada", op): (1, "OperacionLogica") for op in ("and", "or", "AND", "OR")},
+    **{("Relacional", op): (2, "OperacionRelacional") for op in ("==", "!=")},
+    **{("Reservada", op): (2, "OperacionRelacional") for op in ("is", "is not")},
+    **{("Relacional", op): (3, "OperacionRelacional") for op in (">", "<", ">=", "<=")},
+    **{("Aritmetico", op): (4, "Operacion") for op in ("+", "-")},
+    **{("Aritmetico", op): (5, "Operacion") for op in ("*", "/", "%")},
+}
+
+# Motores de expresiones: "pratt" (tabla de precedencias) o "descendente" (una función por nivel)
+MOTORES_EXPRESIONES = ("pratt", "descendente")
+
+# Tokens que el parser puede mirar más allá del último que consume una instrucción
+ANTICIPACION = 2
+
+# Por debajo de esta cantidad de tokens no vale la pena repartir el parseo en procesos
+MIN_PARALELO = 1 << 16
+
+# Errores a partir de los cuales se detiene el análisis
+MAX_ERRORES = 100
+
+
+class Segmento:
+    """Instrucción de nivel superior y lo que aportó al análisis.
+
+    Guarda su tramo de tokens [inicio, fin), el nodo, los errores como
+    (posición relativa al inicio, mensaje, texto), los símbolos que agregó, el
+    resultado de cada búsqueda en la tabla que dependió de instrucciones
+    anteriores, y la línea y columna de su primer token.
+    """
+    __slots__ = ("inicio", "fin", "nodo", "errores", "simbolos", "consultas", "linea", "columna")
+
+    def __init__(self, inicio, fin, nodo, errores, simbolos, consultas, linea, columna):
+        self.inicio = inicio
+        self.fin = fin
+        self.nodo = nodo
+        self.errores = errores
+        self.simbolos = simbolos
+        self.consultas = consultas
+        self.linea = linea
+        self.columna = columna
+
+
+def _analizar_trozo(clase, motor_expresiones, max_errores, tokens, fin):
+    """Parsea en un proceso de trabajo las instrucciones que empiezan antes de `fin`.
+
+    `tokens` son tuplas con los argumentos de Token; los que siguen a `fin` solo
+    sirven de anticipación. Se parsea sin tabla de símbolos. Retorna (segmentos,
+    completo): los segmentos con posiciones relativas al trozo y si la última
+    instrucción terminó justo en `fin` (si no, el corte no era un límite real) o
+    si se llegó al máximo de errores antes de `fin` (contando solo los del trozo,
+    así que en la unión el máximo se alcanza a más tardar en el mismo segmento).
+    """
+    parser = clase([Token(*t) for t in tokens], motor_expresiones, con_tabla=False, max_errores=max_errores)
+    segmentos = []
+    while parser.pos < fin:
+        segmentos.append(parser._analizar_segmento())
+        if parser._limite_alcanzado():
+            break
+    return segmentos, parser.pos == fin or (parser.abortado and parser.pos < fin)
+
+
 class Sintactico:
-    def __init__(self, tokens):
+    def __init__(self, tokens, motor_expresiones="pratt", con_tabla=True, max_errores=MAX_ERRORES):
         self.tokens = tokens
         self.pos = 0
-        self.tabla = TablaSimbolos()
+        self.motor_expresiones = motor_expresiones
+        self.max_errores = max_errores
+        # Sin tabla (procesos de trabajo del parseo en paralelo) los símbolos solo
+        # quedan en los segmentos
+        self.tabla = TablaSimbolos() if con_tabla else None
         self.errores = []
         self.ast = None
         self.primarios = {"void","int","float","char","bool","string"}
         self.modificadores = {"const","readonly","global","local","shared"}
         self.funciones_io = {"print","input","println","readLine","readInt","readFloat","write","writeLine"}
 
+        # Recuperación de errores en modo pánico: tras un error se descartan los
+        # siguientes hasta sincronizar en ';', '}' o una palabra que inicia instrucción
+        self.en_panico = False
+        self.abortado = False
+        self.inicios_instruccion = self.primarios | self.modificadores | self.funciones_io | {
+            "if", "while", "for", "try", "throw", "function", "model", "template",
+            "import", "from", "return", "mapInt", "mapString"}
+
+        # Registro por instrucción de nivel superior para `reanalizar`
+        self.segmentos = []
+        self._errores_segmento = []
+        self._simbolos_segmento = []
+        self._consultas_segmento = {}
+        # Identificadores definidos (durante `reanalizar` y `analisis_paralelo`, o
+        # siempre si no hay tabla; si no, se consulta la tabla)
+        self._definidos = None if con_tabla else Counter()
+
+        # Un flujo perezoso (sin len) se consume a través de una ventana acotada
+        if not hasattr(tokens, "__len__"):
+            self.tokens = BufferTokens(tokens)
+            self.actual = self._actual_flujo
+            self.siguiente = self._siguiente_flujo
+
+        if motor_expresiones not in MOTORES_EXPRESIONES:
+            raise ValueError(f"Motor de expresiones desconocido: {motor_expresiones}")
+        if motor_expresiones == "descendente":
+            self.expresion = self.expresion_logica
+
     def actual(self):
         return self.tokens[self.pos] if self.pos < len(self.tokens) else None
 
+    def siguiente(self, k=1):
+        """Retorna el token k posiciones después del actual, o None"""
+        i = self.pos + k
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def _actual_flujo(self):
+        return self.tokens.token_en(self.pos)
+
+    def _siguiente_flujo(self, k=1):
+        return self.tokens.token_en(self.pos + k)
+
     def avanzar(self):
         self.pos += 1
 
@@ -30,28 +145,353 @@ class Sintactico:
             return None
 
     def error(self, mensaje):
+        # En modo pánico los errores en cascada no se reportan
+        if self.en_panico:
+            return
+        self.en_panico = True
+        if len(self.errores) >= self.max_errores:
+            return
+        texto = self._formatear_error(self.actual(), mensaje)
+        self.errores.append(texto)
+        self._errores_segmento.append((self.pos, mensaje, texto))
+
+    def _sincronizar(self, nivel_superior=False):
+        """Sale del modo pánico saltando hasta después de ';', hasta '}' o hasta el inicio de una instrucción.
+
+        En el nivel superior la '}' también se consume (no cierra ningún bloque).
+        """
+        while True:
+            token = self.actual()
+            if token is None:
+                break
+            if token.tipo == "PuntoComa":
+                self.avanzar()
+                break
+            if token.tipo == "LlaveDer":
+                if nivel_superior:
+                    self.avanzar()
+                break
+            if token.tipo == "Reservada" and token.valor in self.inicios_instruccion:
+                break
+            self.avanzar()
+        self.en_panico = False
+
+    def _recuperar(self):
+        """Sincroniza dentro de un bloque; retorna False si no queda una instrucción por parsear"""
+        self._sincronizar()
         token = self.actual()
+        return token is not None and token.tipo != "LlaveDer"
+
+    def _limite_alcanzado(self):
+        """Tras una instrucción de nivel superior: si se llegó al máximo de errores lo reporta y detiene el análisis"""
+        if len(self.errores) < self.max_errores:
+            return False
+        self.errores.append(f"Se alcanzó el máximo de {self.max_errores} errores sintácticos; análisis detenido.")
+        self.abortado = True
+        return True
+
+    @staticmethod
+    def _formatear_error(token, mensaje):
         linea = token.linea if token else "?"
         columna = token.columna if token else "?"
-        self.errores.append(f"Error sintáctico en línea {linea}, columna {columna}: {mensaje}")
+        return f"Error sintáctico en línea {linea}, columna {columna}: {mensaje}"
+
+    def error_no_terminado(self, token):
+        """Reporta una cadena o comentario que llega al final del archivo sin cerrarse"""
+        que = "Comentario" if token.tipo == "ComentarioNoTerminado" else "Cadena"
+        self.error(f"{que} sin cerrar: se llegó al final del archivo.")
 
     def analisis_sintactico(self):
         cuerpo = []
+        self.segmentos = []
+        self.abortado = False
         while self.actual():
-            pos_inicial = self.pos
-            nodo = self.instruccion()
-            if nodo:
-                cuerpo.append(nodo)
-            if self.pos == pos_inicial:
-                self.avanzar()
+            segmento = self._analizar_segmento()
+            self.segmentos.append(segmento)
+            if segmento.nodo:
+                cuerpo.append(segmento.nodo)
+            if self._limite_alcanzado():
+                break
         self.ast = Nodo("Programa", hijos=cuerpo)
         return self.ast
 
+    def _instruccion_superior(self):
+        return self.instruccion()
+
+    def _analizar_segmento(self):
+        """Parsea una instrucción de nivel superior registrando lo que aporta"""
+        inicio = self.pos
+        token = self.actual()
+        self._errores_segmento = []
+        self._simbolos_segmento = []
+        self._consultas_segmento = {}
+        self.en_panico = False
+        nodo = self._instruccion_superior()
+        if self.en_panico:
+            self._sincronizar(nivel_superior=True)
+        if self.pos == inicio:
+            self.avanzar()
+        errores = [(pos - inicio, mensaje, texto) for pos, mensaje, texto in self._errores_segmento]
+        return Segmento(inicio, self.pos, nodo, errores, self._simbolos_segmento,
+                        self._consultas_segmento, token.linea, token.columna)
+
+    def _agregar_simbolo(self, simbolo):
+        self._simbolos_segmento.append(simbolo)
+        if self._definidos is None:
+            self.tabla.agregar(simbolo)
+        else:
+            self._definidos[simbolo.get("identificador")] += 1
+
+    def _existe_simbolo(self, identificador):
+        """Indica si el identificador ya está en la tabla, anotando la consulta si depende de otra instrucción"""
+        if self._definidos is None:
+            existe = self.tabla.buscar(identificador) is not None
+        else:
+            existe = self._definidos[identificador] > 0
+        if not any(s.get("identificador") == identificador for s in self._simbolos_segmento):
+            self._consultas_segmento[identificador] = existe
+        return existe
+
+    def puntos_corte(self, partes):
+        """Retorna hasta `partes - 1` índices de token donde probablemente empieza una instrucción de nivel superior.
+
+        Pre-escaneo por profundidad de llaves: cada corte queda justo después de una
+        '}' que vuelve a profundidad 0 (y no va seguida de else o catch), cerca de un
+        múltiplo de len(tokens) / partes.
+        """
+        cortes = []
+        total = len(self.tokens)
+        objetivo = max(1, total // partes)
+        profundidad = 0
+        for i, token in enumerate(self.tokens):
+            if token.tipo == "LlaveIzq":
+                profundidad += 1
+            elif token.tipo == "LlaveDer" and profundidad:
+                profundidad -= 1
+                if profundidad or i + 1 < (len(cortes) + 1) * objetivo or i + 1 >= total:
+                    continue
+                siguiente = self.tokens[i + 1]
+                if siguiente.tipo == "Reservada" and siguiente.valor in ("else", "catch"):
+                    continue
+                cortes.append(i + 1)
+                if len(cortes) == partes - 1:
+                    break
+        return cortes
+
+    def analisis_paralelo(self, procesos=None, min_paralelo=MIN_PARALELO):
+        """Parsea repartiendo las instrucciones de nivel superior entre varios procesos.
+
+        Produce el mismo AST, errores y tabla que `analisis_sintactico`. Los trozos
+        se cortan con `puntos_corte` y cada proceso los parsea sin tabla de
+        símbolos; al unirlos en orden se revisa que cada trozo haya terminado justo
+        en su corte (si no, se parsea en serie desde ahí hasta caer en un corte
+        posterior) y que las búsquedas en la tabla de cada instrucción den lo mismo
+        con los símbolos de los trozos anteriores (si no, se vuelve a parsear esa
+        instrucción). Al final los símbolos se agregan a la tabla en orden.
+        """
+        procesos = procesos or os.cpu_count() or 1
+        if procesos <= 1 or not hasattr(self.tokens, "__len__") or len(self.tokens) < min_paralelo:
+            return self.analisis_sintactico()
+
+        limites = [0] + self.puntos_corte(procesos * 2) + [len(self.tokens)]
+        datos = [(t.tipo, t.valor, t.linea, t.columna, t.inicio, t.fin) for t in self.tokens]
+        trozos = [datos[a:b + ANTICIPACION] for a, b in zip(limites, limites[1:])]
+        fines = [b - a for a, b in zip(limites, limites[1:])]
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_analizar_trozo, [type(self)] * len(trozos),
+                                       [self.motor_expresiones] * len(trozos),
+                                       [self.max_errores] * len(trozos), trozos, fines))
+
+        self.segmentos = []
+        self.pos = 0
+        self.abortado = False
+        self._definidos = Counter()
+        try:
+            i = 0
+            while i < len(trozos) and not self.abortado:
+                base = limites[i]
+                segmentos, completo = resultados[i]
+                if self.pos == base and completo:
+                    for segmento in segmentos:
+                        segmento.inicio += base
+                        segmento.fin += base
+                        if all((self._definidos[ident] > 0) == existe for ident, existe in segmento.consultas.items()):
+                            for simbolo in segmento.simbolos:
+                                self._definidos[simbolo.get("identificador")] += 1
+                            # El proceso contó solo los errores de su trozo
+                            del segmento.errores[max(0, self.max_errores - len(self.errores)):]
+                            self.errores.extend(texto for _, _, texto in segmento.errores)
+                        else:
+                            self.pos = segmento.inicio
+                            segmento = self._analizar_segmento()
+                        self.segmentos.append(segmento)
+                        if self._limite_alcanzado():
+                            break
+                    self.pos = limites[i + 1]
+                    i += 1
+                    continue
+
+                # Parseo en serie hasta una instrucción que termine en un corte
+                siguientes = {limite: k for k, limite in enumerate(limites[i + 1:-1], i + 1)}
+                i = len(trozos)
+                while self.actual():
+                    self.segmentos.append(self._analizar_segmento())
+                    if self._limite_alcanzado():
+                        break
+                    if self.pos in siguientes:
+                        i = siguientes[self.pos]
+                        break
+        finally:
+            self._definidos = None
+
+        for segmento in self.segmentos:
+            for simbolo in segmento.simbolos:
+                self.tabla.agregar(simbolo)
+        self.ast = Nodo("Programa", hijos=[segmento.nodo for segmento in self.segmentos if segmento.nodo])
+        return self.ast
+
+    def reanalizar(self, tokens=None):
+        """Actualiza el AST, los errores y la tabla después de editar los tokens.
+
+        `tokens` (por defecto los del parser) es la lista ya corregida por
+        `Lexico.retokenizar`, cuyo atributo `cambios` indica el tramo de tokens
+        reemplazado. Se vuelven a parsear solo las instrucciones de nivel superior
+        que leyeron ese tramo, hasta que el parser cae otra vez en el inicio de una
+        instrucción anterior ya fuera de él; desde ahí se reutilizan los nodos,
+        corrigiendo la línea de sus errores y símbolos. Una instrucción reutilizada
+        se vuelve a parsear si alguna de sus búsquedas en la tabla daría otro
+        resultado. Los subárboles nuevos se insertan en el mismo `Nodo("Programa")`
+        y en la tabla solo se reemplazan los símbolos de las instrucciones que cambiaron.
+        """
+        if tokens is not None:
+            self.tokens = tokens
+        if self.ast is None:
+            return self.analisis_sintactico()
+        if self.abortado:
+            # Los segmentos no cubren todo el programa: se vuelve a parsear entero
+            return self._analizar_de_nuevo()
+
+        viejos = self.segmentos
+        total_viejo = viejos[-1].fin if viejos else 0
+        cambios = getattr(self.tokens, "cambios", None) or (0, total_viejo, len(self.tokens))
+        desde, hasta, cantidad = cambios
+        corrimiento = cantidad - (hasta - desde)
+        fin_cambios = desde + cantidad
+
+        # Primera instrucción que leyó (contando la anticipación) algún token cambiado
+        a = bisect_right(viejos, desde, key=lambda s: s.fin + ANTICIPACION)
+        self._definidos = Counter(s.get("identificador") for seg in viejos[:a] for s in seg.simbolos)
+        self.pos = viejos[a].inicio if a < len(viejos) else total_viejo
+
+        nuevos = []
+        iguales = []  # por segmento nuevo: si es el viejo reutilizado sin cambios
+        j = a
+        self.errores[:] = [texto for seg in viejos[:a] for _, _, texto in seg.errores]
+        try:
+            while self.actual():
+                if self.pos >= fin_cambios:
+                    pos_vieja = self.pos - corrimiento
+                    while j < len(viejos) and viejos[j].inicio < pos_vieja:
+                        j += 1
+                    if j < len(viejos) and viejos[j].inicio == pos_vieja and all(
+                            (self._definidos[ident] > 0) == existe for ident, existe in viejos[j].consultas.items()):
+                        segmento = viejos[j]
+                        sin_cambios = self._reubicar(segmento, self.pos)
+                        for simbolo in segmento.simbolos:
+                            self._definidos[simbolo.get("identificador")] += 1
+                        capacidad = max(0, self.max_errores - len(self.errores))
+                        if len(segmento.errores) > capacidad:
+                            del segmento.errores[capacidad:]
+                            sin_cambios = False
+                        self.errores.extend(texto for _, _, texto in segmento.errores)
+                        nuevos.append(segmento)
+                        iguales.append(sin_cambios)
+                        self.pos = segmento.fin
+                        j += 1
+                    else:
+                        nuevos.append(self._analizar_segmento())
+                        iguales.append(False)
+                else:
+                    nuevos.append(self._analizar_segmento())
+                    iguales.append(False)
+                if self._limite_alcanzado():
+                    break
+        finally:
+            self._definidos = None
+
+        # Cola de instrucciones viejas reutilizadas: el AST no cambia ahí, y la
+        # tabla tampoco en las que no corrieron de línea
+        reutilizados = 0
+        while reutilizados < len(nuevos) and reutilizados < len(viejos) - a \
+                and nuevos[len(nuevos) - reutilizados - 1] is viejos[len(viejos) - reutilizados - 1]:
+            reutilizados += 1
+        cola = 0
+        while cola < reutilizados and iguales[len(iguales) - cola - 1]:
+            cola += 1
+
+        # AST: se reemplazan los nodos de las instrucciones que no se reutilizaron
+        i = sum(1 for seg in viejos[:a] if seg.nodo)
+        quitados = sum(1 for seg in viejos[a:len(viejos) - reutilizados] if seg.nodo)
+        self.ast.hijos[i:i + quitados] = [seg.nodo for seg in nuevos[:len(nuevos) - reutilizados] if seg.nodo]
+
+        # Tabla: solo los símbolos de las instrucciones nuevas o con líneas corridas
+        inicio_tabla = sum(len(seg.simbolos) for seg in viejos[:a])
+        cantidad_tabla = sum(len(seg.simbolos) for seg in viejos[a:len(viejos) - cola])
+        simbolos = [s for seg in nuevos[:len(nuevos) - cola] for s in seg.simbolos]
+        if cantidad_tabla or simbolos:
+            self.tabla.reemplazar(inicio_tabla, cantidad_tabla, simbolos)
+
+        self.segmentos = viejos[:a] + nuevos
+        if hasattr(self.tokens, "cambios"):
+            self.tokens.cambios = None
+        return self.ast
+
+    def _analizar_de_nuevo(self):
+        """Descarta el análisis anterior y parsea todo otra vez, conservando el nodo Programa"""
+        ast = self.ast
+        self.tabla.reemplazar(0, sum(len(seg.simbolos) for seg in self.segmentos), [])
+        self.errores.clear()
+        self.pos = 0
+        ast.hijos[:] = self.analisis_sintactico().hijos
+        self.ast = ast
+        if hasattr(self.tokens, "cambios"):
+            self.tokens.cambios = None
+        return self.ast
+
+    def _reubicar(self, segmento, inicio):
+        """Mueve un segmento reutilizado a su nueva posición; retorna True si no cambió nada más"""
+        segmento.fin += inicio - segmento.inicio
+        segmento.inicio = inicio
+        token = self.tokens[inicio]
+        if (token.linea, token.columna) == (segmento.linea, segmento.columna):
+            return True
+
+        desplazamiento = token.linea - segmento.linea
+        segmento.linea, segmento.columna = token.linea, token.columna
+        segmento.errores = [
+            (relativa, mensaje, self._formatear_error(self.tokens[inicio + relativa]
+                                                      if inicio + relativa < len(self.tokens) else None, mensaje))
+            for relativa, mensaje, _ in segmento.errores
+        ]
+        if not desplazamiento or not segmento.simbolos:
+            return True
+        segmento.simbolos = [
+            dict(s, linea=s["linea"] + desplazamiento) if isinstance(s.get("linea"), int) else s
+            for s in segmento.simbolos
+        ]
+        return False
+
     def instruccion(self):
+        if self.en_panico and not self._recuperar():
+            return None
         token = self.actual()
         if not token:
             return None
-        
+
+        if token.tipo in ("ComentarioNoTerminado", "CadenaNoTerminada"):
+            self.error_no_terminado(token)
+            self.avanzar()
+            return None
       
         if token.tipo.startswith("Comentario"):
             self.avanzar()
@@ -59,7 +499,7 @@ class Sintactico:
         
        
         if token.tipo == "Identificador":
-            next_token = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
+            next_token = self.siguiente()
             if next_token and next_token.tipo == "Incrementador":
                 ident = self.comparar("Identificador")
                 op = self.comparar("Incrementador")
@@ -68,7 +508,7 @@ class Sintactico:
                 return Nodo("IncrementoInstruccion", valor=f"{ident.valor}{op.valor}")
             else:
         
-                next_next = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
+                next_next = self.siguiente()
                 if next_next and next_next.tipo == "ParentIzq":
                     return self.llamada_funcion_como_instruccion()
                 else:
@@ -101,8 +541,8 @@ class Sintactico:
            
             if token.valor in self.primarios:
               
-                next_token = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
-                next_next = self.tokens[self.pos + 2] if self.pos + 2 < len(self.tokens) else None
+                next_token = self.siguiente()
+                next_next = self.siguiente(2)
                 if next_token and next_token.tipo == "Identificador" and next_next and next_next.tipo == "ParentIzq":
                     return self.declaracion_funcion()
                 else:
@@ -175,8 +615,8 @@ class Sintactico:
         
         es_rango = False
         if self.actual() and self.actual().tipo == "Identificador":
-            temp_pos = self.pos + 1
-            if temp_pos < len(self.tokens) and self.tokens[temp_pos].tipo == "PuntoComa":
+            temp_token = self.siguiente()
+            if temp_token and temp_token.tipo == "PuntoComa":
                 es_rango = True
         
         if es_rango:
@@ -299,7 +739,7 @@ class Sintactico:
                 "estructura": None,
                 "referencias": 0
             }
-            self.tabla.agregar(simbolo)
+            self._agregar_simbolo(simbolo)
         
         nodo_tipo = Nodo("TipoRetorno", valor=tipo_retorno or "void")
         nodo_params = Nodo("Params", hijos=params)
@@ -376,8 +816,8 @@ class Sintactico:
                 if token.valor in self.funciones_io:
                     miembros.append(self.llamada_funcion_io())
                 elif token.valor in self.primarios:
-                    next_token = self.tokens[self.pos+1] if self.pos+1 < len(self.tokens) else None
-                    next_next = self.tokens[self.pos+2] if self.pos+2 < len(self.tokens) else None
+                    next_token = self.siguiente()
+                    next_next = self.siguiente(2)
                     if next_token and next_token.tipo == "Identificador" and next_next and next_next.tipo == "ParentIzq":
                         miembros.append(self.declaracion_funcion(es_miembro=True, con_override=es_override))
                     else:
@@ -417,7 +857,7 @@ class Sintactico:
                 "estructura": miembros,
                 "referencias": 0
             }
-            self.tabla.agregar(simbolo)
+            self._agregar_simbolo(simbolo)
 
         return Nodo("Modelo", valor=(nombre.valor if nombre else None), hijos=ast_hijos)
 
@@ -428,6 +868,7 @@ class Sintactico:
         
         firmas = []
         while self.actual() and self.actual().tipo != "LlaveDer":
+            inicio = self.pos
             tipo = self.tipo_dato()
             nombre_func = self.comparar("Identificador")
             self.comparar("ParentIzq")
@@ -437,6 +878,9 @@ class Sintactico:
             
             firmas.append(Nodo("FirmaFuncion", valor=(nombre_func.valor if nombre_func else None),
                              hijos=[Nodo("Tipo", valor=tipo), Nodo("Params", hijos=params)]))
+            # Una firma que no consumió nada no debe repetirse para siempre
+            if self.pos == inicio:
+                self.avanzar()
         
         self.comparar("LlaveDer")
         
@@ -453,7 +897,7 @@ class Sintactico:
                 "estructura": firmas,
                 "referencias": 0
             }
-            self.tabla.agregar(simbolo)
+            self._agregar_simbolo(simbolo)
         
         return Nodo("Template", valor=(nombre.valor if nombre else None), hijos=firmas)
 
@@ -519,6 +963,10 @@ class Sintactico:
         # asumiendo que el contexto superior lo manejará.
         # --- FIN DE LA CORRECCIÓN ---
 
+        return self._nodo_declaracion_variable(modifiers, tipo_token, name, es_array, valor_node)
+
+    def _nodo_declaracion_variable(self, modifiers, tipo_token, name, es_array, valor_node):
+        """Registra la variable declarada en la tabla y construye su nodo"""
         # --- Lógica para 'valor' (sin cambios) ---
         valor_literal = None
         if valor_node:
@@ -560,7 +1008,7 @@ class Sintactico:
             "estructura": estructura_info,
             "referencias": 0
         }
-        self.tabla.agregar(simbolo)
+        self._agregar_simbolo(simbolo)
 
         hijos = [Nodo("Tipo", valor=tipo_token)]
         if modifiers:
@@ -606,7 +1054,11 @@ class Sintactico:
         
         if self.actual() and self.actual().tipo == "PuntoComa":
             self.avanzar()
-        
+
+        return self._nodo_asignacion(ident, operador, expr)
+
+    def _nodo_asignacion(self, ident, operador, expr):
+        """Registra la variable asignada si es nueva y construye el nodo"""
         simbolo = {
             "identificador": ident.valor if ident else None,
             "categoria": "variable",
@@ -622,14 +1074,32 @@ class Sintactico:
         
         # CORRECCIÓN: Uso de búsqueda optimizada en lugar de 'any(...)'
         ident_val = simbolo["identificador"]
-        if ident_val and not self.tabla.buscar(ident_val):
-             self.tabla.agregar(simbolo)
+        if ident_val and not self._existe_simbolo(ident_val):
+             self._agregar_simbolo(simbolo)
         
         return Nodo("Asignacion", valor=(f"{ident.valor} {operador.valor}" if ident and operador else None), 
                    hijos=[expr])
 
     def expresion(self):
-        return self.expresion_logica()
+        return self.expresion_pratt()
+
+    def expresion_pratt(self, minimo=1):
+        """Expresión binaria por ascenso de precedencias sobre OPERADORES_BINARIOS.
+
+        Produce el mismo árbol que la cadena expresion_logica -> ... -> termino,
+        pero un operando sin operadores cuesta una sola llamada a `factor`.
+        """
+        izquierda = self.factor()
+        while True:
+            token = self.actual()
+            if token is None:
+                return izquierda
+            operador = OPERADORES_BINARIOS.get((token.tipo, token.valor))
+            if operador is None or operador[0] < minimo:
+                return izquierda
+            self.avanzar()
+            derecha = self.expresion_pratt(operador[0] + 1)
+            izquierda = Nodo(operador[1], valor=token.valor, hijos=[izquierda, derecha])
 
     def expresion_logica(self):
         izquierda = self.expresion_igualdad()
@@ -691,6 +1161,11 @@ class Sintactico:
         if token.tipo == "Cadena":
             self.avanzar()
             return Nodo("Cadena", valor=token.valor)
+
+        if token.tipo == "CadenaNoTerminada":
+            self.error_no_terminado(token)
+            self.avanzar()
+            return Nodo("ErrorExpresion", valor='"')
         
         if token.tipo == "Reservada" and token.valor in ("true","false","1","0"):
             self.avanzar()
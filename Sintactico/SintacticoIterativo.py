@@ -0,0 +1,530 @@
+from Objetos.Nodo import Nodo
+from Sintactico.Sintactico import Sintactico, OPERADORES_BINARIOS, MAX_ERRORES
+
+
+class SintacticoIterativo(Sintactico):
+    """Parser sin recursión de Python para programas con anidamiento profundo.
+
+    Los métodos que se llaman entre sí recursivamente (instrucciones, bloques y
+    expresiones) están reescritos como generadores: en vez de llamar a otro método
+    hacen `resultado = yield self.metodo(...)`, y `_ejecutar` los corre con una pila
+    explícita de generadores. Así la profundidad de anidamiento solo está limitada
+    por la memoria, no por el límite de recursión. Produce el mismo AST, los mismos
+    errores y la misma tabla de símbolos que `Sintactico` (las expresiones siempre
+    se parsean por ascenso de precedencias, que da el mismo árbol que el descenso).
+    """
+
+    def __init__(self, tokens, motor_expresiones="pratt", con_tabla=True, max_errores=MAX_ERRORES):
+        super().__init__(tokens, motor_expresiones, con_tabla, max_errores)
+        # El motor descendente no tiene versión iterativa
+        self.__dict__.pop("expresion", None)
+
+    @staticmethod
+    def _ejecutar(generador):
+        """Corre un método generador y todos los que invoque con una pila explícita"""
+        pila = [generador]
+        valor = None
+        while pila:
+            try:
+                llamada = pila[-1].send(valor)
+            except StopIteration as fin:
+                pila.pop()
+                valor = fin.value
+                continue
+            pila.append(llamada)
+            valor = None
+        return valor
+
+    def _instruccion_superior(self):
+        return self._ejecutar(self.instruccion())
+
+    def _bloque(self):
+        """Instrucciones hasta '}' (sin consumir las llaves)"""
+        cuerpo = []
+        while self.actual() and self.actual().tipo != "LlaveDer":
+            nodo = yield self.instruccion()
+            if nodo: cuerpo.append(nodo)
+        return cuerpo
+
+    def _argumentos(self):
+        """Expresiones separadas por coma hasta ')' (sin consumir el paréntesis)"""
+        args = []
+        while self.actual() and self.actual().tipo != "ParentDer":
+            args.append((yield self.expresion()))
+            if self.actual() and self.actual().tipo == "Coma":
+                self.avanzar()
+        return args
+
+    def instruccion(self):
+        if self.en_panico and not self._recuperar():
+            return None
+        token = self.actual()
+        if not token:
+            return None
+
+        if token.tipo in ("ComentarioNoTerminado", "CadenaNoTerminada"):
+            self.error_no_terminado(token)
+            self.avanzar()
+            return None
+
+        if token.tipo.startswith("Comentario"):
+            self.avanzar()
+            return None
+
+        if token.tipo == "Identificador":
+            next_token = self.siguiente()
+            if next_token and next_token.tipo == "Incrementador":
+                ident = self.comparar("Identificador")
+                op = self.comparar("Incrementador")
+                if self.actual() and self.actual().tipo == "PuntoComa":
+                    self.avanzar()
+                return Nodo("IncrementoInstruccion", valor=f"{ident.valor}{op.valor}")
+            next_next = self.siguiente()
+            if next_next and next_next.tipo == "ParentIzq":
+                return (yield self.llamada_funcion_como_instruccion())
+            return (yield self.asignacion())
+
+        if token.tipo == "Reservada":
+            if token.valor in self.funciones_io:
+                return (yield self.llamada_funcion_io())
+            if token.valor == "if":
+                return (yield self.instruccion_if())
+            if token.valor == "while":
+                return (yield self.instruccion_while())
+            if token.valor == "for":
+                return (yield self.instruccion_for())
+            if token.valor == "try":
+                return (yield self.instruccion_try())
+            if token.valor == "throw":
+                return self.instruccion_throw()
+            if token.valor == "function":
+                return (yield self.declaracion_funcion())
+            if token.valor == "model":
+                return (yield self.declaracion_modelo())
+            if token.valor == "template":
+                return self.declaracion_template()
+            if token.valor in ("import", "from"):
+                return self.importacion()
+            if token.valor in self.modificadores or token.valor in ("mapInt", "mapString"):
+                return (yield self.declaracion_variable())
+            if token.valor in self.primarios:
+                next_token = self.siguiente()
+                next_next = self.siguiente(2)
+                if next_token and next_token.tipo == "Identificador" and next_next and next_next.tipo == "ParentIzq":
+                    return (yield self.declaracion_funcion())
+                return (yield self.declaracion_variable())
+            if token.valor == "return":
+                return (yield self.instruccion_return())
+
+        self.error(f"Instrucción inesperada: '{token.valor}'")
+        self.avanzar()
+        return None
+
+    def llamada_funcion_como_instruccion(self):
+        nombre = self.comparar("Identificador")
+        self.comparar("ParentIzq")
+        args = yield self._argumentos()
+        self.comparar("ParentDer")
+        if self.actual() and self.actual().tipo == "PuntoComa":
+            self.avanzar()
+        return Nodo("LlamadaFuncion", valor=(nombre.valor if nombre else None), hijos=args)
+
+    def instruccion_if(self):
+        self.comparar("Reservada", "if")
+        self.comparar("ParentIzq")
+        cond = yield self.expresion()
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+        fallback = None
+        if self.actual() and self.actual().tipo == "Reservada" and self.actual().valor == "else":
+            self.avanzar()
+            if self.actual() and self.actual().tipo == "LlaveIzq":
+                self.comparar("LlaveIzq")
+                else_cuerpo = yield self._bloque()
+                self.comparar("LlaveDer")
+                fallback = Nodo("Else", hijos=else_cuerpo)
+            elif self.actual() and self.actual().tipo == "Reservada" and self.actual().valor == "if":
+                fallback = yield self.instruccion_if()
+        return Nodo("If", hijos=[cond, Nodo("Bloque", hijos=cuerpo)] + ([fallback] if fallback else []))
+
+    def instruccion_while(self):
+        self.comparar("Reservada", "while")
+        self.comparar("ParentIzq")
+        cond = yield self.expresion()
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+        return Nodo("While", hijos=[cond, Nodo("Bloque", hijos=cuerpo)])
+
+    def instruccion_for(self):
+        self.comparar("Reservada", "for")
+        self.comparar("ParentIzq")
+
+        es_rango = False
+        if self.actual() and self.actual().tipo == "Identificador":
+            temp_token = self.siguiente()
+            if temp_token and temp_token.tipo == "PuntoComa":
+                es_rango = True
+
+        if es_rango:
+            var1 = self.comparar("Identificador")
+            self.comparar("PuntoComa")
+            cond = yield self.expresion()
+            self.comparar("PuntoComa")
+            var2 = self.comparar("Identificador")
+            incr = self.comparar("Incrementador")
+            self.comparar("ParentDer")
+            self.comparar("LlaveIzq")
+            cuerpo = yield self._bloque()
+            self.comparar("LlaveDer")
+            return Nodo("ForRango", valor=(var1.valor if var1 else None), hijos=[
+                Nodo("Variable", valor=(var1.valor if var1 else None)),
+                cond,
+                Nodo("Variable", valor=(var2.valor if var2 else None)),
+                Nodo("Incrementador", valor=(incr.valor if incr else None)),
+                Nodo("Bloque", hijos=cuerpo)
+            ])
+
+        tipo = self.tipo_dato()
+        var = self.comparar("Identificador")
+        self.comparar("Reservada", "in")
+        lista = yield self.expresion()
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+        return Nodo("ForIter", hijos=[
+            Nodo("Tipo", valor=tipo),
+            Nodo("Variable", valor=(var.valor if var else None)),
+            lista,
+            Nodo("Bloque", hijos=cuerpo)
+        ])
+
+    def instruccion_try(self):
+        self.comparar("Reservada", "try")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+        self.comparar("Reservada", "catch")
+        self.comparar("ParentIzq")
+        self.comparar("Reservada", "error")
+        errname = self.comparar("Identificador")
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo2 = yield self._bloque()
+        self.comparar("LlaveDer")
+        return Nodo("TryCatch", hijos=[
+            Nodo("Bloque", hijos=cuerpo),
+            Nodo("Catch", valor=(errname.valor if errname else None), hijos=cuerpo2)
+        ])
+
+    def llamada_funcion_io(self):
+        nombre_funcion = self.comparar("Reservada")
+        self.comparar("ParentIzq")
+        args = yield self._argumentos()
+        self.comparar("ParentDer")
+        if self.actual() and self.actual().tipo == "PuntoComa":
+            self.avanzar()
+        return Nodo("LlamadaFuncionIO", valor=(nombre_funcion.valor if nombre_funcion else None), hijos=args)
+
+    def declaracion_funcion(self, es_miembro=False, con_override=False):
+        tipo_retorno = None
+        if self.actual() and self.actual().tipo == "Reservada":
+            if self.actual().valor in self.primarios:
+                tipo_retorno = self.comparar("Reservada").valor
+            elif self.actual().valor == "function":
+                self.comparar("Reservada", "function")
+                tipo_retorno = "void"
+
+        nombre = self.comparar("Identificador")
+        self.comparar("ParentIzq")
+        params = self.parse_params()
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+
+        if nombre and not es_miembro:
+            self._agregar_simbolo({
+                "identificador": nombre.valor,
+                "categoria": "función",
+                "tipo_dato": tipo_retorno or "void",
+                "ambito": "global",
+                "direccion_memoria": None,
+                "linea": nombre.linea,
+                "valor": None,
+                "estado": "declarado",
+                "estructura": None,
+                "referencias": 0
+            })
+
+        nodo_tipo = Nodo("TipoRetorno", valor=tipo_retorno or "void")
+        nodo_params = Nodo("Params", hijos=params)
+        tipo_nodo = "FuncionOverride" if con_override else "FuncionDeclarada"
+        return Nodo(tipo_nodo, valor=(nombre.valor if nombre else None), hijos=[nodo_tipo, nodo_params] + cuerpo)
+
+    def declaracion_modelo(self):
+        self.comparar("Reservada", "model")
+        nombre = self.comparar("Identificador")
+
+        parent = None
+        if self.actual() and self.actual().tipo == "Reservada" and self.actual().valor == "extends":
+            self.comparar("Reservada", "extends")
+            parent = self.comparar("Identificador")
+
+        self.comparar("LlaveIzq")
+        miembros = []
+
+        while self.actual() and self.actual().tipo != "LlaveDer":
+            token = self.actual()
+
+            es_override = False
+            if token.tipo == "Reservada" and token.valor == "override":
+                self.comparar("Reservada", "override")
+                es_override = True
+                token = self.actual()
+
+            if token.tipo == "Reservada":
+                if token.valor in self.funciones_io:
+                    miembros.append((yield self.llamada_funcion_io()))
+                elif token.valor in self.primarios:
+                    next_token = self.siguiente()
+                    next_next = self.siguiente(2)
+                    if next_token and next_token.tipo == "Identificador" and next_next and next_next.tipo == "ParentIzq":
+                        miembros.append((yield self.declaracion_funcion(es_miembro=True, con_override=es_override)))
+                    else:
+                        miembros.append((yield self.declaracion_variable()))
+                elif token.valor == "function":
+                    miembros.append((yield self.declaracion_funcion(es_miembro=True, con_override=es_override)))
+                elif token.valor in self.modificadores:
+                    miembros.append((yield self.declaracion_variable()))
+                else:
+                    self.error(f"Miembro inesperado en modelo: '{token.valor}'")
+                    self.avanzar()
+            elif token.tipo == "Identificador":
+                miembros.append((yield self.declaracion_variable()))
+            elif token.tipo.startswith("Comentario"):
+                self.avanzar()
+            else:
+                self.error(f"Miembro inesperado en modelo: '{token.valor}'")
+                self.avanzar()
+
+        self.comparar("LlaveDer")
+
+        ast_hijos = []
+        if parent:
+            ast_hijos.append(Nodo("Extends", valor=(parent.valor if parent else None)))
+        ast_hijos += miembros
+
+        if nombre:
+            self._agregar_simbolo({
+                "identificador": nombre.valor,
+                "categoria": "modelo",
+                "tipo_dato": None,
+                "ambito": "global",
+                "direccion_memoria": None,
+                "linea": nombre.linea,
+                "valor": None,
+                "estado": "declarado",
+                "estructura": miembros,
+                "referencias": 0
+            })
+
+        return Nodo("Modelo", valor=(nombre.valor if nombre else None), hijos=ast_hijos)
+
+    def declaracion_variable(self, in_paren=False):
+        modifiers = []
+        while self.actual() and self.actual().tipo == "Reservada" and self.actual().valor in self.modificadores:
+            modifiers.append(self.comparar("Reservada").valor)
+
+        tipo_token = self.tipo_dato()
+
+        if not tipo_token:
+            self.error("Tipo de dato esperado")
+            return None
+
+        name = self.comparar("Identificador")
+
+        es_array = False
+        if self.actual() and self.actual().tipo == "CorcheteIzq":
+            self.comparar("CorcheteIzq")
+            self.comparar("CorcheteDer")
+            es_array = True
+            tipo_token += "[]"
+
+        valor_node = None
+        if self.actual() and self.actual().tipo == "Asignacion":
+            self.comparar("Asignacion")
+            if self.actual() and self.actual().tipo == "LlaveIzq":
+                valor_node = yield self.valor_lista()
+            else:
+                valor_node = yield self.expresion()
+
+        if self.actual() and self.actual().tipo == "PuntoComa":
+            self.avanzar()
+        elif not in_paren:
+            self.error("Se esperaba ';' al final de la declaración.")
+
+        return self._nodo_declaracion_variable(modifiers, tipo_token, name, es_array, valor_node)
+
+    def valor_lista(self):
+        self.comparar("LlaveIzq")
+        vals = []
+
+        while self.actual() and self.actual().tipo != "LlaveDer":
+            first = yield self.expresion()
+
+            if self.actual() and self.actual().tipo == "DosPuntos":
+                self.comparar("DosPuntos")
+                second = yield self.expresion()
+                vals.append(Nodo("ParClaveValor", hijos=[first, second]))
+            else:
+                vals.append(first)
+
+            if self.actual() and self.actual().tipo == "Coma":
+                self.avanzar()
+            else:
+                break
+
+        self.comparar("LlaveDer")
+        return Nodo("Lista", hijos=vals)
+
+    def asignacion(self):
+        ident = self.comparar("Identificador")
+
+        if self.actual() and self.actual().tipo in ("Asignacion", "AsignacionCompuesta"):
+            operador = self.actual()
+            self.avanzar()
+        else:
+            self.error("Se esperaba operador de asignación ('=', '+=', '-=', '*=', '/=')")
+            return None
+
+        expr = yield self.expresion()
+
+        if self.actual() and self.actual().tipo == "PuntoComa":
+            self.avanzar()
+
+        return self._nodo_asignacion(ident, operador, expr)
+
+    def expresion(self):
+        return (yield self.expresion_pratt())
+
+    def condicion(self):
+        return (yield self.expresion())
+
+    def expresion_pratt(self, minimo=1):
+        izquierda = yield self.factor()
+        while True:
+            token = self.actual()
+            if token is None:
+                return izquierda
+            operador = OPERADORES_BINARIOS.get((token.tipo, token.valor))
+            if operador is None or operador[0] < minimo:
+                return izquierda
+            self.avanzar()
+            derecha = yield self.expresion_pratt(operador[0] + 1)
+            izquierda = Nodo(operador[1], valor=token.valor, hijos=[izquierda, derecha])
+
+    def factor(self):
+        token = self.actual()
+        if not token:
+            return Nodo("ErrorExpresion", valor="EOF")
+
+        if token.tipo == "Numero":
+            self.avanzar()
+            return Nodo("Numero", valor=token.valor)
+
+        if token.tipo == "Cadena":
+            self.avanzar()
+            return Nodo("Cadena", valor=token.valor)
+
+        if token.tipo == "CadenaNoTerminada":
+            self.error_no_terminado(token)
+            self.avanzar()
+            return Nodo("ErrorExpresion", valor='"')
+
+        if token.tipo == "Reservada" and token.valor in ("true", "false", "1", "0"):
+            self.avanzar()
+            return Nodo("Booleano", valor=token.valor)
+
+        if token.tipo == "Reservada" and token.valor in self.funciones_io:
+            nombre_funcion = self.comparar("Reservada")
+            self.comparar("ParentIzq")
+            args = yield self._argumentos()
+            self.comparar("ParentDer")
+            return Nodo("LlamadaFuncionIO", valor=nombre_funcion.valor, hijos=args)
+
+        if token.tipo == "Identificador":
+            self.avanzar()
+
+            if self.actual() and self.actual().tipo == "ParentIzq":
+                self.comparar("ParentIzq")
+                args = yield self._argumentos()
+                self.comparar("ParentDer")
+                return Nodo("LlamadaFuncion", valor=token.valor, hijos=args)
+
+            if self.actual() and self.actual().tipo == "CorcheteIzq":
+                self.comparar("CorcheteIzq")
+                indice = yield self.expresion()
+                self.comparar("CorcheteDer")
+                return Nodo("AccesoIndice", valor=token.valor, hijos=[indice])
+
+            if self.actual() and self.actual().tipo == "Incrementador":
+                op = self.comparar("Incrementador")
+                return Nodo("IncrementoPostfijo", valor=f"{token.valor}{op.valor}")
+
+            return Nodo("Identificador", valor=token.valor)
+
+        if token.tipo == "ParentIzq":
+            self.comparar("ParentIzq")
+            n = yield self.expresion()
+            self.comparar("ParentDer")
+            return n
+
+        if token.tipo == "LlaveIzq":
+            return (yield self.valor_lista())
+
+        if token.tipo == "Reservada" and token.valor == "function":
+            return (yield self.funcion_anonima())
+
+        if token.tipo == "Logico" and token.valor == "!":
+            self.avanzar()
+            operando = yield self.factor()
+            return Nodo("OperacionLogica", valor="!", hijos=[operando])
+
+        if token.tipo == "Reservada" and token.valor in ("not", "NOT"):
+            self.avanzar()
+            operando = yield self.factor()
+            return Nodo("OperacionLogica", valor="not", hijos=[operando])
+
+        if token.tipo == "Aritmetico" and token.valor in ("+", "-"):
+            op = token.valor
+            self.avanzar()
+            operando = yield self.factor()
+            return Nodo("OperacionUnaria", valor=op, hijos=[operando])
+
+        self.error(f"Expresión no válida cerca de '{token.valor}'")
+        self.avanzar()
+        return Nodo("ErrorExpresion", valor=token.valor)
+
+    def funcion_anonima(self):
+        self.comparar("Reservada", "function")
+        self.comparar("ParentIzq")
+        params = self.parse_params()
+        self.comparar("ParentDer")
+        self.comparar("LlaveIzq")
+        cuerpo = yield self._bloque()
+        self.comparar("LlaveDer")
+        return Nodo("FuncionAnonima", hijos=[Nodo("Params", hijos=params)] + cuerpo)
+
+    def instruccion_return(self):
+        self.comparar("Reservada", "return")
+        expr = None
+        if self.actual() and self.actual().tipo != "PuntoComa":
+            expr = yield self.expresion()
+        if self.actual() and self.actual().tipo == "PuntoComa":
+            self.comparar("PuntoComa")
+        return Nodo("Return", hijos=[expr] if expr else [])
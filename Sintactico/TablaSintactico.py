@@ -1,158 +1,257 @@
-import json
-import os
-import tempfile
-import atexit
+import sys
+from collections import OrderedDict
+
+from Objetos.Bitacora import Bitacora
+from Objetos.Nodo import Nodo
+from Sintactico.AlmacenSimbolos import ALMACENES, CAMPOS_CONSULTA, claves_simbolo, devolver_almacen, tomar_almacen
+
+bitacora = Bitacora("TablaSimbolos")
+
+# Símbolos que `iterar` toma juntos (los que están en el archivo se leen en una sola pasada)
+LOTE_ITERACION = 512
 
 class TablaSimbolos:
-    def __init__(self, limite_memoria_bytes=100):
-        self.simbolos = []  # Símbolos en memoria
+    def __init__(self, limite_memoria_bytes=4096, almacen="archivo"):
+        # Cada símbolo tiene un número fijo; `_orden` guarda los números en el orden de `listar`
+        self._orden = []
+        self._posiciones = None  # número -> posición en `_orden`, se arma al consultar
+        self._siguiente = 0
+        self.simbolos = OrderedDict()  # Símbolos en memoria: número -> símbolo, del menos al más recién usado
+        self._tamanos = {}  # número -> tamaño en bytes de los símbolos en memoria
+        self._en_memoria = {}  # clave (ver `claves_simbolo`) -> {número: símbolo} en memoria con esa clave
         self.limite_memoria = limite_memoria_bytes
         self.memoria_actual = 0
         
-        # Crear archivo temporal para almacenamiento auxiliar
-        self.archivo_temp = tempfile.NamedTemporaryFile(
-            mode='w+', 
-            delete=False, 
-            suffix='.json',
-            prefix='tabla_simbolos_'
-        )
-        self.ruta_archivo = self.archivo_temp.name
-        self.simbolos_en_archivo = 0
+        # Contadores de uso: búsquedas resueltas en memoria, búsquedas que fueron
+        # al almacén, símbolos que se bajaron al almacén y que se volvieron a subir
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.promociones = 0
         
-        # Inicializar archivo vacío
-        self._limpiar_archivo()
-        
-        # Registrar limpieza al finalizar el programa
-        atexit.register(self._cleanup)
-        
-        print(f"[TablaSimbolos] Inicializada con límite de {limite_memoria_bytes} bytes")
-        print(f"[TablaSimbolos] Archivo temporal: {self.ruta_archivo}")
+        # Almacenamiento auxiliar para los símbolos que no caben en memoria: un
+        # archivo temporal de solo agregado ("archivo") o una base SQLite ("sqlite").
+        # Se toma del grupo de almacenes libres recién cuando hace falta bajar símbolos.
+        if almacen not in ALMACENES:
+            raise ValueError(f"Almacén de símbolos desconocido: {almacen!r} (opciones: {', '.join(ALMACENES)})")
+        self.tipo_almacen = almacen
+        self.almacen = None
+        self.ruta_archivo = None
+
+    @property
+    def simbolos_en_archivo(self):
+        return len(self.almacen) if self.almacen is not None else 0
+
+    def _abrir_almacen(self):
+        if self.almacen is None:
+            self.almacen = tomar_almacen(self.tipo_almacen)
+            self.ruta_archivo = self.almacen.ruta
+            bitacora.depuracion("archivo.abierto", "Archivo temporal: {ruta}", ruta=self.ruta_archivo)
+        return self.almacen
 
     def _limpiar_archivo(self):
-        """Limpia el contenido del archivo temporal"""
-        self.archivo_temp.seek(0)
-        self.archivo_temp.truncate()
-        json.dump([], self.archivo_temp)
-        self.archivo_temp.flush()
-        self.simbolos_en_archivo = 0
-
-    def _cleanup(self):
-        """Elimina el archivo temporal al finalizar"""
+        """Limpia el contenido del archivo temporal (los símbolos que estaban ahí se pierden)"""
+        if self.almacen is None:
+            return
+        self.almacen.limpiar()
+        self._orden = [n for n in self._orden if n in self.simbolos]
+        self._posiciones = None
+
+    def cerrar(self):
+        """Devuelve el archivo temporal al grupo de libres (o lo elimina si ya hay suficientes).
+
+        Los símbolos que estaban en el archivo se pierden; si la tabla se sigue
+        usando toma otro archivo cuando lo necesite.
+        """
+        almacen = getattr(self, "almacen", None)
+        if almacen is None:
+            return
         try:
-            self.archivo_temp.close()
-            if os.path.exists(self.ruta_archivo):
-                os.unlink(self.ruta_archivo)
-                print(f"[TablaSimbolos] Archivo temporal eliminado: {self.ruta_archivo}")
+            self._orden = [n for n in self._orden if n in self.simbolos]
+            self._posiciones = None
+            self.almacen = None
+            if devolver_almacen(almacen):
+                bitacora.depuracion("archivo.eliminado", "Archivo temporal eliminado: {ruta}", ruta=self.ruta_archivo)
         except Exception as e:
-            print(f"[TablaSimbolos] Error al eliminar archivo temporal: {e}")
+            bitacora.error("archivo.error", "Error al liberar archivo temporal: {error}", error=str(e))
 
     def agregar(self, simbolo):
-        """Agrega un símbolo a la tabla, moviéndolo a archivo si es necesario"""
+        """Agrega un símbolo a la tabla, bajando al archivo los menos usados si es necesario"""
         try:
-            tamano = self.calcular_tamano(simbolo)
-            
-            # Si agregar este símbolo excede el límite, mover símbolos antiguos al archivo
-            if self.memoria_actual + tamano > self.limite_memoria:
-                self._mover_a_archivo()
-            
-            # Agregar símbolo a memoria
-            self.simbolos.append(simbolo)
-            self.memoria_actual += tamano
+            numero = self._siguiente
+            self._siguiente += 1
+            self._orden.append(numero)
+            if self._posiciones is not None:
+                self._posiciones[numero] = len(self._orden) - 1
+            self._subir(numero, simbolo)
             
             # print(f"[TablaSimbolos] Símbolo agregado: {simbolo.get('identificador')} ({tamano} bytes)")
             # print(f"[TablaSimbolos] Memoria: {self.memoria_actual}/{self.limite_memoria} bytes")
             
         except Exception as e:
-            print(f"[TablaSimbolos] Error al agregar símbolo: {e} -> {simbolo}")
+            bitacora.error("agregar.error", "Error al agregar símbolo: {error} -> {simbolo}", error=str(e), simbolo=simbolo)
+
+    def _subir(self, numero, simbolo):
+        """Pone un símbolo en memoria como el más recién usado, desalojando otros si no cabe"""
+        tamano = self.calcular_tamano(simbolo)
+        if self.memoria_actual + tamano > self.limite_memoria:
+            self._mover_a_archivo(tamano)
+        self.simbolos[numero] = simbolo
+        self._tamanos[numero] = tamano
+        for clave in claves_simbolo(simbolo):
+            self._en_memoria.setdefault(clave, {})[numero] = simbolo
+        self.memoria_actual += tamano
 
-    def _mover_a_archivo(self):
-        """Mueve los símbolos más antiguos de memoria al archivo temporal"""
+    def _quitar_de_memoria(self, numero):
+        simbolo = self.simbolos.pop(numero)
+        self.memoria_actual -= self._tamanos.pop(numero)
+        for clave in claves_simbolo(simbolo):
+            en_memoria = self._en_memoria[clave]
+            del en_memoria[numero]
+            if not en_memoria:
+                del self._en_memoria[clave]
+        return simbolo
+
+    def _mover_a_archivo(self, espacio=0):
+        """Baja al archivo los símbolos menos recién usados hasta que quepan `espacio` bytes más"""
         if not self.simbolos:
             return
         
-        # Calcular cuántos símbolos mover (mover la mitad de los símbolos actuales)
-        cantidad_mover = max(1, len(self.simbolos) // 2)
-        simbolos_a_mover = self.simbolos[:cantidad_mover]
-        self.simbolos = self.simbolos[cantidad_mover:]
-        
-        # Leer símbolos existentes del archivo
-        try:
-            with open(self.ruta_archivo, 'r') as f:
-                simbolos_archivo = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            simbolos_archivo = []
-        
-        # Agregar nuevos símbolos al archivo
-        simbolos_archivo.extend(simbolos_a_mover)
-        
-        # Escribir de vuelta al archivo
-        with open(self.ruta_archivo, 'w') as f:
-            json.dump(simbolos_archivo, f, indent=2)
+        desalojados = []
+        while self.simbolos and self.memoria_actual + espacio > self.limite_memoria:
+            numero = next(iter(self.simbolos))
+            desalojados.append((numero, self._quitar_de_memoria(numero)))
+        self._abrir_almacen().agregar(desalojados)
+        self.desalojos += len(desalojados)
         
-        # Actualizar contadores
-        self.simbolos_en_archivo = len(simbolos_archivo)
-        self.memoria_actual = sum(self.calcular_tamano(s) for s in self.simbolos)
-        
-        print(f"[TablaSimbolos] Movidos {cantidad_mover} símbolos al archivo")
-        print(f"[TablaSimbolos] En memoria: {len(self.simbolos)} | En archivo: {self.simbolos_en_archivo}")
+        bitacora.depuracion("desalojo", "Movidos {movidos} símbolos al archivo | En memoria: {en_memoria} | En archivo: {en_archivo}",
+                            movidos=len(desalojados), en_memoria=len(self.simbolos), en_archivo=self.simbolos_en_archivo)
 
     def calcular_tamano(self, simbolo):
-        """Calcula el tamaño aproximado de un símbolo en bytes"""
-        ident = simbolo.get("identificador") if simbolo else None
-        if not ident or not isinstance(ident, str):
-            ident = "<anonimo>"
-        
-        # Tamaño base: identificador + overhead de otros campos
-        tamano_base = len(ident) + 10
-        
-        # Agregar tamaño de tipo_dato si existe
-        tipo_dato = simbolo.get("tipo_dato")
-        if tipo_dato and isinstance(tipo_dato, str):
-            tamano_base += len(tipo_dato)
-        
-        return tamano_base
+        """Calcula el tamaño en bytes de un símbolo con `sys.getsizeof`: el diccionario, sus valores y los Nodo de su estructura"""
+        tamano = sys.getsizeof(simbolo)
+        pendientes = list(simbolo.values())
+        while pendientes:
+            valor = pendientes.pop()
+            tamano += sys.getsizeof(valor)
+            if isinstance(valor, Nodo):
+                tamano += sys.getsizeof(valor.valor) + sys.getsizeof(valor.hijos)
+                pendientes.extend(valor.hijos)
+            elif isinstance(valor, (list, tuple)):
+                pendientes.extend(valor)
+            elif isinstance(valor, dict):
+                pendientes.extend(valor.values())
+        return tamano
 
     def verificar_memoria(self):
         """Verifica si se ha excedido el límite de memoria"""
         if self.memoria_actual > self.limite_memoria:
-            print(f"[TablaSimbolos] ⚠️  Límite de memoria excedido: {self.memoria_actual}/{self.limite_memoria} bytes")
+            bitacora.advertencia("memoria.excedida", "⚠️  Límite de memoria excedido: {memoria}/{limite} bytes",
+                                 memoria=self.memoria_actual, limite=self.limite_memoria)
             return False
         return True
 
     def listar(self):
-        """Retorna todos los símbolos (memoria + archivo)"""
-        simbolos_totales = list(self.simbolos)
+        """Retorna todos los símbolos (memoria + archivo) en el orden en que se agregaron"""
+        return list(self.iterar())
+
+    def iterar(self):
+        """Itera todos los símbolos (memoria + archivo) en el orden de `listar` sin armar la lista.
+
+        Los símbolos se toman por lotes de LOTE_ITERACION y los del archivo se
+        leen lote a lote, así que además de la tabla solo se tiene en memoria un
+        lote. La tabla no debe reemplazar símbolos mientras se itera.
+        """
+        for inicio in range(0, len(self._orden), LOTE_ITERACION):
+            lote = self._orden[inicio:inicio + LOTE_ITERACION]
+            en_archivo = [numero for numero in lote if numero not in self.simbolos]
+            leidos = {}
+            if en_archivo:
+                try:
+                    leidos = self.almacen.leer_varios(en_archivo)
+                except Exception as e:
+                    bitacora.error("leer.error", "Error al leer archivo: {error}", error=str(e))
+            simbolos = [self.simbolos[numero] if numero in self.simbolos else leidos.get(numero) for numero in lote]
+            for simbolo in simbolos:
+                if simbolo is not None:
+                    yield simbolo
+
+    def buscar(self, identificador, ambito=None):
+        """Busca un símbolo por identificador (y ámbito, si se indica) en memoria y archivo.
+
+        Un símbolo encontrado en el archivo vuelve a memoria como el más recién
+        usado.
+        """
+        clave = identificador if ambito is None else (identificador, ambito)
+
+        # Buscar en memoria primero
+        en_memoria = self._en_memoria.get(clave)
+        if en_memoria:
+            self.aciertos += 1
+            numero, simbolo = next(iter(en_memoria.items()))
+            self.simbolos.move_to_end(numero)
+            return simbolo
         
-        # Agregar símbolos del archivo si existen
+        # Buscar en archivo si no está en memoria: por índice, leyendo un solo registro
+        self.fallos += 1
         if self.simbolos_en_archivo > 0:
             try:
-                with open(self.ruta_archivo, 'r') as f:
-                    simbolos_archivo = json.load(f)
-                    simbolos_totales = simbolos_archivo + simbolos_totales
+                encontrado = self.almacen.buscar(clave)
+                if encontrado is not None:
+                    numero, simbolo = encontrado
+                    self.almacen.quitar([numero])
+                    self._subir(numero, simbolo)
+                    self.promociones += 1
+                    return simbolo
             except Exception as e:
-                print(f"[TablaSimbolos] Error al leer archivo: {e}")
+                bitacora.error("buscar.error", "Error al buscar en archivo: {error}", error=str(e))
         
-        return simbolos_totales
+        return None
 
-    def buscar(self, identificador):
-        """Busca un símbolo por identificador en memoria y archivo"""
-        # Buscar en memoria primero
-        for simbolo in self.simbolos:
-            if simbolo.get("identificador") == identificador:
-                return simbolo
-        
-        # Buscar en archivo si no está en memoria
+    def consultar(self, **campos):
+        """Retorna, en el orden de `listar`, los símbolos cuyos campos tienen esos valores.
+
+        Los campos posibles son identificador, categoria, ambito y linea; en el
+        almacén SQLite la consulta usa sus índices.
+        """
+        desconocidos = set(campos) - set(CAMPOS_CONSULTA)
+        if desconocidos:
+            raise ValueError(f"Campos de consulta desconocidos: {', '.join(sorted(desconocidos))}")
+        encontrados = []
         if self.simbolos_en_archivo > 0:
             try:
-                with open(self.ruta_archivo, 'r') as f:
-                    simbolos_archivo = json.load(f)
-                    for simbolo in simbolos_archivo:
-                        if simbolo.get("identificador") == identificador:
-                            return simbolo
+                encontrados = list(self.almacen.consultar(campos))
             except Exception as e:
-                print(f"[TablaSimbolos] Error al buscar en archivo: {e}")
-        
-        return None
+                bitacora.error("consultar.error", "Error al consultar archivo: {error}", error=str(e))
+        encontrados.extend((n, s) for n, s in self.simbolos.items()
+                           if all(s.get(k) == v for k, v in campos.items()))
+        if self._posiciones is None:
+            self._posiciones = {numero: i for i, numero in enumerate(self._orden)}
+        encontrados.sort(key=lambda par: self._posiciones[par[0]])
+        return [simbolo for _, simbolo in encontrados]
+
+    def reemplazar(self, inicio, cantidad, nuevos):
+        """Reemplaza `cantidad` símbolos desde la posición `inicio` (en el orden de `listar`) por `nuevos`"""
+        try:
+            fin = inicio + cantidad
+            en_archivo = []
+            for numero in self._orden[inicio:fin]:
+                if numero in self.simbolos:
+                    self._quitar_de_memoria(numero)
+                else:
+                    en_archivo.append(numero)
+            if en_archivo:
+                self.almacen.quitar(en_archivo)
+
+            numeros = list(range(self._siguiente, self._siguiente + len(nuevos)))
+            self._siguiente += len(nuevos)
+            self._orden[inicio:fin] = numeros
+            self._posiciones = None
+            for numero, simbolo in zip(numeros, nuevos):
+                self._subir(numero, simbolo)
+
+        except Exception as e:
+            bitacora.error("reemplazar.error", "Error al reemplazar símbolos: {error}", error=str(e))
 
     def obtener_estadisticas(self):
         """Retorna estadísticas de uso de memoria"""
@@ -162,25 +261,31 @@ class TablaSimbolos:
             "porcentaje_uso": (self.memoria_actual / self.limite_memoria * 100) if self.limite_memoria > 0 else 0,
             "simbolos_en_memoria": len(self.simbolos),
             "simbolos_en_archivo": self.simbolos_en_archivo,
+            "registros_muertos": self.almacen.registros_muertos if self.almacen is not None else 0,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": (self.aciertos / (self.aciertos + self.fallos) * 100) if self.aciertos + self.fallos > 0 else 0,
+            "desalojos": self.desalojos,
+            "promociones": self.promociones,
             "total_simbolos": len(self.simbolos) + self.simbolos_en_archivo,
             "archivo_temporal": self.ruta_archivo
         }
 
     def imprimir_estadisticas(self):
-        """Imprime estadísticas de uso de memoria"""
+        """Imprime (en la bitácora, nivel INFO) las estadísticas de uso de memoria"""
         stats = self.obtener_estadisticas()
-        print("\n" + "="*60)
-        print("ESTADÍSTICAS DE TABLA DE SÍMBOLOS")
-        print("="*60)
-        print(f"Memoria usada:        {stats['memoria_usada']}/{stats['limite_memoria']} bytes ({stats['porcentaje_uso']:.1f}%)")
-        print(f"Símbolos en memoria:  {stats['simbolos_en_memoria']}")
-        print(f"Símbolos en archivo:  {stats['simbolos_en_archivo']}")
-        print(f"Total de símbolos:    {stats['total_simbolos']}")
-        print(f"Archivo temporal:     {stats['archivo_temporal']}")
-        print("="*60 + "\n")
+        texto = "\n".join([
+            "Estadísticas de tabla de símbolos",
+            f"Memoria usada:        {stats['memoria_usada']}/{stats['limite_memoria']} bytes ({stats['porcentaje_uso']:.1f}%)",
+            f"Símbolos en memoria:  {stats['simbolos_en_memoria']}",
+            f"Símbolos en archivo:  {stats['simbolos_en_archivo']}",
+            f"Total de símbolos:    {stats['total_simbolos']}",
+            f"Búsquedas:            {stats['aciertos']} en memoria, {stats['fallos']} al archivo ({stats['tasa_aciertos']:.1f}% aciertos)",
+            f"Desalojos/promociones: {stats['desalojos']}/{stats['promociones']}",
+            f"Archivo temporal:     {stats['archivo_temporal']}",
+        ])
+        bitacora.info("estadisticas", "{texto}", texto=texto, **stats)
 
     def __del__(self):
         """Limpieza al destruir el objeto"""
-        self._cleanup()
-
-
+        self.cerrar()